@@ -0,0 +1,20 @@
+"""
+Advent of Code 2024 runner.
+
+Loads every dayN/P/answer.py solver into one interpreter and runs any
+subset of them against any input file. Each solver module exposes two
+hooks used by the runner:
+
+    parse(path)   -> parsed puzzle input
+    answer(data)  -> puzzle answer for the parsed input
+
+Run `python -m aoc2024 --help` from the repository root for usage, or
+call solve(day, part, source) to answer a puzzle from a path or text.
+"""
+
+from .api import solve
+from .registry import Solver, discover, load, select
+from .runner import Result, run, run_day, run_many
+
+__all__ = ['Result', 'Solver', 'discover', 'load', 'run', 'run_day', 'run_many', 'select',
+           'solve']
@@ -0,0 +1,58 @@
+"""
+Answer puzzles from Python without going through the runner:
+
+    from pathlib import Path
+    from aoc2024 import solve
+
+    solve(1, 2, Path('day1/2/input.txt'))
+    solve(1, 2, '3   4\n4   3\n', engine='fast')
+
+A source is a path (any os.PathLike, such as pathlib.Path) or the puzzle
+input itself as str or bytes; a plain str is always input text, never a
+path. Nothing depends on the working directory.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+from .registry import Solver, discover, hooks, select
+
+
+@lru_cache(maxsize=None)
+def solver(day: int, part: int) -> Solver:
+    """The reference solver for one puzzle part."""
+    return select(discover(), [f'{day}/{part}'])[0]
+
+
+@contextmanager
+def as_path(source) -> Iterator[Path]:
+    """Yield a path holding source, spooling text to a temporary file."""
+    if isinstance(source, os.PathLike):
+        yield Path(source)
+        return
+    data = source.encode('us-ascii') if isinstance(source, str) else bytes(source)
+    fd, name = tempfile.mkstemp(prefix='aoc2024-', suffix='.txt')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        yield Path(name)
+    finally:
+        os.unlink(name)
+
+
+def solve(day: int, part: int, source, engine: str = 'reference') -> Any:
+    """
+    Answer for one puzzle part from a path, str or bytes. The fast engines
+    parse text in memory; the reference solvers only read files, so text
+    given to them goes through a temporary file.
+    """
+    engine, parse, answer = hooks(solver(day, part), engine)
+    if engine == 'fast':
+        return answer(parse(source))
+    with as_path(source) as path:
+        data = parse(path)
+    return answer(data)
@@ -0,0 +1,136 @@
+"""
+Solve one day for many inputs in a single process.
+
+    python -m aoc2024.batch 11 inputs/          # every file in a directory
+    python -m aoc2024.batch 5 a.txt b.txt -p 2 --json
+    python -m aoc2024.batch 14 inputs/ -j 8
+
+Inputs share the fast engines' process-wide caches: day 11's stone
+expansions, day 5's parsed rule sets, day 14's robot orbits, ... Days
+that define batch_part1/batch_part2 use those variants, which are slower
+for one input but amortise across many. With -j, inputs are spread over
+worker processes that each keep their own caches for the whole batch.
+Results are yielded as each input finishes.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from .api import as_path
+from .registry import ENGINES, discover, fast_engine, hooks, select
+
+
+@dataclass
+class BatchResult:
+    """Answers for every requested part of one input."""
+    input: str
+    answers: dict[int, Any] = field(default_factory=dict)
+    parse_seconds: float = 0.0
+    solve_seconds: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def expand(paths: Iterable) -> list[Path]:
+    """Files named by paths, with each directory replaced by its files in order."""
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(p for p in path.iterdir() if p.is_file()) if path.is_dir() else [path])
+    return files
+
+
+def _name(source, index: int) -> str:
+    return str(source) if isinstance(source, os.PathLike) else f'<text {index}>'
+
+
+def solve_one(day: int, source, parts=(1, 2), engine: str = 'fast',
+              name: Optional[str] = None) -> BatchResult:
+    """Answer the given parts of one day for one source (path, str or bytes)."""
+    result = BatchResult(name or _name(source, 0))
+    module = fast_engine(day) if engine == 'fast' else None
+    try:
+        if module is not None:
+            start = time.perf_counter()
+            data = module.parse(source)
+            result.parse_seconds = time.perf_counter() - start
+            for part in parts:
+                solve = getattr(module, f'batch_part{part}', None) or getattr(module, f'part{part}')
+                start = time.perf_counter()
+                result.answers[part] = solve(data)
+                result.solve_seconds += time.perf_counter() - start
+        else:
+            solvers = select(discover(), [f'{day}/{part}' for part in parts])
+            with as_path(source) as path:
+                for solver in solvers:
+                    _, parse, answer = hooks(solver, 'reference')
+                    start = time.perf_counter()
+                    data = parse(path)
+                    result.parse_seconds += time.perf_counter() - start
+                    start = time.perf_counter()
+                    result.answers[solver.part] = answer(data)
+                    result.solve_seconds += time.perf_counter() - start
+    except Exception as e:
+        result.error = f'{type(e).__name__}: {e}'
+    return result
+
+
+def solve_many(day: int, sources: Iterable, parts=(1, 2), engine: str = 'fast',
+               workers: Optional[int] = None) -> Iterator[BatchResult]:
+    """
+    Yield a BatchResult per source as it finishes: in order in this
+    process, or in completion order across `workers` processes.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f'unknown engine {engine!r}')
+    sources = list(sources)
+    if not workers:
+        for i, source in enumerate(sources):
+            yield solve_one(day, source, parts, engine, _name(source, i))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve_one, day, source, parts, engine, _name(source, i))
+                   for i, source in enumerate(sources)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.batch',
+                                     description='Solve one day for many inputs in one process.')
+    parser.add_argument('day', type=int)
+    parser.add_argument('inputs', nargs='+', help='input files or directories of them')
+    parser.add_argument('-p', '--part', type=int, choices=(1, 2), action='append',
+                        help='part to solve (repeatable; default both)')
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='fast')
+    parser.add_argument('-j', '--jobs', type=int, metavar='N',
+                        help='spread inputs over N worker processes (0 = one per CPU)')
+    parser.add_argument('--json', action='store_true', help='print one JSON object per input')
+    args = parser.parse_args(argv)
+
+    parts = tuple(sorted(set(args.part))) if args.part else (1, 2)
+    workers = (args.jobs or os.cpu_count()) if args.jobs is not None else None
+    start = time.perf_counter()
+    count = errors = 0
+    for result in solve_many(args.day, expand(args.inputs), parts, args.engine, workers):
+        count += 1
+        errors += bool(result.error)
+        if args.json:
+            print(json.dumps(result.to_dict(), default=str), flush=True)
+        else:
+            answers = result.error or '  '.join(f'{p}: {a}' for p, a in result.answers.items())
+            print(f'{result.input}  {answers}', flush=True)
+    print(f'{count} inputs, {errors} errors in {time.perf_counter() - start:.2f}s', file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
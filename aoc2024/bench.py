@@ -0,0 +1,140 @@
+"""
+Benchmark solvers across a ladder of generated input sizes.
+
+    python -m aoc2024.bench                     # every solver, default ladders
+    python -m aoc2024.bench 9/1 6/2 --budget 30
+    python -m aoc2024.bench 1 --sizes 1000 1000000
+
+Inputs come from aoc2024.generate and are kept under .aoc2024/inputs so
+later runs reuse them. A solver stops climbing its ladder once one size
+takes longer than the time budget, which is what exposes the solvers that
+blow up. Results are written as JSON.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+from .generate import write_input
+from .registry import ENGINES, WORK_DIR, discover, select
+from .runner import run
+
+LADDERS = {
+    1: [1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+    2: [1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+    3: [10_000, 100_000, 1_000_000, 10_000_000],
+    4: [100, 300, 1_000, 3_000, 5_000],
+    5: [100, 1_000, 10_000, 100_000],
+    6: [50, 100, 200, 400, 1_000],
+    7: [100, 1_000, 10_000, 100_000],
+    8: [50, 100, 200, 400, 1_000],
+    9: [1_000, 10_000, 100_000, 1_000_000],
+    10: [100, 300, 1_000, 3_000, 5_000],
+    11: [10, 100, 1_000, 10_000],
+    12: [100, 300, 1_000, 3_000, 5_000],
+    13: [100, 1_000, 10_000, 100_000],
+    14: [1_000, 10_000, 100_000, 1_000_000],
+}
+
+
+def bench_solver(solver, sizes, seed=0, repeat=1, budget=10.0,
+                 input_dir=WORK_DIR / 'inputs', engine='reference', parse_cache=False,
+                 trace_memory=False, make_input=None):
+    """
+    Run one solver over increasing sizes and return one record per size.
+    Parse and solve times are the best of `repeat` runs. With trace_memory
+    one extra traced run per size records peak_bytes, so tracing does not
+    slow the timed runs. make_input(size, seed, input_dir) replaces the
+    day's generator.
+    """
+    records = []
+    for size in sizes:
+        if make_input is None:
+            path = write_input(solver.day, size, seed, input_dir)
+        else:
+            path = make_input(size, seed, input_dir)
+        runs = []
+        for _ in range(repeat):
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                runs.append(run(solver, path, trace_memory=False, engine=engine,
+                                parse_cache=parse_cache))
+            if runs[-1].error:
+                break
+        best = min(runs, key=lambda r: r.parse_seconds + r.solve_seconds)
+        peak_bytes = None
+        if trace_memory and not best.error:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                peak_bytes = run(solver, path, trace_memory=True, engine=engine,
+                                 parse_cache=parse_cache).peak_bytes
+        records.append({
+            'day': solver.day,
+            'part': solver.part,
+            'engine': best.engine,
+            'size': size,
+            'seed': seed,
+            'input_bytes': path.stat().st_size,
+            'parse_seconds': best.parse_seconds,
+            'solve_seconds': best.solve_seconds,
+            'peak_bytes': peak_bytes,
+            'answer': best.answer,
+            'error': best.error,
+        })
+        if best.error or best.parse_seconds + best.solve_seconds > budget:
+            break
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.bench',
+                                     description='Time solvers across generated input sizes.')
+    parser.add_argument('solvers', nargs='*', metavar='DAY[/PART]')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        help='override the per-day size ladder')
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='reference')
+    parser.add_argument('--parse-cache', action='store_true',
+                        help='reload fast-engine parsed inputs from binary sidecars')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help='runs per size (best is kept)')
+    parser.add_argument('--budget', type=float, default=10.0,
+                        help='stop a solver\'s ladder after a run slower than this many seconds')
+    parser.add_argument('-o', '--output', help='JSON results file')
+    args = parser.parse_args(argv)
+
+    try:
+        solvers = select(discover(), args.solvers)
+    except ValueError as e:
+        print(f'aoc2024.bench: {e}', file=sys.stderr)
+        return 2
+
+    output = Path(args.output) if args.output else (
+        WORK_DIR / 'bench' / time.strftime('bench-%Y%m%d-%H%M%S.json'))
+    results = []
+    for solver in solvers:
+        sizes = args.sizes or LADDERS[solver.day]
+        for record in bench_solver(solver, sizes, args.seed, args.repeat, args.budget,
+                                   engine=args.engine, parse_cache=args.parse_cache):
+            results.append(record)
+            total = record['parse_seconds'] + record['solve_seconds']
+            status = record['error'] or f'{total * 1000:.1f}ms'
+            print(f'{solver.key:>5}  n={record["size"]:<10} {status}', flush=True)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'seed': args.seed,
+            'budget': args.budget,
+            'results': results,
+        }, f, indent=2, default=str)
+    print(f'results written to {output}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""
+Disk-backed answer cache.
+
+An answer is stored under the SHA-256 of (day, part, engine, input bytes,
+solver source), so editing either the input or the code that solves it
+misses the cache, while unchanged pairs are answered without importing
+or running the solver. Entries are small JSON files under
+.aoc2024/answers; once their total size passes the bound, the least
+recently used ones are evicted.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from .registry import WORK_DIR, Solver, file_digest, sources
+from .runner import Result
+
+CACHE_DIR = WORK_DIR / 'answers'
+MAX_BYTES = 1 << 20
+
+
+class AnswerCache:
+    """Answers keyed by input and solver source; see the module docstring."""
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def key(self, solver: Solver, input_path: Optional[Path],
+            engine: str) -> tuple[str, str, Path]:
+        """Return (cache key, engine used, input path)."""
+        engine, files = sources(solver, engine)
+        path = Path(input_path) if input_path else solver.default_input
+        h = hashlib.sha256(f'{solver.day}/{solver.part}:{engine}:'.encode())
+        h.update(file_digest(path).encode())
+        for source in files:
+            h.update(file_digest(source).encode())
+        return h.hexdigest(), engine, path
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def get(self, solver: Solver, input_path: Optional[Path] = None,
+            engine: str = 'reference') -> Optional[Result]:
+        """A cached Result for solver on input_path, or None."""
+        try:
+            key, engine, path = self.key(solver, input_path, engine)
+        except FileNotFoundError:
+            return None
+        entry = self._entry(key)
+        try:
+            with open(entry) as f:
+                answer = json.load(f)['answer']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+        os.utime(entry)
+        return Result(solver.day, solver.part, str(path), engine, answer, cached=True)
+
+    def put(self, solver: Solver, result: Result) -> None:
+        """Store a successful result and evict down to the size bound."""
+        if result.error or result.cached:
+            return
+        key, _, _ = self.key(solver, result.input, result.engine)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._entry(key).with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'day': result.day, 'part': result.part, 'engine': result.engine,
+                       'input': result.input, 'answer': result.answer}, f)
+        tmp.replace(self._entry(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        entries = []
+        for entry in self.directory.glob('*.json'):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for entry in self.directory.glob('*.json'):
+            entry.unlink(missing_ok=True)
@@ -0,0 +1,123 @@
+"""
+Checkpoints for the fast engines' long chunked searches.
+
+    python -m aoc2024 6/2 -e fast -i huge.txt --checkpoint 60
+
+With checkpointing on, the searches split by aoc2024.parallel (day 6
+candidates, day 7 equations, day 10 trailheads, day 14 timesteps) are cut
+into CHUNKS fixed chunks, and each finished chunk's result is written to
+.aoc2024/checkpoints at most every `interval` seconds, and again when the
+run is interrupted (including SIGTERM, which is turned into SystemExit).
+A rerun of the same solver on the same input and code skips the chunks
+already done. A run that completes removes its checkpoint.
+"""
+
+import contextlib
+import hashlib
+import json
+import signal
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .registry import PACKAGE_DIR, WORK_DIR, Solver, file_digest, sources
+
+CHECKPOINT_DIR = WORK_DIR / 'checkpoints'
+
+# Chunks per checkpointed search, whatever the number of workers
+CHUNKS = 64
+
+enabled = False
+interval = 30.0
+
+_current: ContextVar[Optional['Checkpoint']] = ContextVar('checkpoint', default=None)
+
+
+def _terminate(signum, frame):
+    sys.exit(128 + signum)
+
+
+def configure(every: Optional[float]) -> None:
+    """Checkpoint every `every` seconds (None turns checkpointing off)."""
+    global enabled, interval
+    enabled = every is not None
+    if enabled:
+        interval = every
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, _terminate)
+
+
+class Checkpoint:
+    """Finished chunk results of one solver run, keyed by search name."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            self.searches = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            self.searches = {}
+        self.saved_at = time.monotonic()
+        self.dirty = False
+
+    def done(self, name: str) -> dict[int, Any]:
+        """Results so far of search name, by chunk index."""
+        return {int(i): value for i, value in self.searches.get(name, {}).items()}
+
+    def put(self, name: str, index: int, value: Any) -> None:
+        self.searches.setdefault(name, {})[str(index)] = value
+        self.dirty = True
+        if time.monotonic() - self.saved_at >= interval:
+            self.save()
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.searches))
+        tmp.replace(self.path)
+        self.saved_at = time.monotonic()
+        self.dirty = False
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def checkpoint_path(solver: Solver, input_path, engine: str = 'fast') -> Path:
+    """Checkpoint file for solver on input_path with the current code."""
+    used, files = sources(solver, engine)
+    digest = hashlib.sha256(f'{solver.day}/{solver.part}/{used}'.encode())
+    for path in [input_path, *files, PACKAGE_DIR / 'checkpoint.py']:
+        digest.update(file_digest(path).encode())
+    return CHECKPOINT_DIR / f'day{solver.day:02d}-{solver.part}-{digest.hexdigest()[:16]}.json'
+
+
+@contextlib.contextmanager
+def scope(solver: Solver, input_path, engine: str = 'fast') -> Iterator[Optional[Checkpoint]]:
+    """
+    Make chunked searches inside the block resume from, and record to, the
+    checkpoint for this run. Saved on any exit by exception, removed when
+    the block completes. A no-op unless checkpointing is enabled.
+    """
+    if not enabled:
+        yield None
+        return
+    checkpoint = Checkpoint(checkpoint_path(solver, input_path, engine))
+    token = _current.set(checkpoint)
+    try:
+        yield checkpoint
+    except BaseException:
+        checkpoint.save()
+        raise
+    else:
+        checkpoint.remove()
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[Checkpoint]:
+    """The checkpoint of the enclosing scope, if any."""
+    return _current.get()
@@ -0,0 +1,215 @@
+"""Command line entry point: python -m aoc2024 [DAY[/PART] ...]"""
+
+import argparse
+import json
+import re
+import sys
+
+from . import checkpoint, deadline, history, logs, parallel
+from .cache import AnswerCache
+from .memory import measure
+from .profiling import TOP, profile, report, save
+from .pool import run_batch
+from .registry import ENGINES, discover, select
+from .runner import run_many
+
+
+def format_bytes(n):
+    if n is None:
+        return '-'
+    for unit in ('B', 'KiB', 'MiB'):
+        if n < 1024:
+            return f'{n:.0f}{unit}'
+        n /= 1024
+    return f'{n:.1f}GiB'
+
+
+def format_row(result):
+    answer = result.error or result.answer
+    if result.cached:
+        parse = 'cached'
+    elif result.parse_shared:
+        parse = 'shared'
+    else:
+        parse = f'{result.parse_seconds * 1000:.2f}ms'
+    return (f'{result.day:>3}/{result.part}  {result.engine:<9}  {answer!s:<20}  '
+            f'parse {parse:>11}  '
+            f'solve {result.solve_seconds * 1000:10.2f}ms  '
+            f'peak {format_bytes(result.peak_bytes):>9}')
+
+
+def format_result(result):
+    """The result row, followed by its work counters if it has any."""
+    if not result.counters:
+        return format_row(result)
+    return f'{format_row(result)}\n  counters {json.dumps(result.counters)}'
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='aoc2024', description='Run Advent of Code 2024 solvers in-process.')
+    parser.add_argument('solvers', nargs='*', metavar='DAY[/PART]',
+                        help='solvers to run, e.g. 6 or 6/2 (default: all)')
+    parser.add_argument('-i', '--input', help='input file (default: each solver\'s input.txt)')
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='reference',
+                        help='solver implementation to run (default: reference)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip tracemalloc peak-memory tracking')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore and do not update the answer cache')
+    parser.add_argument('--parse-cache', action='store_true',
+                        help='reload fast-engine parsed inputs from binary sidecars')
+    parser.add_argument('--counters', action='store_true',
+                        help='report the fast engines\' work counters; bypasses the answer cache')
+    parser.add_argument('-j', '--jobs', type=int, metavar='N',
+                        help='run solvers in N worker processes, slowest first '
+                             '(0 = one per CPU)')
+    parser.add_argument('--parallel', type=int, metavar='N',
+                        help='split fast-engine searches over N threads on free-threaded '
+                             'builds, else forked processes (0 = one per CPU)')
+    parser.add_argument('--timeout', action='append', metavar='[DAY[/PART]=]SECONDS',
+                        help='run each solver in its own process and stop it after SECONDS; '
+                             'repeat with DAY=SECONDS or DAY/PART=SECONDS for per-day or '
+                             'per-solver deadlines')
+    parser.add_argument('--checkpoint', type=float, nargs='?', const=checkpoint.interval,
+                        metavar='SECONDS',
+                        help='save fast-engine search progress every SECONDS '
+                             f'(default {checkpoint.interval:g}) and resume interrupted runs')
+    parser.add_argument('--profile', action='store_true',
+                        help='profile each solver with cProfile; bypasses the answer cache')
+    parser.add_argument('--memory-report', action='store_true',
+                        help='attribute each solver\'s peak memory to the lines that '
+                             'allocated it; bypasses the answer cache')
+    parser.add_argument('--top', type=int, default=TOP, metavar='N',
+                        help=f'entries listed per profile or memory report (default {TOP})')
+    parser.add_argument('--log', choices=logs.LEVELS, metavar='LEVEL',
+                        help='show solver logs at LEVEL and above on stderr '
+                             f'({"/".join(logs.LEVELS)}; default: silent)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--list', action='store_true', help='list solvers and exit')
+    return parser
+
+
+def profile_solvers(solvers, args):
+    """Run each solver under cProfile, printing and saving its report."""
+    results = []
+    for solver in solvers:
+        result, stats = profile(solver, args.input, args.engine, args.parse_cache)
+        path = save(stats, solver, result.engine)
+        results.append((result, path))
+        if not args.json:
+            print(format_row(result))
+            print(report(stats, args.top))
+            print(f'  profile saved to {path}')
+    if args.json:
+        print(json.dumps([dict(r.to_dict(), profile=str(path)) for r, path in results],
+                         indent=2, default=str))
+    return 1 if any(r.error for r, _ in results) else 0
+
+
+def format_memory(report):
+    lines = [f'  peak {format_bytes(report.peak_bytes)}, '
+             f'largest sample {format_bytes(report.sampled_bytes)}, '
+             f'process max RSS {format_bytes(report.max_rss_bytes)}',
+             f'  {"live":>9}  {"blocks":>9}  allocated at']
+    for a in report.allocations:
+        lines.append(f'  {format_bytes(a.bytes):>9}  {a.blocks:>9}  {a.site}  {a.code}')
+    return '\n'.join(lines)
+
+
+def memory_solvers(solvers, args):
+    """Run each solver under tracemalloc, printing where its peak memory lives."""
+    reports = []
+    for solver in solvers:
+        report = measure(solver, args.input, args.engine, args.parse_cache, args.top)
+        reports.append(report)
+        if not args.json:
+            print(format_row(report.result))
+            print(format_memory(report))
+    if args.json:
+        print(json.dumps([r.to_dict() for r in reports], indent=2, default=str))
+    return 1 if any(r.result.error for r in reports) else 0
+
+
+def parse_timeouts(values):
+    """(default, {'DAY' or 'DAY/PART': seconds}) from --timeout values."""
+    default, timeouts = None, {}
+    for value in values:
+        key, _, seconds = value.rpartition('=')
+        try:
+            seconds = float(seconds)
+        except ValueError:
+            raise ValueError(f'bad --timeout {value!r}') from None
+        if key and not re.fullmatch(r'\d+(/\d+)?', key):
+            raise ValueError(f'bad --timeout {value!r}: expected DAY or DAY/PART before =')
+        if key:
+            timeouts['/'.join(str(int(n)) for n in key.split('/'))] = seconds
+        else:
+            default = seconds
+    return default, timeouts
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        solvers = select(discover(), args.solvers)
+    except ValueError as e:
+        print(f'aoc2024: {e}', file=sys.stderr)
+        return 2
+
+    if args.list:
+        for solver in solvers:
+            print(f'{solver.key:>5}  {solver.path}')
+        return 0
+    if args.parallel is not None:
+        parallel.configure(args.parallel)
+    if args.checkpoint is not None:
+        checkpoint.configure(args.checkpoint)
+    logs.configure(args.log)
+
+    if args.profile or args.memory_report:
+        if (args.jobs is not None or args.timeout) or (args.profile and args.memory_report):
+            print('aoc2024: --profile, --memory-report and --jobs/--timeout are exclusive',
+                  file=sys.stderr)
+            return 2
+        if args.memory_report:
+            return memory_solvers(solvers, args)
+        return profile_solvers(solvers, args)
+
+    cache = None if args.no_cache or args.counters else AnswerCache()
+    if args.jobs is not None or args.timeout:
+        on_result = None if args.json else lambda r: print(format_result(r), flush=True)
+        if args.timeout:
+            try:
+                timeout, timeouts = parse_timeouts(args.timeout)
+            except ValueError as e:
+                print(f'aoc2024: {e}', file=sys.stderr)
+                return 2
+            summary = deadline.run_batch(solvers, args.input, timeouts, timeout,
+                                         trace_memory=not args.no_memory, engine=args.engine,
+                                         workers=args.jobs, on_result=on_result, cache=cache,
+                                         parse_cache=args.parse_cache, count=args.counters)
+        else:
+            summary = run_batch(solvers, args.input, trace_memory=not args.no_memory,
+                                engine=args.engine, workers=args.jobs, on_result=on_result,
+                                cache=cache, parse_cache=args.parse_cache, count=args.counters)
+        if args.json:
+            print(json.dumps(summary.to_dict(), indent=2, default=str))
+        else:
+            print(f'{len(summary.results)} solvers on {summary.workers} workers: '
+                  f'wall {summary.wall_seconds:.2f}s, busy {summary.busy_seconds:.2f}s, '
+                  f'{len(summary.errors)} errors')
+        return 1 if summary.errors else 0
+
+    results = []
+    for result in run_many(solvers, args.input, trace_memory=not args.no_memory,
+                           engine=args.engine, cache=cache, parse_cache=args.parse_cache,
+                           count=args.counters):
+        results.append(result)
+        if not args.json:
+            print(format_result(result))
+    history.record(results)
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2, default=str))
+    return 1 if any(r.error for r in results) else 0
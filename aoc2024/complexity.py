@@ -0,0 +1,274 @@
+"""
+Estimate how each solver scales by fitting curves to benchmark runs.
+
+    python -m aoc2024.complexity 1/2 8/1 --target 60
+    python -m aoc2024.complexity 7 --axis operands --memory
+
+Each solver is timed over a geometric ladder of generated inputs (see
+aoc2024.bench), then runtime and optionally peak memory are fitted as
+c + a * f(n) for each candidate growth f. The fit with the smallest
+relative error wins. Here n is the input volume: records, bytes or digits,
+and cells (side squared) for the grid days. Solvers whose runtime grows
+clearly faster than linear are flagged: the slope of log time against
+log n over the whole ladder must exceed SUPERLINEAR_EXPONENT. Each fit also predicts the size at which one run
+would take longer than --target seconds.
+
+Day 7 can also be measured along `--axis operands`. That ladder holds the
+number of equations fixed and raises the operand count per equation, and
+it fits exponential growth base^n.
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import generate
+from .bench import LADDERS, bench_solver
+from .registry import ENGINES, WORK_DIR, discover, select
+
+GRID_DAYS = {4, 6, 8, 10, 12}
+
+MODELS: dict[str, Callable[[float], float]] = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log(n),
+    'n^2': lambda n: n ** 2,
+    'n^2 log n': lambda n: n ** 2 * math.log(n),
+    'n^3': lambda n: n ** 3,
+}
+
+# Fitted log-log slope above which growth is flagged; n log n over the
+# ladders stays near 1.1
+SUPERLINEAR_EXPONENT = 1.25
+
+OPERAND_LADDER = list(range(2, 21))
+OPERAND_ROWS = 100
+
+
+@dataclass
+class Fit:
+    """c + a * f(n) fitted to measurements, with its RMS relative error."""
+    model: str
+    constant: float
+    scale: float
+    error: float
+    base: Optional[float] = None
+    exponent: float = 1.0  # least-squares slope of log y against log n
+
+    def growth(self, n: float) -> float:
+        if self.base is not None:
+            return self.base ** n
+        return MODELS[self.model](n)
+
+    def predict(self, n: float) -> float:
+        return self.constant + self.scale * self.growth(n)
+
+    def solve(self, value: float, limit: float) -> Optional[float]:
+        """Smallest n in [1, limit] where the fit reaches value, or None."""
+        if self.predict(limit) < value:
+            return None
+        lo, hi = 1.0, limit
+        for _ in range(200):
+            mid = math.sqrt(lo * hi) if self.base is None else (lo + hi) / 2
+            if self.predict(mid) < value:
+                lo = mid
+            else:
+                hi = mid
+        return hi
+
+    @property
+    def superlinear(self) -> bool:
+        return self.exponent > SUPERLINEAR_EXPONENT
+
+
+def fit_model(xs, ys, growth) -> Optional[tuple[float, float, float]]:
+    """
+    Least-squares (c, a, error) for y = c + a * growth(x) weighted by 1/y,
+    so small and large runs count alike; c is clamped at zero.
+    """
+    try:
+        u = [1 / y for y in ys]
+        v = [growth(x) / y for x, y in zip(xs, ys)]
+    except OverflowError:
+        return None
+    uu = sum(a * a for a in u)
+    uv = sum(a * b for a, b in zip(u, v))
+    vv = sum(b * b for b in v)
+    det = uu * vv - uv * uv
+    c = (sum(u) * vv - sum(v) * uv) / det if det else 0.0
+    a = (uu * sum(v) - uv * sum(u)) / det if det else 0.0
+    if c < 0 or a <= 0:
+        c, a = 0.0, sum(v) / vv
+    if a <= 0:
+        return None
+    error = math.sqrt(sum((1 - c * p - a * q) ** 2 for p, q in zip(u, v)) / len(xs))
+    return c, a, error
+
+
+def fit(xs, ys, exponential=False) -> Optional[Fit]:
+    """Best fitting growth model for ys against xs (None with under 3 points)."""
+    points = [(x, y) for x, y in zip(xs, ys) if y]
+    if len(points) < 3:
+        return None
+    xs, ys = zip(*points)
+    exponent = slope([math.log(x) for x in xs], [math.log(y) for y in ys])
+    if exponential:
+        # base from the slope of log y against n, scale and constant from fit_model
+        base = math.exp(slope(xs, [math.log(y) for y in ys]))
+        fitted = fit_model(xs, ys, lambda n: base ** n)
+        return Fit(f'{base:.2f}^n', *fitted, base=base, exponent=exponent) if fitted else None
+    best = None
+    for model, growth in MODELS.items():
+        fitted = fit_model(xs, ys, growth)
+        if fitted and (best is None or fitted[2] < best.error):
+            best = Fit(model, *fitted, exponent=exponent)
+    return best
+
+
+def slope(xs, ys) -> float:
+    """Least-squares slope of ys against xs (0 when xs are all equal)."""
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / spread if spread else 0.0
+
+
+def local_exponent(xs, ys) -> Optional[float]:
+    """Slope of log y against log x over the two largest sizes."""
+    if len(xs) < 2 or not ys[-1] or not ys[-2] or xs[-1] == xs[-2]:
+        return None
+    return math.log(ys[-1] / ys[-2]) / math.log(xs[-1] / xs[-2])
+
+
+def volume(day: int, size: int) -> int:
+    """Input volume n for a generator size (cells for grid days)."""
+    return size * size if day in GRID_DAYS else size
+
+
+def ladder(day: int, ratio: float = 2.0) -> list[int]:
+    """
+    Sizes from half the bench ladder's smallest to its largest, growing the
+    volume by ratio each step.
+    """
+    sizes, low, high = [], LADDERS[day][0] // 2, LADDERS[day][-1]
+    step = math.sqrt(ratio) if day in GRID_DAYS else ratio
+    size = float(max(low, 1))
+    while size <= high:
+        if not sizes or round(size) != sizes[-1]:
+            sizes.append(round(size))
+        size *= step
+    return sizes
+
+
+def write_operand_input(operands: int, seed: int, directory: Path) -> Path:
+    """Day 7 input of OPERAND_ROWS equations with exactly `operands` operands each."""
+    path = Path(directory) / f'day7-ops{operands}-s{seed}.txt'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rng = random.Random(f'aoc2024-day7-ops{operands}-{seed}')
+        path.write_text(''.join(generate.day7(OPERAND_ROWS, rng, operands, operands)),
+                        encoding='us-ascii')
+    return path
+
+
+def estimate(solver, axis='size', sizes=None, seed=0, repeat=1, budget=10.0,
+             engine='reference', trace_memory=False, target=60.0) -> dict:
+    """Benchmark one solver along axis and fit its time and memory growth."""
+    operands = axis == 'operands'
+    if operands and solver.day != 7:
+        raise ValueError(f'axis operands only applies to day 7, not {solver.key}')
+    sizes = sizes or (OPERAND_LADDER if operands else ladder(solver.day))
+    records = bench_solver(solver, sizes, seed, repeat, budget, engine=engine,
+                           trace_memory=trace_memory,
+                           make_input=write_operand_input if operands else None)
+    ok = [r for r in records if not r['error']]
+    xs = [r['size'] if operands else volume(solver.day, r['size']) for r in ok]
+    seconds = [r['parse_seconds'] + r['solve_seconds'] for r in ok]
+    time_fit = fit(xs, seconds, exponential=operands)
+    memory_fit = None
+    if trace_memory:
+        memory_fit = fit(xs, [r['peak_bytes'] or 0 for r in ok])
+
+    limit_at = None
+    if time_fit:
+        n = time_fit.solve(target, 100.0 if operands else 1e18)
+        if n is not None:
+            limit_at = math.ceil(n if operands or solver.day not in GRID_DAYS else math.sqrt(n))
+    return {
+        'day': solver.day,
+        'part': solver.part,
+        'engine': ok[0]['engine'] if ok else engine,
+        'axis': axis,
+        'records': records,
+        'time': asdict(time_fit) if time_fit else None,
+        'memory': asdict(memory_fit) if memory_fit else None,
+        'local_exponent': None if operands else local_exponent(xs, seconds),
+        'superlinear': bool(time_fit and time_fit.superlinear),
+        'target_seconds': target,
+        'target_size': limit_at,
+    }
+
+
+def format_estimate(key: str, report: dict) -> str:
+    time_fit, memory_fit = report['time'], report['memory']
+    if time_fit is None:
+        return f'{key:>5}  too few sizes within the budget to fit'
+    parts = [f'{key:>5}  time {time_fit["model"]:<9} (±{time_fit["error"]:.0%})']
+    if report['local_exponent'] is not None:
+        parts.append(f'slope {report["local_exponent"]:.2f}')
+    if memory_fit:
+        parts.append(f'memory {memory_fit["model"]}')
+    if report['target_size'] is not None:
+        unit = 'operands' if report['axis'] == 'operands' else 'n'
+        parts.append(f'{report["target_seconds"]:g}s at {unit}={report["target_size"]:,}')
+    if report['superlinear']:
+        parts.append('SUPER-LINEAR')
+    return '  '.join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.complexity',
+                                     description='Fit solver runtime and memory growth.')
+    parser.add_argument('solvers', nargs='*', metavar='DAY[/PART]')
+    parser.add_argument('--axis', choices=('size', 'operands'), default='size',
+                        help='what to grow: generator size, or day 7 operands per equation')
+    parser.add_argument('--sizes', type=int, nargs='+', help='override the size ladder')
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='reference')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help='runs per size (best is kept)')
+    parser.add_argument('--budget', type=float, default=5.0,
+                        help='stop a solver\'s ladder after a run slower than this many seconds')
+    parser.add_argument('--target', type=float, default=60.0,
+                        help='predict the size at which one run takes this many seconds')
+    parser.add_argument('--memory', action='store_true', help='also fit peak traced memory')
+    parser.add_argument('-o', '--output', help='JSON results file')
+    args = parser.parse_args(argv)
+
+    try:
+        solvers = select(discover(), args.solvers or (['7'] if args.axis == 'operands' else []))
+        reports = []
+        for solver in solvers:
+            report = estimate(solver, args.axis, args.sizes, args.seed, args.repeat,
+                              args.budget, args.engine, args.memory, args.target)
+            reports.append(report)
+            print(format_estimate(solver.key, report), flush=True)
+    except ValueError as e:
+        print(f'aoc2024.complexity: {e}', file=sys.stderr)
+        return 2
+
+    output = Path(args.output) if args.output else (
+        WORK_DIR / 'complexity' / time.strftime('complexity-%Y%m%d-%H%M%S.json'))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'reports': reports},
+                  f, indent=2, default=str)
+    print(f'results written to {output}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+"""
+Grid positions and search states packed into single ints, and flat sets of them.
+
+A position is one int: the cell index of aoc2024.grid, or y * width + x
+for plain (x, y) coordinates. A state of a walker adds its facing 0-3
+in the low two bits, state = index << 2 | facing. Because these ids are
+dense and bounded, sets of them are flat buffers indexed by id instead
+of hashed tuples:
+
+    BitSet   one bit per id; built up once, counted with a popcount
+    Stamps   one 16-bit stamp per id; clear() is O(1) by starting a new
+             epoch, for a set reused across many searches
+"""
+
+from array import array
+from typing import Iterable
+
+
+def pack(x: int, y: int, width: int) -> int:
+    return y * width + x
+
+
+def unpack(position: int, width: int) -> tuple[int, int]:
+    y, x = divmod(position, width)
+    return x, y
+
+
+def state(index: int, facing: int) -> int:
+    return index << 2 | facing
+
+
+def split_state(packed: int) -> tuple[int, int]:
+    """(index, facing) of a packed state."""
+    return packed >> 2, packed & 3
+
+
+class BitSet:
+    """Set of ints 0 .. n - 1 stored one bit each."""
+
+    __slots__ = ('bits',)
+
+    def __init__(self, n: int, items: Iterable[int] = ()):
+        self.bits = bytearray((n + 7) >> 3)
+        for i in items:
+            self.add(i)
+
+    def add(self, i: int) -> None:
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def discard(self, i: int) -> None:
+        self.bits[i >> 3] &= ~(1 << (i & 7))
+
+    def __contains__(self, i: int) -> bool:
+        return self.bits[i >> 3] >> (i & 7) & 1 == 1
+
+    def __len__(self) -> int:
+        return int.from_bytes(self.bits, 'little').bit_count()
+
+    def __iter__(self):
+        bits = self.bits
+        for byte_index, byte in enumerate(bits):
+            while byte:
+                low = byte & -byte
+                yield byte_index << 3 | low.bit_length() - 1
+                byte ^= low
+
+    def clear(self) -> None:
+        self.bits[:] = bytes(len(self.bits))
+
+
+class Stamps:
+    """
+    Set of ints 0 .. n - 1 for repeated searches. Each id stores the epoch
+    it was last added in, so clear() just starts a new epoch; the stamps
+    are only zeroed once every 65535 clears.
+    """
+
+    __slots__ = ('stamps', 'epoch')
+
+    def __init__(self, n: int):
+        self.stamps = array('H', bytes(2 * n))
+        self.epoch = 1
+
+    def clear(self) -> None:
+        if self.epoch == 0xffff:
+            self.stamps = array('H', bytes(2 * len(self.stamps)))
+            self.epoch = 0
+        self.epoch += 1
+
+    def add(self, i: int) -> None:
+        self.stamps[i] = self.epoch
+
+    def __contains__(self, i: int) -> bool:
+        return self.stamps[i] == self.epoch
+
+    def __len__(self) -> int:
+        return self.stamps.count(self.epoch)
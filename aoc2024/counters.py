@@ -0,0 +1,50 @@
+"""
+Work counters for the fast engines.
+
+Solvers count the work they do (steps simulated, branches explored, ...)
+so a slowdown can be told apart as more work or slower work. Counting is
+off unless enabled, and hot loops only tally into locals and report once
+per call behind a check of `enabled`:
+
+    if counters.enabled:
+        counters.add('steps', steps)
+
+Totals are summed per name; `record` appends to a per-name series, e.g.
+one value per blink. The runner enables counting with --counters and
+attaches what each part counted to its result. Long loops may also report
+in chunks as they go, so `snapshot` shows progress mid-run (the deadline
+runner sends it from its workers).
+"""
+
+from collections import Counter, defaultdict
+
+enabled = False
+
+_totals: Counter = Counter()
+_series: defaultdict = defaultdict(list)
+
+
+def enable(flag: bool = True) -> None:
+    global enabled
+    enabled = flag
+
+
+def add(name: str, n: int = 1) -> None:
+    _totals[name] += n
+
+
+def record(name: str, value) -> None:
+    _series[name].append(value)
+
+
+def snapshot() -> dict:
+    """Everything counted so far, without resetting."""
+    return dict(_totals) | {name: list(values) for name, values in _series.items()}
+
+
+def collect() -> dict:
+    """Return everything counted since the last collect and reset."""
+    counts = dict(_totals) | dict(_series)
+    _totals.clear()
+    _series.clear()
+    return counts
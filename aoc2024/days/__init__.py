@@ -0,0 +1,18 @@
+"""
+Fast engines: faster reimplementations of the dayN/P reference solvers.
+
+Each module dayNN.py exposes
+
+    parse(source) -> parsed input shared by both parts, from a path
+                     (os.PathLike) or the input text as str or bytes
+    part1(data)   -> part 1 answer
+    part2(data)   -> part 2 answer
+
+and must return the same answers as the reference solvers. Modules may
+also define pack(data) and unpack(views) so their parsed input can be
+reloaded from a binary sidecar (see aoc2024.sidecar), and
+batch_part1/batch_part2 variants that build process-wide caches, which
+aoc2024.batch prefers when solving many inputs. Select them
+with `python -m aoc2024 --engine fast`; days without a module here fall
+back to the reference solver.
+"""
@@ -0,0 +1,31 @@
+"""Day 1: Historian Hysteria on bulk-parsed column arrays."""
+
+from array import array
+from collections import Counter
+
+from ..parsing import columns, read
+
+
+def parse(path):
+    return columns(read(path), 2)
+
+
+def pack(data):
+    return [array('q', column) for column in data]
+
+
+def unpack(views):
+    return views
+
+
+def part1(data):
+    """Total distance between the sorted columns."""
+    left, right = data
+    return sum(abs(a - b) for a, b in zip(sorted(left), sorted(right)))
+
+
+def part2(data):
+    """Similarity score: each left id times its count in the right column."""
+    left, right = data
+    counts = Counter(right)
+    return sum(a * counts[a] for a in left)
@@ -0,0 +1,44 @@
+"""Day 2: Red-Nosed Reports on bulk-parsed ragged rows."""
+
+from array import array
+
+from ..parsing import iter_rows, read, rows
+from ..sidecar import copy
+
+
+def parse(path):
+    return rows(read(path))
+
+
+def pack(data):
+    values, offsets = data
+    return [array('q', values), offsets]
+
+
+def unpack(views):
+    # Dampening concatenates row slices, which memoryviews do not support
+    values, offsets = views
+    return copy(values), offsets
+
+
+def is_safe(levels):
+    """All steps rise, or all fall, by 1 to 3."""
+    if len(levels) <= 1:
+        return True
+    steps = [b - a for a, b in zip(levels, levels[1:])]
+    return all(1 <= s <= 3 for s in steps) or all(-3 <= s <= -1 for s in steps)
+
+
+def is_dampened_safe(levels):
+    """Safe, or safe after removing any one level."""
+    if len(levels) <= 2 or is_safe(levels):
+        return True
+    return any(is_safe(levels[:i] + levels[i + 1:]) for i in range(len(levels)))
+
+
+def part1(data):
+    return sum(1 for levels in iter_rows(*data) if is_safe(levels))
+
+
+def part2(data):
+    return sum(1 for levels in iter_rows(*data) if is_dampened_safe(levels))
@@ -0,0 +1,28 @@
+"""Day 3: Mull It Over, scanning the memory once for both parts."""
+
+import re
+
+from ..parsing import read
+
+INSTRUCTION = re.compile(rb"mul\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)|do\(\)|don't\(\)")
+
+
+def parse(path):
+    """Return [(enabled, product), ...] for every mul() in the memory."""
+    products = []
+    enabled = True
+    for match in INSTRUCTION.finditer(read(path)):
+        x, y = match.groups()
+        if x is not None:
+            products.append((enabled, int(x) * int(y)))
+        else:
+            enabled = match.group() == b'do()'
+    return products
+
+
+def part1(products):
+    return sum(product for _, product in products)
+
+
+def part2(products):
+    return sum(product for enabled, product in products if enabled)
@@ -0,0 +1,33 @@
+"""Day 4: Ceres Search over a grid with a 3-row sentinel border."""
+
+from ..grid import load_grid
+
+X, M, A, S = b'XMAS'
+
+
+def parse(path):
+    # Every 4-letter ray stays inside the border, so none is bounds checked
+    return load_grid(path, pad=3)
+
+
+def part1(grid):
+    """Count XMAS in all eight directions."""
+    cells = grid.cells
+    count = 0
+    for i in grid.positions(X):
+        for d in grid.around:
+            if cells[i + d] == M and cells[i + 2 * d] == A and cells[i + 3 * d] == S:
+                count += 1
+    return count
+
+
+def part2(grid):
+    """Count A cells crossed by two diagonal MAS words."""
+    cells = grid.cells
+    nw, ne, se, sw = grid.diagonal
+    pair = {(M, S), (S, M)}
+    count = 0
+    for i in grid.positions(A):
+        if (cells[i + nw], cells[i + se]) in pair and (cells[i + ne], cells[i + sw]) in pair:
+            count += 1
+    return count
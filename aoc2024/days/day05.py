@@ -0,0 +1,90 @@
+"""Day 5: Print Queue with rules as a pair set and a CSR graph for reordering."""
+
+from array import array
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+from ..graph import CSR, TopologicalSorter
+from ..parsing import iter_rows, read, rows
+
+
+@dataclass
+class PrintQueue:
+    """Ordering rules as (before, after) pairs plus the updates to check."""
+    rules: frozenset[tuple[int, int]]
+    updates: list[list[int]]
+
+    @cached_property
+    def valid(self) -> list[bool]:
+        """Whether each update is already in order; shared by both parts."""
+        return [is_valid_order(pages, self.rules) for pages in self.updates]
+
+
+@lru_cache(maxsize=64)
+def parse_rules(section: bytes) -> frozenset[tuple[int, int]]:
+    """Rule pairs of a rules section; inputs with the same rules share one set."""
+    values, _ = rows(section)
+    return frozenset(zip(values[0::2], values[1::2]))
+
+
+def parse(path):
+    rules_section, _, updates_section = read(path).strip().partition(b'\n\n')
+    updates = [list(update) for update in iter_rows(*rows(updates_section))]
+    return PrintQueue(parse_rules(rules_section), updates)
+
+
+def pack(queue):
+    rules = array('q', [page for rule in queue.rules for page in rule])
+    pages = array('q', [page for update in queue.updates for page in update])
+    offsets = array('q', [0])
+    for update in queue.updates:
+        offsets.append(offsets[-1] + len(update))
+    return [rules, pages, offsets]
+
+
+def unpack(views):
+    rules, pages, offsets = views
+    updates = [list(update) for update in iter_rows(pages, offsets)]
+    return PrintQueue(frozenset(zip(rules[0::2], rules[1::2])), updates)
+
+
+def is_valid_order(pages, rules):
+    """No later page has a rule saying it must come before an earlier one."""
+    return not any((later, earlier) in rules
+                   for i, earlier in enumerate(pages)
+                   for later in pages[i + 1:])
+
+
+@lru_cache(maxsize=64)
+def rule_sorter(rules: frozenset[tuple[int, int]], size: int = 0) -> TopologicalSorter:
+    """
+    Topological sorter over the rule graph with at least size nodes,
+    shared by inputs with the same rules.
+    """
+    pages = max(size, 1 + max((page for rule in rules for page in rule), default=0))
+    return TopologicalSorter(CSR.from_edges(pages, rules))
+
+
+def middle_of_reordered(pages, rules):
+    """
+    Middle page once pages are sorted by the rules, using Kahn's algorithm
+    on the rules between them. The rules totally order every update in
+    puzzle inputs; otherwise ties keep the update's order, and pages that
+    appear in no rule are free to go first, as in the reference solver.
+    """
+    sorter = rule_sorter(rules)
+    if max(pages) >= len(sorter.graph):
+        # Pages in no rule are unconstrained nodes; sizes are rounded up to
+        # a power of two so few graphs get built
+        sorter = rule_sorter(rules, 1 << max(pages).bit_length())
+    return sorter.sort(pages)[len(pages) // 2]
+
+
+def part1(queue):
+    return sum(pages[len(pages) // 2]
+               for pages, valid in zip(queue.updates, queue.valid) if valid)
+
+
+def part2(queue):
+    return sum(middle_of_reordered(pages, queue.rules)
+               for pages, valid in zip(queue.updates, queue.valid) if not valid)
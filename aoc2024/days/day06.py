@@ -0,0 +1,111 @@
+"""Day 6: Guard Gallivant over a grid with a 1-row sentinel border."""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional
+
+from .. import counters, parallel
+from ..coords import Stamps, state
+from ..grid import SENTINEL, MappedGrid, load_grid
+
+FACINGS = b'^>v<'  # same order as MappedGrid.orthogonal
+OBSTRUCTION = ord('#')
+
+
+@dataclass
+class Lab:
+    """The lab map and the guard's start as (index, direction)."""
+    grid: MappedGrid
+    guard: Optional[tuple[int, int]]
+
+    @cached_property
+    def first_visits(self) -> list[tuple[int, int, int]]:
+        """
+        (cell, from_index, direction) for each cell the unobstructed
+        patrol reaches, in the order it first steps onto them. Part 1
+        counts them and part 2 only tries obstructions on them.
+        """
+        visits = []
+        if self.guard is None:
+            return visits
+        i, d = self.guard
+        cells, dirs = self.grid.cells, self.grid.orthogonal
+        seen = bytearray(len(cells))
+        seen[i] = 1
+        turns = Stamps(4 * len(cells))
+        while True:
+            step = i + dirs[d]
+            if cells[step] == SENTINEL:
+                return visits
+            if cells[step] == OBSTRUCTION:
+                if state(i, d) in turns:
+                    return visits  # the patrol itself loops
+                turns.add(state(i, d))
+                d = (d + 1) & 3
+            else:
+                if not seen[step]:
+                    seen[step] = 1
+                    visits.append((step, i, d))
+                i = step
+
+
+def parse(path):
+    # One step off the map in any direction reads a sentinel
+    grid = load_grid(path, pad=1)
+    starts = [(i, d) for d, i in enumerate(map(grid.find, FACINGS)) if i != -1]
+    return Lab(grid, min(starts) if starts else None)
+
+
+def loops(cells, dirs, i, d, block, turns):
+    """
+    True if a guard at (i, d) ends up in a loop once block is also an
+    obstruction. A loop must repeat a turn, so only turns are remembered,
+    as packed states in turns (cleared first, then reused by the caller).
+    """
+    turns.clear()
+    stamps, epoch = turns.stamps, turns.epoch
+    steps = states = 0
+    while True:
+        steps += 1
+        step = i + dirs[d]
+        if cells[step] == SENTINEL:
+            looped = False
+            break
+        if cells[step] == OBSTRUCTION or step == block:
+            turn = step << 2 | d  # state(step, d), inlined in the hot loop
+            if stamps[turn] == epoch:
+                looped = True
+                break
+            stamps[turn] = epoch
+            states += 1
+            d = (d + 1) & 3
+        else:
+            i = step
+    if counters.enabled:
+        counters.add('candidates')
+        counters.add('steps', steps)
+        counters.add('states', states)
+    return looped
+
+
+def part1(lab):
+    """Count distinct cells the guard visits before leaving the map."""
+    return 0 if lab.guard is None else 1 + len(lab.first_visits)
+
+
+def part2(lab):
+    """
+    Count cells where one new obstruction traps the guard in a loop. Only
+    cells on the original patrol can change it, and the patrol is the same
+    up to the first step onto the new obstruction, so each candidate is
+    simulated from there rather than from the start. Candidates are
+    independent, so they are split across workers (see aoc2024.parallel).
+    """
+    return sum(parallel.run_chunks(count_loops, lab, parallel.chunked(lab.first_visits)))
+
+
+def count_loops(lab, candidates):
+    """How many of candidates' obstructions loop; one chunk of part 2."""
+    cells, dirs = lab.grid.cells, lab.grid.orthogonal
+    turns = Stamps(4 * len(cells))
+    return sum(1 for block, i, d in candidates if loops(cells, dirs, i, d, block, turns))
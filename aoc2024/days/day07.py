@@ -0,0 +1,84 @@
+"""Day 7: Bridge Repair, searching operators backwards from the target."""
+
+from array import array
+
+from .. import counters, parallel
+from ..parsing import iter_rows, read, rows
+from ..sidecar import copy
+
+
+def parse(path):
+    """Return [(test value, operands), ...]."""
+    return [(row[0], list(row[1:])) for row in iter_rows(*rows(read(path)))]
+
+
+def pack(equations):
+    """Each equation as one row of test value then operands."""
+    values, offsets = array('q'), array('q', [0])
+    for target, numbers in equations:
+        values.append(target)
+        values.extend(numbers)
+        offsets.append(len(values))
+    return [values, offsets]
+
+
+def unpack(views):
+    values, offsets = views
+    return [(row[0], list(row[1:])) for row in iter_rows(copy(values), offsets)]
+
+
+def can_solve(target, numbers, concat=False):
+    """
+    True if some left-to-right mix of +, * (and || with concat) turns
+    numbers into target. Working from the last operand back, each
+    operator only applies when it can be undone exactly, which prunes
+    almost every branch instead of trying all operator combinations.
+    This relies on positive operands; anything else uses forward search.
+    """
+    if min(numbers) < 1:
+        return _forward(target, numbers, concat)
+    return _backward(target, numbers, len(numbers) - 1, concat)
+
+
+def _backward(target, numbers, k, concat):
+    if counters.enabled:
+        counters.add('branches')
+    n = numbers[k]
+    if k == 0:
+        return target == n
+    if target > n and _backward(target - n, numbers, k - 1, concat):
+        return True
+    if target % n == 0 and _backward(target // n, numbers, k - 1, concat):
+        return True
+    if concat:
+        scale = 10 ** len(str(n))
+        if target > n and target % scale == n:
+            return _backward(target // scale, numbers, k - 1, concat)
+    return False
+
+
+def _forward(target, numbers, concat):
+    values = {numbers[0]}
+    for n in numbers[1:]:
+        step = set()
+        for v in values:
+            step.update((v + n, v * n))
+            if concat:
+                step.add(int(f'{v}{n}'))
+        values = step
+        if counters.enabled:
+            counters.add('combinations', len(values))
+    return target in values
+
+
+def _calibration(concat, equations):
+    """Sum of the solvable targets in one chunk of equations."""
+    return sum(target for target, numbers in equations if can_solve(target, numbers, concat))
+
+
+def part1(equations):
+    return sum(parallel.run_chunks(_calibration, False, parallel.chunked(equations)))
+
+
+def part2(equations):
+    return sum(parallel.run_chunks(_calibration, True, parallel.chunked(equations)))
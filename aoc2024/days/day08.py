@@ -0,0 +1,67 @@
+"""Day 8: Resonant Collinearity with antennas indexed from a mapped grid."""
+
+from collections import defaultdict
+from math import gcd
+
+from .. import coords
+from ..coords import BitSet
+from ..grid import load_grid
+
+EMPTY = ord('.')
+
+
+def parse(path):
+    """Return (width, height, {frequency: [(x, y), ...]})."""
+    grid = load_grid(path)
+    antennas = defaultdict(list)
+    cells = grid.cells
+    for i in grid.interior():
+        if cells[i] != EMPTY:
+            antennas[cells[i]].append(grid.xy(i))
+    return grid.width, grid.height, dict(antennas)
+
+
+def _pairs(positions):
+    for k, a in enumerate(positions):
+        for b in positions[k + 1:]:
+            yield a, b
+
+
+def part1(data):
+    """
+    Count lattice points in line with two same-frequency antennas where
+    one antenna is twice as far away as the other. Besides the two outer
+    points this includes the one-third points between the antennas when
+    they fall on the lattice, as the reference solver does.
+    """
+    width, height, antennas = data
+    antinodes = BitSet(width * height)
+    for positions in antennas.values():
+        for (ax, ay), (bx, by) in _pairs(positions):
+            dx, dy = bx - ax, by - ay
+            candidates = [(ax - dx, ay - dy), (bx + dx, by + dy)]
+            if dx % 3 == 0 and dy % 3 == 0:
+                candidates += [(ax + dx // 3, ay + dy // 3), (bx - dx // 3, by - dy // 3)]
+            for x, y in candidates:
+                if 0 <= x < width and 0 <= y < height:
+                    antinodes.add(coords.pack(x, y, width))
+    return len(antinodes)
+
+
+def part2(data):
+    """Count lattice points on any line through two same-frequency antennas."""
+    width, height, antennas = data
+    antinodes = BitSet(width * height)
+    bits, size = antinodes.bits, width * height
+    for positions in antennas.values():
+        for (ax, ay), (bx, by) in _pairs(positions):
+            g = gcd(bx - ax, by - ay)
+            dx, dy = (bx - ax) // g, (by - ay) // g
+            for sx, sy in ((dx, dy), (-dx, -dy)):
+                # Walk packed positions, adding to the bits inline; x is
+                # still tracked to stop at the side edges
+                x, p, step = ax, ay * width + ax, sy * width + sx
+                while 0 <= x < width and 0 <= p < size:
+                    bits[p >> 3] |= 1 << (p & 7)
+                    x, p = x + sx, p + step
+    return len(antinodes)
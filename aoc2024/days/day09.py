@@ -0,0 +1,93 @@
+"""Day 9: Disk Fragmenter, working on spans instead of single blocks."""
+
+from array import array
+from heapq import heapify, heappop, heappush
+
+from .. import counters
+from ..parsing import read
+
+
+def parse(path):
+    """Return the disk map as a list of span lengths."""
+    return [c - 48 for c in read(path).strip()]
+
+
+def pack(sizes):
+    return [array('b', sizes)]
+
+
+def unpack(views):
+    return views[0].tolist()
+
+
+def _span(pos, size):
+    """Sum of block positions pos .. pos + size - 1."""
+    return size * pos + size * (size - 1) // 2
+
+
+def part1(sizes):
+    """
+    Checksum after moving single blocks from the end into the leftmost
+    gaps. Files are consumed from both ends of the map at once, so each
+    span is visited once however many blocks it holds.
+    """
+    files, gaps = sizes[0::2], sizes[1::2]
+    checksum = pos = moved = 0
+    left, right = 0, len(files) - 1
+    remaining = files[right]
+    while left < right:
+        checksum += left * _span(pos, files[left])
+        pos += files[left]
+        gap = gaps[left]
+        while gap and left < right:
+            take = min(gap, remaining)
+            checksum += right * _span(pos, take)
+            pos += take
+            moved += take
+            gap -= take
+            remaining -= take
+            if not remaining:
+                right -= 1
+                remaining = files[right]
+        left += 1
+    if left == right:
+        checksum += right * _span(pos, remaining)
+    if counters.enabled:
+        counters.add('blocks_moved', moved)
+    return checksum
+
+
+def part2(sizes):
+    """
+    Checksum after moving whole files, highest id first, into the leftmost
+    gap that fits. Gaps are kept in one position heap per gap length, so
+    finding the leftmost fit is at most nine heap peeks.
+    """
+    file_pos, gap_heaps = [], [[] for _ in range(10)]
+    pos = 0
+    for i, size in enumerate(sizes):
+        if i % 2 == 0:
+            file_pos.append(pos)
+        elif size:
+            gap_heaps[size].append(pos)
+        pos += size
+    for heap in gap_heaps:
+        heapify(heap)
+
+    checksum = moved = 0
+    for file_id in range(len(file_pos) - 1, -1, -1):
+        size, pos = sizes[2 * file_id], file_pos[file_id]
+        best = None
+        for gap in range(size, 10):
+            heap = gap_heaps[gap]
+            if heap and heap[0] < pos and (best is None or heap[0] < gap_heaps[best][0]):
+                best = gap
+        if best is not None:
+            moved += 1
+            pos = heappop(gap_heaps[best])
+            if best > size:
+                heappush(gap_heaps[best - size], pos + size)
+        checksum += file_id * _span(pos, size)
+    if counters.enabled:
+        counters.add('files_moved', moved)
+    return checksum
@@ -0,0 +1,59 @@
+"""Day 10: Hoof It, walking an uphill CSR graph over the memory-mapped grid."""
+
+from dataclasses import dataclass
+
+from .. import counters, parallel
+from ..coords import Stamps
+from ..graph import CSR, dfs, grid_graph
+from ..grid import MappedGrid, load_grid
+
+TRAILHEAD, PEAK = b'09'
+
+
+@dataclass
+class TopoMap:
+    """The height grid plus its uphill steps, shared by both parts."""
+    grid: MappedGrid
+    uphill: CSR
+
+
+def parse(path):
+    grid = load_grid(path)
+    return TopoMap(grid, grid_graph(grid, rise=1))
+
+
+def part1(topo):
+    """Sum over trailheads of the number of distinct peaks they reach."""
+    starts = list(topo.grid.positions(TRAILHEAD))
+    scores = parallel.run_chunks(_scores, topo, parallel.chunked(starts))
+    if counters.enabled:
+        counters.add('dfs_visits', sum(visits for _, visits in scores))
+    return sum(total for total, _ in scores)
+
+
+def _scores(topo, starts):
+    """(peaks reached, cells visited) summed over one chunk of trailheads."""
+    cells, uphill = topo.grid.cells, topo.uphill
+    seen = Stamps(len(uphill))
+    total = visits = 0
+    for start in starts:
+        reached = dfs(uphill, start, seen)
+        visits += len(reached)
+        total += sum(cells[i] == PEAK for i in reached)
+    return total, visits
+
+
+def part2(topo):
+    """
+    Sum over trailheads of the number of distinct trails. Heights rise by
+    one per step, so trails to a cell are the sum over its uphill
+    neighbours, filled in from the peaks down.
+    """
+    grid, offsets, targets = topo.grid, topo.uphill.offsets, topo.uphill.targets
+    trails = [0] * len(grid.cells)
+    for i in grid.positions(PEAK):
+        trails[i] = 1
+    for height in range(PEAK - 1, TRAILHEAD - 1, -1):
+        for i in grid.positions(height):
+            trails[i] = sum(trails[j] for j in targets[offsets[i]:offsets[i + 1]])
+    return sum(trails[i] for i in grid.positions(TRAILHEAD))
@@ -0,0 +1,76 @@
+"""Day 12: Garden Groups with regions labelled as components of a CSR graph."""
+
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+
+from ..graph import components, grid_graph
+from ..grid import MappedGrid, load_grid
+
+OUTSIDE = -1
+
+
+@dataclass
+class Garden:
+    """
+    Region labelling shared by both parts. region holds the region id of
+    grid cell i at region[i + margin], with OUTSIDE in the newline column
+    and in a margin of one row plus one cell on either end, so every
+    neighbour and diagonal lookup stays in range.
+    """
+    grid: MappedGrid
+    region: array
+    margin: int
+    count: int
+
+    @cached_property
+    def areas(self) -> list[int]:
+        areas = [0] * self.count
+        region, margin = self.region, self.margin
+        for i in self.grid.interior():
+            areas[region[i + margin]] += 1
+        return areas
+
+
+def parse(path):
+    """Label every cell with its region: a component of equal neighbours."""
+    grid = load_grid(path)
+    labels, count = components(grid_graph(grid), grid.interior())
+    margin = grid.stride + 1
+    # Unreached (non-cell) labels are already -1, i.e. OUTSIDE
+    border = array('i', [OUTSIDE]) * margin
+    return Garden(grid, border + labels + border, margin, count)
+
+
+def part1(garden):
+    """Sum of area * perimeter over all regions."""
+    region, margin = garden.region, garden.margin
+    perimeter = [0] * garden.count
+    dirs = garden.grid.orthogonal
+    for i in garden.grid.interior():
+        i += margin
+        r = region[i]
+        perimeter[r] += sum(1 for d in dirs if region[i + d] != r)
+    return sum(a * p for a, p in zip(garden.areas, perimeter))
+
+
+def part2(garden):
+    """
+    Sum of area * sides over all regions. A region has as many sides as
+    corners; each cell checks its four corners for a convex one (both
+    edge neighbours outside) or a concave one (both inside, diagonal out).
+    """
+    region, margin = garden.region, garden.margin
+    corners = [0] * garden.count
+    up, right, down, left = garden.grid.orthogonal
+    quadrants = ((up, right), (right, down), (down, left), (left, up))
+    for i in garden.grid.interior():
+        i += margin
+        r = region[i]
+        for a, b in quadrants:
+            in_a, in_b = region[i + a] == r, region[i + b] == r
+            if not in_a and not in_b:
+                corners[r] += 1
+            elif in_a and in_b and region[i + a + b] != r:
+                corners[r] += 1
+    return sum(a * c for a, c in zip(garden.areas, corners))
@@ -0,0 +1,57 @@
+"""Day 13: Claw Contraption solved exactly with integer algebra."""
+
+from array import array
+
+from ..parsing import ints, read
+
+PART2_OFFSET = 10000000000000
+
+
+def parse(path):
+    """Return [(a_x, a_y, b_x, b_y, prize_x, prize_y), ...]."""
+    values = ints(read(path))
+    return [tuple(values[i:i + 6]) for i in range(0, len(values), 6)]
+
+
+def pack(machines):
+    return [array('q', [value for machine in machines for value in machine])]
+
+
+def unpack(views):
+    values = iter(views[0].tolist())
+    return list(zip(*[values] * 6))
+
+
+def cheapest(machine, max_presses=None):
+    """
+    Fewest tokens (3 per A press, 1 per B) that reach the prize, or None.
+    Independent buttons have one solution by Cramer's rule; parallel
+    buttons fall back to trying every A count within max_presses.
+    """
+    a_x, a_y, b_x, b_y, p_x, p_y = machine
+    det = a_x * b_y - a_y * b_x
+    if det:
+        a, a_rem = divmod(p_x * b_y - p_y * b_x, det)
+        b, b_rem = divmod(a_x * p_y - a_y * p_x, det)
+        if a_rem or b_rem or a < 0 or b < 0:
+            return None
+        if max_presses is not None and (a > max_presses or b > max_presses):
+            return None
+        return 3 * a + b
+    if max_presses is None:
+        return None
+    costs = []
+    for a in range(max_presses + 1):
+        for b in range(max_presses + 1):
+            if a * a_x + b * b_x == p_x and a * a_y + b * b_y == p_y:
+                costs.append(3 * a + b)
+    return min(costs, default=None)
+
+
+def part1(machines):
+    return sum(filter(None, (cheapest(m, 100) for m in machines)))
+
+
+def part2(machines):
+    shifted = (m[:4] + (m[4] + PART2_OFFSET, m[5] + PART2_OFFSET) for m in machines)
+    return sum(filter(None, (cheapest(m) for m in shifted)))
@@ -0,0 +1,132 @@
+"""Day 14: Restroom Redoubt with robots in parallel coordinate lists."""
+
+from array import array
+from collections import Counter
+from functools import lru_cache
+
+from .. import counters, parallel
+from ..parsing import ints, read
+
+WIDTH, HEIGHT = 101, 103
+
+
+def parse(path):
+    """Return (px, py, vx, vy) lists, one entry per robot."""
+    values = ints(read(path), signed=True)
+    return tuple(list(values[i::4]) for i in range(4))
+
+
+def pack(robots):
+    return [array('q', column) for column in robots]
+
+
+def unpack(views):
+    return tuple(view.tolist() for view in views)
+
+
+def part1(robots, time=100, width=WIDTH, height=HEIGHT):
+    """
+    Product of the robot counts in the non-empty quadrants after time
+    seconds (robots on the middle lines are not counted).
+    """
+    quadrants = Counter(quadrant(robot, time, width, height) for robot in zip(*robots))
+    quadrants.pop(None, None)
+    return safety_factor(quadrants)
+
+
+def quadrant(robot, time=100, width=WIDTH, height=HEIGHT):
+    """Quadrant of (px, py, vx, vy) after time seconds, or None on a middle line."""
+    x0, y0, dx, dy = robot
+    x, y = (x0 + dx * time) % width, (y0 + dy * time) % height
+    if x == width // 2 or y == height // 2:
+        return None
+    return x < width // 2, y < height // 2
+
+
+def safety_factor(quadrants):
+    """Product of the non-empty quadrant counts."""
+    result = 1
+    for count in quadrants.values():
+        result *= count
+    return result
+
+
+def has_run(xs, length):
+    """True if sorted xs holds length consecutive values; repeats break a run."""
+    current = 1
+    for a, b in zip(xs, xs[1:]):
+        current = current + 1 if b == a + 1 else 1
+        if current >= length:
+            return True
+    return False
+
+
+@lru_cache(maxsize=1 << 16)
+def orbit(p, v, size):
+    """Positions along one axis at t = 0 .. size - 1, after which they repeat."""
+    return tuple((p + v * t) % size for t in range(size))
+
+
+def part2(robots, max_time=10000, width=WIDTH, height=HEIGHT, run=10):
+    """
+    Earliest time some row holds run robots side by side, or -1. x only
+    depends on time mod width and y on time mod height, so both are
+    tabulated once per axis from the cached orbits, which other inputs
+    with the same robots reuse; rows with fewer than run robots are skipped.
+    In parallel, ranges of times are searched a wave of chunks at a time,
+    stopping after the first wave that finds one.
+    """
+    if not robots[0]:
+        return -1
+    tables = timetables(robots, width, height, run)
+    chunks = parallel.chunked(range(max_time))
+    found, checked = -1, 0
+    for wave in range(0, len(chunks), parallel.workers):
+        batch = chunks[wave:wave + parallel.workers]
+        for t, rows in parallel.run_chunks(first_run, tables, batch, offset=wave):
+            checked += rows
+            if found < 0 <= t:
+                found = t
+        if found >= 0:
+            break
+    if counters.enabled:
+        counters.add('rows_checked', checked)
+    return found
+
+
+def timetables(robots, width=WIDTH, height=HEIGHT, run=10):
+    """Per-axis positions of every robot at each time mod width or height, for first_run."""
+    px, py, vx, vy = robots
+    xs_at = list(zip(*map(orbit, px, vx, [width] * len(px))))
+    ys_at = list(zip(*map(orbit, py, vy, [height] * len(py))))
+    return xs_at, ys_at, width, height, run
+
+
+def first_run(tables, times):
+    """
+    (earliest time in times with a run or -1, crowded rows checked). The
+    times tried are counted as 'timesteps', 1024 at a time as progress.
+    """
+    xs_at, ys_at, width, height, run = tables
+    checked = steps = 0
+    for t in times:
+        steps += 1
+        if steps == 1024 and counters.enabled:
+            counters.add('timesteps', steps)
+            steps = 0
+        ys = ys_at[t % height]
+        crowded = {y for y, count in Counter(ys).items() if count >= run}
+        if not crowded:
+            continue
+        checked += len(crowded)
+        rows = {y: [] for y in crowded}
+        for x, y in zip(xs_at[t % width], ys):
+            if y in rows:
+                rows[y].append(x)
+        if any(has_run(sorted(xs), run) for xs in rows.values()):
+            break
+    else:
+        t = -1
+    if counters.enabled:
+        counters.add('timesteps', steps)
+    return t, checked
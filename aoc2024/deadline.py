@@ -0,0 +1,190 @@
+"""
+Run solvers in worker processes under per-job deadlines, driven by asyncio.
+
+    python -m aoc2024 6 7 14 --timeout 30 -j 4
+    python -m aoc2024 -i huge.txt --timeout 5 --timeout 7/2=60
+
+Every job gets a process of its own, so a job that overruns its deadline
+is terminated without holding up the rest of the batch, and is reported
+as a TimeoutError result. With counting on, the worker sends a snapshot
+of the work counters every PROGRESS_INTERVAL seconds; the fast engines
+count as they go (day 6 candidates, day 7 branches, day 14 timesteps), so
+a timed-out result carries how far it got. Workers are not daemonic, so
+--parallel still splits searches inside them. At most `workers` jobs run
+at once, started longest-first by recorded runtime. With checkpointing on,
+a terminated worker saves its checkpoint, so rerunning with a longer
+deadline picks up where the timed-out run stopped.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import checkpoint, counters, history
+from .pool import Summary, _job
+from .registry import Solver
+from .runner import Result
+
+PROGRESS_INTERVAL = 0.5
+
+# Seconds a terminated worker gets to exit before it is killed
+GRACE = 1.0
+
+
+def _worker(conn, solver: Solver, input_path, trace_memory: bool, engine: str,
+            parse_cache: bool, count: bool, checkpoint_every: Optional[float]) -> None:
+    """Child process: stream counter snapshots when counting, then send the Result."""
+    # A terminated worker saves its checkpoint on the way out
+    checkpoint.configure(checkpoint_every)
+    lock, done = threading.Lock(), threading.Event()
+
+    def send(message):
+        with lock:
+            conn.send(message)
+
+    def report():
+        while not done.wait(PROGRESS_INTERVAL):
+            send(('progress', counters.snapshot()))
+
+    if count:
+        threading.Thread(target=report, daemon=True).start()
+    try:
+        result = _job(solver, input_path, trace_memory, engine, parse_cache, count)
+    finally:
+        done.set()
+    send(('result', result))
+    conn.close()
+
+
+async def _supervise(solver: Solver, input_path, timeout: Optional[float],
+                     trace_memory: bool, engine: str, parse_cache: bool, count: bool,
+                     slots: asyncio.Semaphore) -> Result:
+    """Run one job in its own process and enforce its deadline."""
+    async with slots:
+        loop = asyncio.get_running_loop()
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_worker, args=(sender, solver, input_path, trace_memory, engine, parse_cache,
+                                  count, checkpoint.interval if checkpoint.enabled else None))
+        messages: asyncio.Queue = asyncio.Queue()
+
+        def readable():
+            try:
+                messages.put_nowait(receiver.recv())
+            except (EOFError, OSError):
+                loop.remove_reader(receiver.fileno())
+                messages.put_nowait(None)
+
+        start = time.perf_counter()
+        process.start()
+        sender.close()
+        loop.add_reader(receiver.fileno(), readable)
+        progress = None
+        try:
+            deadline = None if timeout is None else start + timeout
+            while True:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                try:
+                    message = await asyncio.wait_for(messages.get(), remaining)
+                except asyncio.TimeoutError:
+                    return Result(solver.day, solver.part, str(input_path or solver.default_input),
+                                  engine, solve_seconds=time.perf_counter() - start,
+                                  error=f'TimeoutError: no answer within {timeout:g}s',
+                                  counters=progress or None)
+                if message is None:
+                    await loop.run_in_executor(None, process.join)
+                    return Result(solver.day, solver.part, str(input_path or solver.default_input),
+                                  engine, solve_seconds=time.perf_counter() - start,
+                                  error=f'WorkerDied: exit code {process.exitcode}',
+                                  counters=progress or None)
+                kind, payload = message
+                if kind == 'result':
+                    return payload
+                progress = payload
+        finally:
+            # Also reached when the supervising task is cancelled
+            loop.remove_reader(receiver.fileno())
+            receiver.close()
+            if process.is_alive():
+                process.terminate()
+                await loop.run_in_executor(None, process.join, GRACE)
+                if process.is_alive():
+                    process.kill()
+            await loop.run_in_executor(None, process.join)
+
+
+async def run_deadlines(solvers: list[Solver], input_path: Optional[Path] = None,
+                        timeouts: Optional[dict[str, float]] = None,
+                        timeout: Optional[float] = None, trace_memory: bool = False,
+                        engine: str = 'reference', workers: Optional[int] = None,
+                        parse_cache: bool = False, count: bool = False,
+                        on_result: Optional[Callable[[Result], None]] = None) -> list[Result]:
+    """
+    Run solvers with at most workers at a time, each within its own
+    deadline: timeouts['DAY/PART'] if given, else timeouts['DAY'], else
+    timeout (None waits forever). Results are passed to on_result as they
+    finish and returned in completion order. With count, timed-out results
+    carry the last progress snapshot. Cancelling the task terminates every
+    worker.
+    """
+    timeouts = timeouts or {}
+    slots = asyncio.Semaphore(workers or os.cpu_count() or 1)
+    order = history.longest_first(solvers, engine, history.load())
+    tasks = [asyncio.create_task(_supervise(s, input_path,
+                                            timeouts.get(s.key, timeouts.get(str(s.day), timeout)),
+                                            trace_memory, engine, parse_cache, count, slots))
+             for s in order]
+    results = []
+    try:
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            results.append(result)
+            if on_result:
+                on_result(result)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results
+
+
+def run_batch(solvers: list[Solver], input_path: Optional[Path] = None,
+              timeouts: Optional[dict[str, float]] = None, timeout: Optional[float] = None,
+              trace_memory: bool = False, engine: str = 'reference',
+              workers: Optional[int] = None,
+              on_result: Optional[Callable[[Result], None]] = None,
+              cache=None, parse_cache: bool = False, count: bool = False) -> Summary:
+    """
+    pool.run_batch with deadlines: cached answers are reported up front,
+    the rest run under run_deadlines, and runtimes of the jobs that
+    finished are recorded.
+    """
+    summary = Summary(workers or os.cpu_count() or 1)
+    start = time.perf_counter()
+    todo = {}
+    for solver in solvers:
+        hit = cache.get(solver, input_path, engine) if cache is not None else None
+        if hit is None:
+            todo[solver.day, solver.part] = solver
+            continue
+        summary.results.append(hit)
+        if on_result:
+            on_result(hit)
+
+    def finished(result):
+        if cache is not None:
+            cache.put(todo[result.day, result.part], result)
+        summary.results.append(result)
+        if on_result:
+            on_result(result)
+
+    asyncio.run(run_deadlines(list(todo.values()), input_path, timeouts, timeout,
+                              trace_memory, engine, summary.workers, parse_cache, count,
+                              finished))
+    summary.wall_seconds = time.perf_counter() - start
+    history.record(summary.results)
+    return summary
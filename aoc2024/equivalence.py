@@ -0,0 +1,168 @@
+"""
+Differential check of the fast engines against the reference solvers.
+
+    python -m aoc2024.equivalence
+    python -m aoc2024.equivalence 7 9/1 13 -n 5000 --budget 60
+
+The reference solvers are the specification: every part with a fast
+engine is run on both engines over many small generated inputs, and any
+difference in answer (or an error on one side only) is a mismatch. Each
+case is one (size, seed) of aoc2024.generate, drawn from the day's small
+size range in SIZES, so a mismatch can be reproduced with
+
+    python -m aoc2024.generate DAY SIZE -s SEED
+
+Inputs on which both engines raise are not valid puzzles and are counted
+as skipped. Parse plus solve time is summed per engine, and the ratio is
+reported as the speedup on small inputs (use aoc2024.bench for scaling).
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from .generate import stream
+from .registry import Solver, discover, fast_engine, select
+from .runner import run
+
+CASES = 1000
+BUDGET = 30.0
+
+# Small size ranges per day (rows, bytes, digits or grid side; see
+# aoc2024.generate), kept small enough for the reference solvers. Day 9
+# starts at 2 digits: day9/2 raises on a disk map of a single file.
+SIZES = {
+    1: (1, 40), 2: (1, 40), 3: (1, 400), 4: (1, 12), 5: (1, 20), 6: (2, 12),
+    7: (1, 4), 8: (1, 12), 9: (2, 40), 10: (1, 12), 11: (1, 3), 12: (1, 12),
+    13: (1, 20), 14: (1, 8),
+}
+
+
+@dataclass
+class Mismatch:
+    size: int
+    seed: int
+    reference: Any
+    fast: Any
+
+
+@dataclass
+class Report:
+    day: int
+    part: int
+    cases: int = 0
+    skipped: int = 0
+    reference_seconds: float = 0.0
+    fast_seconds: float = 0.0
+    mismatches: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> Optional[float]:
+        return self.reference_seconds / self.fast_seconds if self.fast_seconds else None
+
+    def to_dict(self) -> dict:
+        return asdict(self) | {'speedup': self.speedup}
+
+
+def _outcome(result):
+    return result.answer if result.error is None else result.error
+
+
+def compare(solver: Solver, cases: int = CASES, seed: int = 0,
+            budget: Optional[float] = BUDGET,
+            sizes: Optional[tuple[int, int]] = None) -> Report:
+    """
+    Run solver on both engines over up to cases generated inputs, stopping
+    early once budget seconds have passed. Case i uses seed + i and a size
+    drawn from sizes (default SIZES[day]).
+    """
+    if fast_engine(solver.day) is None:
+        raise ValueError(f'day {solver.day} has no fast engine')
+    low, high = sizes or SIZES[solver.day]
+    report = Report(solver.day, solver.part)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='aoc2024-') as tmp:
+        path = Path(tmp) / f'day{solver.day}-{solver.part}.txt'
+        for case_seed in range(seed, seed + cases):
+            if budget is not None and time.perf_counter() - start > budget:
+                break
+            size = random.Random(f'{solver.key}/{case_seed}').randint(low, high)
+            with open(path, 'w', encoding='us-ascii') as f:
+                f.writelines(stream(solver.day, size, case_seed))
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                reference = run(solver, path, trace_memory=False, engine='reference')
+                fast = run(solver, path, trace_memory=False, engine='fast')
+            report.cases += 1
+            if reference.error is not None and fast.error is not None:
+                report.skipped += 1
+                continue
+            report.reference_seconds += reference.parse_seconds + reference.solve_seconds
+            report.fast_seconds += fast.parse_seconds + fast.solve_seconds
+            if _outcome(reference) != _outcome(fast):
+                report.mismatches.append(Mismatch(size, case_seed, _outcome(reference),
+                                                  _outcome(fast)))
+    return report
+
+
+def format_report(report: Report, show: int = 5) -> str:
+    speedup = '-' if report.speedup is None else f'{report.speedup:.1f}x'
+    lines = [f'{report.day:>2}/{report.part}  {report.cases:>6} cases  '
+             f'{len(report.mismatches):>4} mismatches  {report.skipped:>4} skipped  '
+             f'reference {report.reference_seconds:8.3f}s  fast {report.fast_seconds:7.3f}s  '
+             f'speedup {speedup:>7}']
+    for m in report.mismatches[:show]:
+        lines.append(f'      size {m.size} seed {m.seed}: reference {m.reference!r}, '
+                     f'fast {m.fast!r}  (python -m aoc2024.generate {report.day} {m.size} '
+                     f'-s {m.seed})')
+    if len(report.mismatches) > show:
+        lines.append(f'      ... {len(report.mismatches) - show} more')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.equivalence',
+                                     description='Check fast engines against the reference '
+                                                 'solvers on generated inputs.')
+    parser.add_argument('solvers', nargs='*', metavar='DAY[/PART]',
+                        help='parts to check (default: every part with a fast engine)')
+    parser.add_argument('-n', '--cases', type=int, default=CASES,
+                        help=f'inputs per part (default {CASES})')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='first case seed')
+    parser.add_argument('--budget', type=float, default=BUDGET,
+                        help=f'seconds per part before stopping early (default {BUDGET:g}, '
+                             '0 for no limit)')
+    parser.add_argument('--sizes', type=int, nargs=2, metavar=('MIN', 'MAX'),
+                        help='size range for every day instead of SIZES')
+    parser.add_argument('--show', type=int, default=5, metavar='N',
+                        help='mismatches listed per part (default 5)')
+    parser.add_argument('--json', action='store_true', help='print reports as JSON')
+    args = parser.parse_args(argv)
+
+    try:
+        solvers = select(discover(), args.solvers)
+    except ValueError as e:
+        print(f'aoc2024.equivalence: {e}', file=sys.stderr)
+        return 2
+    solvers = [s for s in solvers if fast_engine(s.day) is not None]
+
+    reports = []
+    for solver in solvers:
+        report = compare(solver, args.cases, args.seed, args.budget or None, args.sizes)
+        reports.append(report)
+        if not args.json:
+            print(format_report(report, args.show), flush=True)
+    if args.json:
+        print(json.dumps([r.to_dict() for r in reports], indent=2, default=str))
+    return 1 if any(r.mismatches for r in reports) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
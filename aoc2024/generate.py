@@ -0,0 +1,303 @@
+"""
+Seeded generators for puzzle inputs of any size.
+
+Each generator takes a size n and a random.Random and yields the input
+text in chunks, so multi-gigabyte inputs can be streamed to disk. What n
+means depends on the day:
+
+    rows/records  days 1, 2, 5 (updates), 7, 11 (stones), 13, 14 (robots)
+    bytes         day 3
+    side length   days 4, 6, 8, 10, 12 (n x n grid)
+    digits        day 9
+
+The same (day, n, seed) always produces the same input.
+
+    python -m aoc2024.generate 9 1000000 -o disk.txt
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Iterator
+
+ROWS_PER_CHUNK = 4096
+
+Generator = Callable[[int, random.Random], Iterator[str]]
+
+
+def _chunked(lines: Iterator[str]) -> Iterator[str]:
+    """Join generated lines into larger chunks for cheaper writes."""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= ROWS_PER_CHUNK:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+def _grid_rows(n: int, cell: Callable[[int, int], str]) -> Iterator[str]:
+    for y in range(n):
+        yield ''.join(cell(x, y) for x in range(n)) + '\n'
+
+
+def day1(n, rng):
+    """Two columns of location ids; some right ids repeat left ones."""
+    left = [rng.randint(10000, 99999) for _ in range(n)]
+    for value in left:
+        right = rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999)
+        yield f'{value}   {right}\n'
+
+
+def day2(n, rng):
+    """Reports of 5-8 levels, roughly half of them safe."""
+    for _ in range(n):
+        step = rng.choice((-1, 1))
+        levels = [rng.randint(25, 75)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + step * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] += rng.choice((-4, 0, 4))
+        yield ' '.join(map(str, levels)) + '\n'
+
+
+NOISE = "!@#$%^&*()[]{}<>-+=?:;',. whowhatfromselectwhen"
+INSTRUCTIONS = ('mul({},{})', 'mul({},{})', 'mul({},{})', 'do()', "don't()",
+                'mul({} ,{})', 'mul[{},{}]', 'mul({},{}!')
+
+
+def day3(n, rng):
+    """Corrupted memory of about n bytes with valid and broken instructions."""
+    size = 0
+    line = []
+    while size < n:
+        if rng.random() < 0.25:
+            token = rng.choice(INSTRUCTIONS).format(rng.randint(1, 999), rng.randint(1, 999))
+        else:
+            token = ''.join(rng.choice(NOISE) for _ in range(rng.randint(1, 8)))
+        line.append(token)
+        size += len(token)
+        if len(line) >= 500:
+            yield ''.join(line) + '\n'
+            size += 1
+            line = []
+    if line:
+        yield ''.join(line) + '\n'
+
+
+def day4(n, rng):
+    """n x n word search over the letters of XMAS."""
+    return _grid_rows(n, lambda x, y: rng.choice('XMAS'))
+
+
+def day5(n, rng):
+    """Ordering rules over 49 pages followed by n updates."""
+    pages = rng.sample(range(10, 100), 49)
+    rank = {page: i for i, page in enumerate(pages)}
+    rules = [(a, b) for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    for a, b in rules:
+        yield f'{a}|{b}\n'
+    yield '\n'
+    for _ in range(n):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        yield ','.join(map(str, update)) + '\n'
+
+
+def _patrol_length(grid, x, y):
+    """Steps the guard takes from (x, y) facing up, or None if the patrol loops."""
+    n = len(grid)
+    dx, dy = 0, -1
+    seen = set()
+    while True:
+        if (x, y, dx, dy) in seen:
+            return None
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < n and 0 <= ny < n):
+            return len(seen)
+        if grid[ny][nx] == '#':
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+
+
+def day6(n, rng):
+    """
+    n x n lab with ~5% obstructions and a guard whose patrol leaves the map.
+    The longest of a few sampled escaping patrols is used so the path
+    grows with the map instead of exiting after a handful of steps.
+    """
+    grid = [['#' if rng.random() < 0.05 else '.' for _ in range(n)] for _ in range(n)]
+    best, start, tries = 0, None, 0
+    while start is None or (tries < 50 and best < 4 * n):
+        tries += 1
+        x, y = rng.randrange(n), rng.randrange(n)
+        steps = _patrol_length(grid, x, y) if grid[y][x] == '.' else None
+        if steps is not None and steps > best:
+            best, start = steps, (x, y)
+    x, y = start
+    grid[y][x] = '^'
+    for row in grid:
+        yield ''.join(row) + '\n'
+
+
+def day7(n, rng, max_operands=12, min_operands=2):
+    """n equations of min..max_operands operands, about half of them solvable."""
+    for _ in range(n):
+        numbers = [rng.randint(1, 99) for _ in range(rng.randint(min_operands, max_operands))]
+        value = numbers[0]
+        for num in numbers[1:]:
+            op = rng.randrange(3)
+            value = value + num if op == 0 else value * num if op == 1 else int(f'{value}{num}')
+        if rng.random() < 0.5:
+            value += rng.randint(1, 9)
+        yield f'{value}: ' + ' '.join(map(str, numbers)) + '\n'
+
+
+FREQUENCIES = '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def day8(n, rng):
+    """n x n map where ~8% of cells hold an antenna."""
+    return _grid_rows(n, lambda x, y: rng.choice(FREQUENCIES) if rng.random() < 0.08 else '.')
+
+
+def day9(n, rng):
+    """Dense disk map of n digits (rounded up to odd) ending with a file."""
+    n |= 1
+    digits = []
+    for i in range(n):
+        digits.append(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)))
+        if len(digits) >= ROWS_PER_CHUNK:
+            yield ''.join(digits)
+            digits = []
+    yield ''.join(digits) + '\n'
+
+
+def day10(n, rng):
+    """n x n topographic map with long gradual slopes."""
+    prev = None
+    for _ in range(n):
+        row = []
+        for x in range(n):
+            roll = rng.random()
+            if prev is not None and roll < 0.4:
+                height = (prev[x] + 1) % 10
+            elif row and roll < 0.8:
+                height = (row[-1] + 1) % 10
+            else:
+                height = rng.randrange(10)
+            row.append(height)
+        prev = row
+        yield ''.join(map(str, row)) + '\n'
+
+
+def day11(n, rng):
+    """n engraved stones on a single line."""
+    yield ' '.join(str(rng.randint(0, 999999)) for _ in range(n)) + '\n'
+
+
+def day12(n, rng):
+    """n x n garden of blocky regions with some stray plants."""
+    block = 6
+    plants = [[rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(n // block + 1)]
+              for _ in range(n // block + 1)]
+
+    def cell(x, y):
+        if rng.random() < 0.1:
+            return rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+        return plants[y // block][x // block]
+    return _grid_rows(n, cell)
+
+
+def day13(n, rng):
+    """n claw machines, about a third reachable within 100 presses."""
+    for i in range(n):
+        a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.35:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            prize_x, prize_y = a * a_x + b * b_x, a * a_y + b * b_y
+        else:
+            prize_x, prize_y = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        if i:
+            yield '\n'
+        yield (f'Button A: X+{a_x}, Y+{a_y}\n'
+               f'Button B: X+{b_x}, Y+{b_y}\n'
+               f'Prize: X={prize_x}, Y={prize_y}\n')
+
+
+def day14(n, rng, width=101, height=103):
+    """n robots on the 101x103 floor; 12 of them line up at one hidden time."""
+    planted = min(n, 12)
+    when = rng.randrange(1, 10000)
+    row, start = rng.randrange(height), rng.randrange(width - planted)
+    for i in range(n):
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        if i < planted:
+            px = (start + i - vx * when) % width
+            py = (row - vy * when) % height
+        else:
+            px, py = rng.randrange(width), rng.randrange(height)
+        yield f'p={px},{py} v={vx},{vy}\n'
+
+
+GENERATORS: dict[int, Generator] = {
+    1: day1, 2: day2, 3: day3, 4: day4, 5: day5, 6: day6, 7: day7,
+    8: day8, 9: day9, 10: day10, 11: day11, 12: day12, 13: day13, 14: day14,
+}
+
+
+def _rng(day: int, n: int, seed: int) -> random.Random:
+    return random.Random(f'aoc2024-day{day}-{n}-{seed}')
+
+
+def stream(day: int, n: int, seed: int = 0) -> Iterator[str]:
+    """Yield the generated input for day in text chunks."""
+    if day not in GENERATORS:
+        raise ValueError(f'no generator for day {day}')
+    return _chunked(GENERATORS[day](n, _rng(day, n, seed)))
+
+
+def generate(day: int, n: int, seed: int = 0) -> str:
+    """Return the generated input for day as one string."""
+    return ''.join(stream(day, n, seed))
+
+
+def write_input(day: int, n: int, seed: int = 0, directory: Path = Path('.')) -> Path:
+    """Write the generated input to directory, reusing an existing file."""
+    path = Path(directory) / f'day{day}-n{n}-s{seed}.txt'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='us-ascii') as f:
+            for chunk in stream(day, n, seed):
+                f.write(chunk)
+        tmp.replace(path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.generate',
+                                     description='Write a seeded synthetic puzzle input.')
+    parser.add_argument('day', type=int)
+    parser.add_argument('size', type=int, help='rows, bytes, digits or grid side (see module docs)')
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='output file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    chunks = stream(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='us-ascii') as f:
+            f.writelines(chunks)
+    else:
+        sys.stdout.writelines(chunks)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,204 @@
+"""
+Compact directed graphs over integer node ids, shared by the rule and grid days.
+
+A CSR (compressed sparse row) graph keeps every edge target in one flat
+array, node v's targets being targets[offsets[v]:offsets[v + 1]], so a
+graph costs two machine-int arrays instead of a dict of sets per node.
+Grid graphs use the cell indices of aoc2024.grid as node ids, and non-cell
+indices simply have no edges.
+
+Traversals are iterative and mark visited nodes in an aoc2024.coords.Stamps set, which
+callers can pass in to reuse across many searches of the same graph:
+clearing it is O(1).
+"""
+
+from array import array
+from itertools import accumulate, chain, compress
+from typing import Iterable, Optional
+
+from .coords import Stamps
+from .grid import SENTINEL
+
+
+class CSR:
+    """Directed graph on nodes 0 .. n - 1 in compressed sparse row form."""
+
+    __slots__ = ('offsets', 'targets')
+
+    def __init__(self, offsets: array, targets: array):
+        self.offsets, self.targets = offsets, targets
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[tuple[int, int]]) -> 'CSR':
+        """Graph with the given (source, target) edges, by counting sort."""
+        edges = list(edges)
+        degree = [0] * n
+        for source, _ in edges:
+            degree[source] += 1
+        offsets = array('i', accumulate(degree, initial=0))
+        fill = offsets[:-1]
+        targets = array('i', bytes(4 * len(edges)))
+        for source, target in edges:
+            targets[fill[source]] = target
+            fill[source] += 1
+        return cls(offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edges(self) -> int:
+        return len(self.targets)
+
+    def neighbours(self, v: int) -> array:
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+
+def _stamps(graph: CSR, seen: Optional[Stamps]) -> tuple[array, int]:
+    """Stamp buffer and epoch of a cleared seen set (a new one if None)."""
+    if seen is None:
+        seen = Stamps(len(graph))
+    else:
+        seen.clear()
+    return seen.stamps, seen.epoch
+
+
+def dfs(graph: CSR, start: int, seen: Optional[Stamps] = None) -> list[int]:
+    """Nodes reachable from start in depth-first preorder; seen is cleared first."""
+    offsets, targets = graph.offsets, graph.targets
+    stamps, epoch = _stamps(graph, seen)
+    stamps[start] = epoch
+    order, stack = [], [start]
+    while stack:
+        v = stack.pop()
+        order.append(v)
+        for w in targets[offsets[v]:offsets[v + 1]]:
+            if stamps[w] != epoch:
+                stamps[w] = epoch
+                stack.append(w)
+    return order
+
+
+def bfs(graph: CSR, start: int, seen: Optional[Stamps] = None) -> list[int]:
+    """Nodes reachable from start in breadth-first order; seen is cleared first."""
+    offsets, targets = graph.offsets, graph.targets
+    stamps, epoch = _stamps(graph, seen)
+    stamps[start] = epoch
+    queue = [start]
+    for v in queue:
+        for w in targets[offsets[v]:offsets[v + 1]]:
+            if stamps[w] != epoch:
+                stamps[w] = epoch
+                queue.append(w)
+    return queue
+
+
+def components(graph: CSR, nodes: Optional[Iterable[int]] = None) -> tuple[array, int]:
+    """
+    Label the nodes reachable from nodes (default: all) by component, for a
+    graph whose edges go both ways. Returns (labels, count), where labels
+    is -1 for nodes that were never reached.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    labels = array('i', [-1]) * len(graph)
+    count = 0
+    for start in range(len(graph)) if nodes is None else nodes:
+        if labels[start] != -1:
+            continue
+        labels[start] = count
+        stack = [start]
+        while stack:
+            v = stack.pop()
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                if labels[w] == -1:
+                    labels[w] = count
+                    stack.append(w)
+        count += 1
+    return labels, count
+
+
+class TopologicalSorter:
+    """
+    Kahn's algorithm over subsets of one graph's nodes. Neighbour sets and
+    the in-degree buffer are built once per graph and reused by every sort.
+    """
+
+    def __init__(self, graph: CSR):
+        self.graph = graph
+        self.indegree = array('i', bytes(4 * len(graph)))
+        offsets, targets = graph.offsets, graph.targets
+        self.successors = [frozenset(targets[offsets[v]:offsets[v + 1]])
+                           for v in range(len(graph))]
+        predecessors = [[] for _ in range(len(graph))]
+        for v, after in enumerate(self.successors):
+            for w in after:
+                predecessors[w].append(v)
+        self.predecessors = [frozenset(before) for before in predecessors]
+        # Without two-way edges, distinct in-degrees 0 .. k - 1 within k
+        # nodes make them a transitive tournament: one order, by in-degree
+        self.antisymmetric = not any(v in self.successors[w]
+                                     for v, after in enumerate(self.successors)
+                                     for w in after)
+
+    def sort(self, nodes: Iterable[int]) -> list[int]:
+        """
+        nodes ordered so every edge between two of them points forward.
+        Nodes that become free together keep their order in nodes when they
+        start free, and otherwise follow the order they were freed in.
+        Raises ValueError on a cycle.
+        """
+        predecessors, indegree = self.predecessors, self.indegree
+        nodes = list(nodes)
+        members = set(nodes)
+        for v in nodes:
+            indegree[v] = len(predecessors[v] & members)
+        if self.antisymmetric:
+            order = sorted(nodes, key=indegree.__getitem__)
+            if all(indegree[v] == i for i, v in enumerate(order)):
+                return order
+        successors = self.successors
+        order = [v for v in nodes if not indegree[v]]
+        for v in order:
+            for w in successors[v] & members:
+                indegree[w] -= 1
+                if not indegree[w]:
+                    order.append(w)
+        if len(order) < len(nodes):
+            raise ValueError(f'cycle among nodes {nodes}')
+        return order
+
+
+_ZERO_TO_ONE = bytes([1]) + bytes(255)
+
+
+def _matches(sources: bytes, targets: bytes) -> bytes:
+    """1 where the two equal-length byte strings agree, else 0, without a Python loop."""
+    diff = int.from_bytes(sources, 'big') ^ int.from_bytes(targets, 'big')
+    return diff.to_bytes(len(sources), 'big').translate(_ZERO_TO_ONE)
+
+
+def grid_graph(grid, rise: int = 0) -> CSR:
+    """
+    Graph on grid cell indices with an edge from each cell to every
+    orthogonal neighbour whose value is rise higher: rise=0 joins equal
+    neighbours both ways (regions), rise=1 gives day 10's uphill steps.
+    Non-cell indices get no edges.
+    """
+    cells, size = bytes(grid.cells), len(grid.cells)
+    # Sentinels become values no real cell can match on either side
+    shift = bytes((v + rise) % 256 for v in range(256))
+    shift = shift[:SENTINEL] + b'\xff' + shift[SENTINEL + 1:]
+    mark = bytes(range(256))[:SENTINEL] + b'\xfe' + bytes(range(256))[SENTINEL + 1:]
+    expected = cells.translate(shift)
+    masks = []
+    for d in grid.orthogonal:
+        if d > 0:
+            neighbour = cells[d:].ljust(size, b'\xfe')
+        else:
+            neighbour = cells[:max(size + d, 0)].rjust(size, b'\xfe')
+        masks.append(_matches(expected, neighbour.translate(mark)))
+    # Edges in node order, each node's in orthogonal order
+    candidates = chain.from_iterable(zip(*(range(d, size + d) for d in grid.orthogonal)))
+    targets = array('i', compress(candidates, chain.from_iterable(zip(*masks))))
+    degree = sum(int.from_bytes(mask, 'big') for mask in masks).to_bytes(size, 'big')
+    return CSR(array('i', accumulate(degree, initial=0)), targets)
@@ -0,0 +1,120 @@
+"""
+Flat, byte-backed character grids shared by the grid days.
+
+MappedGrid memory-maps the input file and reads the cells in place,
+addressed by a single row-major index
+
+    index = (y + pad) * stride + x
+
+with stride = width + 1, so moving one row is +/- stride. The newline
+ending each row is SENTINEL, the border to the left and right, which no
+puzzle cell contains. A mapped file has no border above the first row or
+below the last (pad = 0), which suits searches that never step past a
+row end. Loops that walk or look up to n rows off the map load the grid
+with pad=n instead: the text is copied once, between n rows of sentinel,
+so every step within n rows reads a sentinel and needs no bounds check.
+"""
+
+import mmap
+import os
+from typing import Iterator
+
+SENTINEL = ord('\n')
+
+
+class MappedGrid:
+    """Read-only character grid over a memory-mapped file; see the module docstring."""
+
+    __slots__ = ('width', 'height', 'stride', 'pad', 'cells', 'orthogonal', 'diagonal', 'around')
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            try:
+                cells = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError('empty grid') from None
+        self._wrap(cells, path)
+
+    def _wrap(self, cells, name, pad=0):
+        width = cells.find(b'\n')
+        if width == -1:
+            width = len(cells)
+        # The last row may or may not end with a newline
+        height = (len(cells) + 1) // (width + 1)
+        if width == 0 or len(cells) not in (height * (width + 1) - 1, height * (width + 1)):
+            raise ValueError(f'{name} is not a rectangular grid')
+        stride = width + 1
+        if pad:
+            border = bytes([SENTINEL]) * (stride * pad)
+            ending = b'' if len(cells) == height * stride else b'\n'
+            cells = b''.join((border, cells, ending, border))
+        self.cells = cells
+        self.width, self.height, self.stride, self.pad = width, height, stride, pad
+
+        # Neighbour offsets; orthogonal is clockwise starting from up
+        self.orthogonal = (-stride, 1, stride, -1)
+        self.diagonal = (-stride - 1, -stride + 1, stride + 1, stride - 1)
+        self.around = (-stride - 1, -stride, -stride + 1, 1,
+                       stride + 1, stride, stride - 1, -1)
+
+    @classmethod
+    def from_text(cls, text, pad: int = 0) -> 'MappedGrid':
+        """Lay out str or bytes like a mapped file of that text, between pad sentinel rows."""
+        if isinstance(text, str):
+            text = text.encode('us-ascii')
+        grid = cls.__new__(cls)
+        grid._wrap(bytes(text), 'text', pad)
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.pad) * self.stride + x
+
+    def xy(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x, y - self.pad
+
+    def __getitem__(self, xy: tuple[int, int]) -> int:
+        return self.cells[self.index(*xy)]
+
+    def __contains__(self, index: int) -> bool:
+        """True if index is a real cell rather than border."""
+        return 0 <= index < len(self.cells) and self.cells[index] != SENTINEL
+
+    def row(self, y: int) -> bytes:
+        start = self.index(0, y)
+        return bytes(self.cells[start:start + self.width])
+
+    def interior(self) -> Iterator[int]:
+        """Indices of every real cell, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def positions(self, value: int) -> Iterator[int]:
+        """Indices of every cell holding value, found with a buffer search."""
+        cells, needle = self.cells, bytes((value,))
+        i = cells.find(needle)
+        while i != -1:
+            yield i
+            i = cells.find(needle, i + 1)
+
+    def find(self, value: int) -> int:
+        """Index of the first cell holding value, or -1."""
+        return self.cells.find(bytes((value,)))
+
+    def __str__(self) -> str:
+        return '\n'.join(self.row(y).decode('us-ascii') for y in range(self.height))
+
+
+def load_grid(source, pad: int = 0) -> MappedGrid:
+    """
+    MappedGrid of a path, or of the puzzle text given as str or bytes;
+    as with parsing.read, only os.PathLike objects are treated as paths.
+    A path is mapped in place unless pad rows are asked for.
+    """
+    if isinstance(source, os.PathLike):
+        if not pad:
+            return MappedGrid(source)
+        with open(source, 'rb') as f:
+            source = f.read()
+    return MappedGrid.from_text(source, pad)
@@ -0,0 +1,56 @@
+"""
+Recorded solver runtimes, used to schedule the slowest jobs first.
+
+Runtimes are kept per engine and solver in .aoc2024/history.json as an
+exponential moving average of parse + solve seconds.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Iterable
+
+from .registry import WORK_DIR, Solver
+
+HISTORY_FILE = WORK_DIR / 'history.json'
+SMOOTHING = 0.5
+
+
+def _key(engine: str, day: int, part: int) -> str:
+    return f'{engine}:{day}/{part}'
+
+
+def load(path: Path = HISTORY_FILE) -> dict[str, float]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def record(results: Iterable, path: Path = HISTORY_FILE) -> dict[str, float]:
+    """Fold successful results into the stored history and save it."""
+    history = load(path)
+    for result in results:
+        if result.error or result.cached:
+            continue
+        key = _key(result.engine, result.day, result.part)
+        seconds = result.parse_seconds + result.solve_seconds
+        old = history.get(key)
+        history[key] = seconds if old is None else old + SMOOTHING * (seconds - old)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    tmp.replace(path)
+    return history
+
+
+def estimate(history: dict[str, float], solver: Solver, engine: str) -> float:
+    """Expected seconds for solver; unknown solvers count as slowest."""
+    return history.get(_key(engine, solver.day, solver.part), math.inf)
+
+
+def longest_first(solvers: list[Solver], engine: str,
+                  history: dict[str, float]) -> list[Solver]:
+    return sorted(solvers, key=lambda s: estimate(history, s, engine), reverse=True)
@@ -0,0 +1,60 @@
+"""
+Quiet-by-default, buffered logging for the solvers.
+
+Solvers log under the 'aoc2024' logger: reference scripts as
+'aoc2024.dayN.partP', fast engines under their module names. Nothing is
+shown unless a level is configured (python -m aoc2024 --log debug), and
+hot loops check the level once up front rather than formatting a message
+per item:
+
+    log = logging.getLogger('aoc2024.day3.part1')
+    debug = log.isEnabledFor(logging.DEBUG)
+    for x, y in matches:
+        ...
+        if debug:
+            log.debug('mul(%s,%s) = %s', x, y, result)
+
+Configured records are held in a MemoryHandler and written to stderr
+BUFFER at a time (straight away for errors), so chatty solvers do not pay
+for a terminal write per line.
+"""
+
+import logging
+import sys
+from logging.handlers import MemoryHandler
+from typing import Optional, TextIO
+
+LOGGER = 'aoc2024'
+LEVELS = ('debug', 'info', 'warning', 'error')
+FORMAT = '%(levelname)s %(name)s: %(message)s'
+
+# Records buffered before a write
+BUFFER = 1024
+
+_logger = logging.getLogger(LOGGER)
+_logger.addHandler(logging.NullHandler())
+_logger.propagate = False
+_handler: Optional[MemoryHandler] = None
+
+
+def configure(level: Optional[str], stream: TextIO = sys.stderr, buffer: int = BUFFER) -> None:
+    """Show records at level and above on stream, buffered; None is silent."""
+    global _handler
+    if _handler is not None:
+        _logger.removeHandler(_handler)
+        _handler.close()
+        _handler = None
+    if level is None:
+        _logger.setLevel(logging.WARNING)
+        return
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter(FORMAT))
+    _handler = MemoryHandler(buffer, flushLevel=logging.ERROR, target=target)
+    _logger.addHandler(_handler)
+    _logger.setLevel(level.upper())
+
+
+def flush() -> None:
+    """Write out anything buffered."""
+    if _handler is not None:
+        _handler.flush()
@@ -0,0 +1,138 @@
+"""
+Attribute a solver's peak memory to the lines that allocated it.
+
+While the solver runs, a watcher thread samples tracemalloc and takes a
+snapshot each time traced memory climbs past the largest sample so far.
+The last snapshot approximates the heap at the peak; its live blocks are
+grouped by the innermost repository line that allocated them (so a list
+grown inside a solver loop is charged to that loop, not to list.append),
+which is usually enough to name the structure responsible.
+
+The memory held by the snapshots themselves is subtracted from the
+reported peak. Peaks shorter than the sampling interval are still
+counted in the peak but may be missing from the attribution.
+"""
+
+import linecache
+import resource
+import threading
+import tracemalloc
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .registry import ROOT, Solver
+from .runner import Result, run
+
+INTERVAL = 0.005
+FRAMES = 16
+# Sample again only once traced memory grows by this fraction
+GROWTH = 1.05
+
+_OWN_FILES = (str(Path(__file__)), tracemalloc.__file__, threading.__file__)
+
+
+@dataclass
+class Allocation:
+    """Live memory at the peak charged to one source line."""
+    site: str
+    code: str
+    bytes: int
+    blocks: int
+
+
+@dataclass
+class MemoryReport:
+    """Peak memory of one solver run and the lines holding it."""
+    result: Result
+    peak_bytes: int = 0
+    sampled_bytes: int = 0
+    max_rss_bytes: int = 0
+    allocations: list[Allocation] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return dict(self.result.to_dict(), peak_bytes=self.peak_bytes,
+                    sampled_bytes=self.sampled_bytes, max_rss_bytes=self.max_rss_bytes,
+                    allocations=[asdict(a) for a in self.allocations])
+
+
+class _Watcher(threading.Thread):
+    """Samples traced memory, snapshotting each new high."""
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.sampled = 0
+        self.peak = 0
+        self.overhead = 0
+
+    def sample(self):
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak - self.overhead)
+        if current - self.overhead > self.sampled * GROWTH:
+            self.snapshot = None
+            before = tracemalloc.get_traced_memory()[0]
+            self.snapshot = tracemalloc.take_snapshot()
+            self.overhead = tracemalloc.get_traced_memory()[0] - before
+            self.sampled = before
+            tracemalloc.reset_peak()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+
+def _site(traceback: tracemalloc.Traceback) -> Optional[tracemalloc.Frame]:
+    """Innermost frame in repository code, else the innermost frame."""
+    if traceback[-1].filename in _OWN_FILES:
+        return None
+    for frame in reversed(traceback):
+        if frame.filename.startswith(str(ROOT)) and frame.filename not in _OWN_FILES:
+            return frame
+    return traceback[-1]
+
+
+def attribute(snapshot: tracemalloc.Snapshot, top: int = 10) -> list[Allocation]:
+    """Group live blocks by allocating line, largest first."""
+    sizes, blocks = defaultdict(int), defaultdict(int)
+    for trace in snapshot.traces:
+        frame = _site(trace.traceback)
+        if frame is not None:
+            key = (frame.filename, frame.lineno)
+            sizes[key] += trace.size
+            blocks[key] += 1
+    allocations = []
+    for (filename, lineno), size in sorted(sizes.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        path = Path(filename)
+        site = path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else filename
+        allocations.append(Allocation(f'{site}:{lineno}', linecache.getline(filename, lineno).strip(),
+                                      size, blocks[filename, lineno]))
+    return allocations
+
+
+def measure(solver: Solver, input_path: Optional[Path] = None, engine: str = 'reference',
+            parse_cache: bool = False, top: int = 10, interval: float = INTERVAL) -> MemoryReport:
+    """Run one solver with tracemalloc and attribute its peak."""
+    watcher = _Watcher(interval)
+    tracemalloc.start(FRAMES)
+    try:
+        watcher.start()
+        result = run(solver, input_path, False, engine, parse_cache)
+        watcher.stopped.set()
+        watcher.join()
+        watcher.sample()
+        peak = max(watcher.peak, tracemalloc.get_traced_memory()[1] - watcher.overhead)
+        snapshot = watcher.snapshot
+    finally:
+        watcher.stopped.set()
+        tracemalloc.stop()
+
+    result.peak_bytes = peak
+    report = MemoryReport(result, peak, watcher.sampled,
+                          resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+    if snapshot is not None:
+        report.allocations = attribute(snapshot, top)
+    return report
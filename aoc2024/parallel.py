@@ -0,0 +1,133 @@
+"""
+Split a fast engine's independent sub-searches across CPUs.
+
+Parallelism is off unless configured (--parallel N on the command line).
+Engines split their work into chunks and hand them to run_chunks, which
+calls work(shared, chunk) for each chunk and returns the results in
+chunk order:
+
+    counts = parallel.run_chunks(count_loops, lab, parallel.chunked(candidates))
+
+How chunks run depends on the interpreter:
+
+    threads     free-threaded CPython (3.13t and later with the GIL off):
+                every thread reads the same shared data, nothing is copied
+    processes   GIL builds where fork is available: forked workers inherit
+                shared (including memory-mapped grids) without pickling it,
+                and only chunks and results cross the process boundary
+    serial      anywhere else, with one worker, inside a daemonic worker
+                process (which may not fork), or while work counters are
+                on, so the counters stay exact
+
+Chunk functions must not write to shared data; anything per-search (seen
+sets, stamp buffers) is allocated per chunk.
+
+Inside an aoc2024.checkpoint scope, chunked always makes checkpoint.CHUNKS
+chunks, even serially, and run_chunks skips chunks the checkpoint already
+holds and records each new result as it completes. Results must then be
+JSON-serialisable (tuples come back as lists).
+"""
+
+import multiprocessing
+import os
+import sys
+import sysconfig
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional, Sequence
+
+from . import checkpoint, counters
+
+FREE_THREADED = bool(sysconfig.get_config_var('Py_GIL_DISABLED')) and not getattr(
+    sys, '_is_gil_enabled', lambda: True)()
+
+# Chunks per worker, so uneven chunks still balance
+CHUNKS_PER_WORKER = 4
+
+workers = 1
+
+_shared: tuple = ()
+
+
+def configure(n: Optional[int]) -> None:
+    """Use n workers (0 or None: one per CPU; 1: run serially)."""
+    global workers
+    workers = n or os.cpu_count() or 1
+
+
+def mode() -> str:
+    """How run_chunks will execute: 'threads', 'processes' or 'serial'."""
+    if workers <= 1 or counters.enabled:
+        return 'serial'
+    if FREE_THREADED:
+        return 'threads'
+    if ('fork' in multiprocessing.get_all_start_methods()
+            and not multiprocessing.current_process().daemon):
+        return 'processes'
+    return 'serial'
+
+
+def chunked(items: Sequence, pieces: Optional[int] = None) -> list[Sequence]:
+    """
+    Split items into about pieces contiguous slices (default: a few per
+    worker, or one slice of everything when running serially; a fixed
+    number while checkpointing, so a resumed run splits the same way).
+    """
+    if pieces is None and checkpoint.current() is not None:
+        pieces = checkpoint.CHUNKS
+    if pieces is None and mode() == 'serial':
+        return [items]
+    pieces = pieces or workers * CHUNKS_PER_WORKER
+    size = max(1, -(-len(items) // pieces))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _install(work, shared):
+    global _shared
+    _shared = (work, shared)
+
+
+def _call(chunk):
+    work, shared = _shared
+    return work(shared, chunk)
+
+
+def run_chunks(work: Callable[[Any, Any], Any], shared: Any, chunks: Sequence,
+               offset: int = 0) -> list:
+    """
+    [work(shared, chunk) for chunk in chunks], run in parallel when
+    configured. When checkpointing, chunks are numbered from offset (for
+    searches that pass their chunks in slices) and finished ones skipped.
+    """
+    saved = checkpoint.current()
+    name = f'{work.__module__}.{work.__qualname__}'
+    done = saved.done(name) if saved is not None else {}
+    results = {i: done[offset + i] for i in range(len(chunks)) if offset + i in done}
+    todo = [i for i in range(len(chunks)) if i not in results]
+
+    def finish(i, value):
+        results[i] = value
+        if saved is not None:
+            saved.put(name, offset + i, value)
+
+    how = mode() if len(todo) > 1 else 'serial'
+    if how == 'serial':
+        for i in todo:
+            finish(i, work(shared, chunks[i]))
+        return [results[i] for i in range(len(chunks))]
+    n = min(workers, len(todo))
+    if how == 'threads':
+        pool = ThreadPoolExecutor(n)
+        futures = {pool.submit(work, shared, chunks[i]): i for i in todo}
+    else:
+        pool = ProcessPoolExecutor(n, mp_context=multiprocessing.get_context('fork'),
+                                   initializer=_install, initargs=(work, shared))
+        futures = {pool.submit(_call, chunks[i]): i for i in todo}
+    try:
+        for future in as_completed(futures):
+            finish(futures[future], future.result())
+    except BaseException:
+        # Don't wait for the queued chunks; the caller saves what finished
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return [results[i] for i in range(len(chunks))]
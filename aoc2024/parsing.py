@@ -0,0 +1,84 @@
+"""
+Bulk integer parsing for the number-list days.
+
+Instead of splitting and converting line by line, a whole input buffer is
+reduced to digits, minus signs, newlines and spaces with one
+bytes.translate, then split and converted in a single map(int, ...).
+Values land in flat array('q') buffers; ragged rows are described by an
+offsets array where row r is values[offsets[r]:offsets[r + 1]].
+
+Numbers that do not fit in 64 bits are returned in a plain list instead.
+"""
+
+import os
+from array import array
+from itertools import accumulate
+from typing import Union
+
+Ints = Union[array, list]
+
+_KEEP = b'0123456789\n'
+_SIGNED = bytes(c if c in _KEEP + b'-' else 32 for c in range(256))
+_UNSIGNED = bytes(c if c in _KEEP else 32 for c in range(256))
+
+
+def read(source) -> bytes:
+    """
+    Input bytes from a path, or the input itself given as str or bytes.
+    Only os.PathLike objects such as pathlib.Path are read as files; a
+    str is always the puzzle text.
+    """
+    if isinstance(source, os.PathLike):
+        with open(source, 'rb') as f:
+            return f.read()
+    if isinstance(source, str):
+        return source.encode('us-ascii')
+    return bytes(source)
+
+
+def _clean(data, signed: bool) -> bytes:
+    if isinstance(data, str):
+        data = data.encode('us-ascii')
+    return bytes(data).translate(_SIGNED if signed else _UNSIGNED)
+
+
+def _pack(values) -> Ints:
+    values = list(values)
+    try:
+        return array('q', values)
+    except OverflowError:
+        return values
+
+
+def ints(data, signed: bool = False) -> Ints:
+    """
+    Every integer in data, in order. Anything other than digits (and '-'
+    when signed) separates numbers.
+    """
+    return _pack(map(int, _clean(data, signed).split()))
+
+
+def rows(data, signed: bool = False) -> tuple[Ints, array]:
+    """
+    Integers of every non-blank line as (values, offsets), where
+    len(offsets) is the number of rows plus one.
+    """
+    cleaned = _clean(data, signed)
+    counts = [len(line.split()) for line in cleaned.split(b'\n')]
+    offsets = array('q', [0])
+    offsets.extend(accumulate(c for c in counts if c))
+    return _pack(map(int, cleaned.split())), offsets
+
+
+def columns(data, n: int, signed: bool = False) -> list[Ints]:
+    """Split a file of n integers per line into n column arrays."""
+    values = ints(data, signed)
+    if len(values) % n:
+        raise ValueError(f'{len(values)} integers do not fill {n} columns')
+    return [values[i::n] for i in range(n)]
+
+
+def iter_rows(values: Ints, offsets: array):
+    """Yield each row of a (values, offsets) pair as a slice."""
+    for start, end in zip(offsets, offsets[1:]):
+        yield values[start:end]
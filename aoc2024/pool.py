@@ -0,0 +1,101 @@
+"""
+Run independent solvers concurrently in a process pool.
+
+Jobs are submitted longest-first by recorded runtime (see history), so
+slow solvers start immediately instead of trailing the batch, and results
+are yielded as each job finishes.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from . import history
+from .registry import Solver
+from .runner import Result, run
+
+
+@dataclass
+class Summary:
+    """Outcome of a batch of solver runs."""
+    workers: int
+    wall_seconds: float = 0.0
+    results: list[Result] = field(default_factory=list)
+
+    @property
+    def busy_seconds(self) -> float:
+        return sum(r.parse_seconds + r.solve_seconds for r in self.results)
+
+    @property
+    def errors(self) -> list[Result]:
+        return [r for r in self.results if r.error]
+
+    def to_dict(self) -> dict:
+        return {
+            'workers': self.workers,
+            'wall_seconds': self.wall_seconds,
+            'busy_seconds': self.busy_seconds,
+            'errors': len(self.errors),
+            'results': [r.to_dict() for r in sorted(self.results, key=lambda r: (r.day, r.part))],
+        }
+
+
+def _job(solver: Solver, input_path, trace_memory: bool, engine: str,
+         parse_cache: bool, count: bool) -> Result:
+    try:
+        return run(solver, input_path, trace_memory, engine, parse_cache, count)
+    except Exception as e:
+        return Result(solver.day, solver.part, str(input_path or solver.default_input),
+                      engine, error=f'{type(e).__name__}: {e}')
+
+
+def run_pool(solvers: list[Solver], input_path: Optional[Path] = None,
+             trace_memory: bool = False, engine: str = 'reference',
+             workers: Optional[int] = None, parse_cache: bool = False,
+             count: bool = False) -> Iterator[Result]:
+    """Yield results in completion order; jobs start longest-first."""
+    if not solvers:
+        return
+    order = history.longest_first(solvers, engine, history.load())
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(workers, len(order))) as pool:
+        futures = [pool.submit(_job, s, input_path, trace_memory, engine, parse_cache, count) for s in order]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_batch(solvers: list[Solver], input_path: Optional[Path] = None,
+              trace_memory: bool = False, engine: str = 'reference',
+              workers: Optional[int] = None,
+              on_result: Optional[Callable[[Result], None]] = None,
+              cache=None, parse_cache: bool = False, count: bool = False) -> Summary:
+    """
+    Run solvers in a process pool and return a Summary, calling
+    on_result for each result as it arrives. Runtimes are recorded so the
+    next batch is scheduled better. With an AnswerCache, cached answers
+    are reported up front and only the misses go to the pool.
+    """
+    summary = Summary(workers or os.cpu_count() or 1)
+    start = time.perf_counter()
+    todo = {}
+    for solver in solvers:
+        hit = cache.get(solver, input_path, engine) if cache is not None else None
+        if hit is None:
+            todo[solver.day, solver.part] = solver
+            continue
+        summary.results.append(hit)
+        if on_result:
+            on_result(hit)
+    for result in run_pool(list(todo.values()), input_path, trace_memory, engine,
+                           summary.workers, parse_cache, count):
+        if cache is not None:
+            cache.put(todo[result.day, result.part], result)
+        summary.results.append(result)
+        if on_result:
+            on_result(result)
+    summary.wall_seconds = time.perf_counter() - start
+    history.record(summary.results)
+    return summary
@@ -0,0 +1,131 @@
+"""
+Profile solvers with cProfile.
+
+    python -m aoc2024 6/2 --profile              # run with per-solver reports
+    python -m aoc2024.profiling show FILE        # report a saved profile
+    python -m aoc2024.profiling diff OLD NEW     # compare two saved profiles
+
+Every profiled run is saved under .aoc2024/profiles in the pstats format,
+so it can also be opened with pstats or snakeviz.
+"""
+
+import argparse
+import cProfile
+import pstats
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from .registry import ROOT, WORK_DIR, Solver
+from .runner import Result, run
+
+PROFILE_DIR = WORK_DIR / 'profiles'
+TOP = 15
+
+# Frames of the runner and profiler themselves, left out of reports
+_OWN_FRAMES = (str(Path(__file__).with_name('runner.py')), '_lsprof.Profiler')
+
+
+@dataclass
+class FunctionStats:
+    """Totals for one function in a profile."""
+    name: str
+    calls: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+def profile(solver: Solver, input_path: Optional[Path] = None, engine: str = 'reference',
+            parse_cache: bool = False) -> tuple[Result, pstats.Stats]:
+    """Run one solver under cProfile; memory tracing is off."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(run, solver, input_path, False, engine, parse_cache)
+    return result, pstats.Stats(profiler)
+
+
+def _label(file: str, line: int, name: str) -> str:
+    if file == '~':
+        return name
+    path = Path(file)
+    if path.is_relative_to(ROOT):
+        file = path.relative_to(ROOT).as_posix()
+    return f'{file}:{line}({name})'
+
+
+def functions(stats: pstats.Stats) -> list[FunctionStats]:
+    """Every profiled function except the runner's own frames."""
+    rows = []
+    for (file, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        if any(frame in file or frame in name for frame in _OWN_FRAMES):
+            continue
+        rows.append(FunctionStats(_label(file, line, name), calls, tottime, cumtime))
+    return rows
+
+
+def top(stats: pstats.Stats, n: int = TOP, by: str = 'cumulative') -> list[FunctionStats]:
+    """The n functions with the most cumulative or self time."""
+    key = 'self_seconds' if by == 'self' else 'cumulative_seconds'
+    return sorted(functions(stats), key=lambda f: getattr(f, key), reverse=True)[:n]
+
+
+def report(stats: pstats.Stats, n: int = TOP) -> str:
+    lines = []
+    for by in ('cumulative', 'self'):
+        lines.append(f'  top {n} by {by} time')
+        lines.append(f'  {"calls":>10}  {"self s":>8}  {"cum s":>8}  function')
+        for f in top(stats, n, by):
+            lines.append(f'  {f.calls:>10}  {f.self_seconds:8.3f}  '
+                         f'{f.cumulative_seconds:8.3f}  {f.name}')
+    return '\n'.join(lines)
+
+
+def save(stats: pstats.Stats, solver: Solver, engine: str,
+         directory: Path = PROFILE_DIR) -> Path:
+    """Write stats as day{d}-{p}-{engine}-{timestamp}.prof."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / (f'day{solver.day}-{solver.part}-{engine}-'
+                        f'{time.strftime("%Y%m%d-%H%M%S")}.prof')
+    stats.dump_stats(path)
+    return path
+
+
+def diff(old: pstats.Stats, new: pstats.Stats, n: int = TOP) -> str:
+    """The n functions whose self time changed most between two profiles."""
+    before = {f.name: f for f in functions(old)}
+    after = {f.name: f for f in functions(new)}
+    empty = FunctionStats('', 0, 0.0, 0.0)
+    changes = []
+    for name in before.keys() | after.keys():
+        a, b = before.get(name, empty), after.get(name, empty)
+        changes.append((b.self_seconds - a.self_seconds, a, b, name))
+    changes.sort(key=lambda c: abs(c[0]), reverse=True)
+
+    lines = [f'  {"calls":>21}  {"self s":>17}  {"delta":>8}  function']
+    for delta, a, b, name in changes[:n]:
+        lines.append(f'  {a.calls:>10}>{b.calls:<10}  {a.self_seconds:8.3f}>{b.self_seconds:<8.3f}  '
+                     f'{delta:+8.3f}  {name}')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.profiling',
+                                     description='Report or compare saved solver profiles.')
+    parser.add_argument('-n', '--top', type=int, default=TOP, help='functions to list')
+    commands = parser.add_subparsers(dest='command', required=True)
+    show = commands.add_parser('show', help='report one profile')
+    show.add_argument('profile')
+    compare = commands.add_parser('diff', help='compare two profiles by self time')
+    compare.add_argument('old')
+    compare.add_argument('new')
+    args = parser.parse_args(argv)
+
+    if args.command == 'show':
+        print(report(pstats.Stats(args.profile), args.top))
+    else:
+        print(diff(pstats.Stats(args.old), pstats.Stats(args.new), args.top))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+"""Find the dayN/P/answer.py solvers and import them in-process."""
+
+import ast
+import hashlib
+import importlib
+import importlib.util
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+ROOT = PACKAGE_DIR.parent
+WORK_DIR = ROOT / '.aoc2024'
+SOLVER_PATH = re.compile(r'day(\d+)/(\d+)/answer\.py')
+ENGINES = ('reference', 'fast')
+
+_modules: dict[Path, ModuleType] = {}
+_digests: dict[tuple, str] = {}
+_imports: dict[tuple, list[Path]] = {}
+
+
+@dataclass(frozen=True, order=True)
+class Solver:
+    """One puzzle part backed by a dayN/P/answer.py file."""
+    day: int
+    part: int
+    path: Path
+
+    @property
+    def key(self) -> str:
+        return f'{self.day}/{self.part}'
+
+    @property
+    def default_input(self) -> Path:
+        return self.path.parent / 'input.txt'
+
+
+def discover(root: Path = ROOT) -> list[Solver]:
+    """Return every solver under root, sorted by day then part."""
+    solvers = []
+    for path in root.glob('day*/*/answer.py'):
+        match = SOLVER_PATH.fullmatch(path.relative_to(root).as_posix())
+        if match:
+            solvers.append(Solver(int(match.group(1)), int(match.group(2)), path))
+    return sorted(solvers)
+
+
+def select(solvers: list[Solver], specs: list[str]) -> list[Solver]:
+    """
+    Filter solvers by specs like '6' (both parts) or '6/2' (one part).
+    An empty spec list selects everything.
+    """
+    if not specs:
+        return list(solvers)
+    chosen = []
+    for spec in specs:
+        day, _, part = spec.partition('/')
+        matches = [s for s in solvers
+                   if s.day == int(day) and (not part or s.part == int(part))]
+        if not matches:
+            raise ValueError(f'no solver matches {spec!r}')
+        chosen.extend(s for s in matches if s not in chosen)
+    return chosen
+
+
+def load(solver: Solver) -> ModuleType:
+    """Import the solver module once and cache it for the process."""
+    module = _modules.get(solver.path)
+    if module is None:
+        name = f'aoc2024_day{solver.day}_part{solver.part}'
+        spec = importlib.util.spec_from_file_location(name, solver.path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[solver.path] = module
+    return module
+
+
+def fast_engine(day: int) -> ModuleType | None:
+    """The aoc2024.days module for day, or None if there is none."""
+    try:
+        return importlib.import_module(f'{__package__}.days.day{day:02d}')
+    except ModuleNotFoundError as e:
+        if e.name != f'{__package__}.days.day{day:02d}':
+            raise
+        return None
+
+
+def sources(solver: Solver, engine: str = 'reference') -> tuple[str, list[Path]]:
+    """
+    Return (engine used, source files that determine the answer) for
+    solver, resolving the fast-engine fallback without importing anything.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f'unknown engine {engine!r}')
+    if engine == 'fast':
+        spec = importlib.util.find_spec(f'{__package__}.days.day{solver.day:02d}')
+        if spec is not None:
+            return 'fast', package_sources(spec.origin)
+    return 'reference', [solver.path]
+
+
+def _module_file(path: Path) -> Path | None:
+    """The source of module or package path (without suffix), if it is one."""
+    for candidate in (path.with_suffix('.py'), path / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _package_imports(path: Path) -> list[Path]:
+    """Package modules that path imports itself, remembered until it changes."""
+    st = os.stat(path)
+    memo = (str(path), st.st_size, st.st_mtime_ns)
+    found = _imports.get(memo)
+    if found is not None:
+        return found
+    found = []
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = path.parents[node.level - 1]
+            elif (node.module or '').partition('.')[0] == __package__:
+                base = ROOT
+            else:
+                continue
+            target = base.joinpath(*node.module.split('.')) if node.module else base
+            if node.module:
+                found.append(_module_file(target))
+            # from package import module
+            found.extend(_module_file(target / alias.name) for alias in node.names)
+        elif isinstance(node, ast.Import):
+            found.extend(_module_file(ROOT.joinpath(*alias.name.split('.')))
+                         for alias in node.names
+                         if alias.name.partition('.')[0] == __package__)
+    found = [f.resolve() for f in found
+             if f is not None and f.resolve().is_relative_to(PACKAGE_DIR)]
+    _imports[memo] = found
+    return found
+
+
+def package_sources(path) -> list[Path]:
+    """
+    path and every aoc2024 module it imports, directly or through other
+    package modules, found by reading their imports rather than running them.
+    """
+    path = Path(path).resolve()
+    seen, stack = {path}, [path]
+    while stack:
+        for module in _package_imports(stack.pop()):
+            if module not in seen:
+                seen.add(module)
+                stack.append(module)
+    return [path] + sorted(seen - {path})
+
+
+def file_digest(path) -> str:
+    """SHA-256 of a file, remembered until its size or mtime changes."""
+    st = os.stat(path)
+    memo = (str(path), st.st_size, st.st_mtime_ns)
+    digest = _digests.get(memo)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+        _digests[memo] = digest
+    return digest
+
+
+def hooks(solver: Solver, engine: str = 'reference'
+          ) -> tuple[str, Callable[[str], Any], Callable[[Any], Any]]:
+    """
+    Return (engine used, parse, answer) for solver. The fast engine falls
+    back to the reference solver for days it does not cover.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f'unknown engine {engine!r}')
+    if engine == 'fast':
+        module = fast_engine(solver.day)
+        if module is not None:
+            return 'fast', module.parse, getattr(module, f'part{solver.part}')
+    module = load(solver)
+    return 'reference', module.parse, module.answer
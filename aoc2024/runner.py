@@ -0,0 +1,164 @@
+"""Run solvers in-process and record per-phase timings."""
+
+import itertools
+import time
+import tracemalloc
+from contextlib import nullcontext
+from dataclasses import dataclass, asdict
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from . import checkpoint, counters, logs
+from .registry import Solver, fast_engine, hooks
+from .sidecar import load_or_parse
+
+
+@dataclass
+class Result:
+    """
+    Outcome of running one solver against one input. When parts of a
+    day share one parse, the first part carries the parse time and the
+    others are marked parse_shared. Answers served from the answer cache
+    are marked cached and carry no timings. counters holds the fast
+    engine's work counters when counting was on.
+    """
+    day: int
+    part: int
+    input: str
+    engine: str = 'reference'
+    answer: Any = None
+    parse_seconds: float = 0.0
+    solve_seconds: float = 0.0
+    parse_shared: bool = False
+    cached: bool = False
+    peak_bytes: Optional[int] = None
+    error: Optional[str] = None
+    counters: Optional[dict] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _input_path(solver: Solver, input_path) -> Path:
+    return Path(input_path) if input_path else solver.default_input
+
+
+def run(solver: Solver, input_path: Optional[Path] = None,
+        trace_memory: bool = True, engine: str = 'reference',
+        parse_cache: bool = False, count: bool = False) -> Result:
+    """
+    Parse and solve one input, timing each phase separately.
+
+    With trace_memory the peak traced allocation across both phases is
+    recorded; tracemalloc slows allocation-heavy solvers, so turn it off
+    when only the timings matter. With parse_cache, fast engines reload
+    their parsed input from a binary sidecar when one is available. With
+    count, the work counters the solver reports are attached. Fast engine
+    answers run in a checkpoint scope when checkpointing is enabled. Logs
+    buffered during the run are flushed at the end.
+    """
+    path = _input_path(solver, input_path)
+    engine, parse, answer = hooks(solver, engine)
+    if parse_cache and engine == 'fast':
+        parse = partial(load_or_parse, fast_engine(solver.day))
+    result = Result(solver.day, solver.part, str(path), engine)
+
+    counters.enable(count)
+    counters.collect()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        data = parse(path)
+        result.parse_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with checkpoint.scope(solver, path, engine) if engine == 'fast' else nullcontext():
+            result.answer = answer(data)
+        result.solve_seconds = time.perf_counter() - start
+    except Exception as e:
+        result.error = f'{type(e).__name__}: {e}'
+    finally:
+        if trace_memory:
+            result.peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if count:
+            result.counters = counters.collect()
+        counters.enable(False)
+        logs.flush()
+    return result
+
+
+def run_day(solvers: list[Solver], input_path: Optional[Path] = None,
+            trace_memory: bool = True, parse_cache: bool = False,
+            count: bool = False) -> list[Result]:
+    """
+    Run several parts of one day on the fast engine from a single parse,
+    so later parts reuse the parsed input and anything an earlier part
+    built on it. The peak memory covers the whole day.
+    """
+    first = solvers[0]
+    module = fast_engine(first.day)
+    if module is None:
+        raise ValueError(f'day {first.day} has no fast engine')
+    path = _input_path(first, input_path)
+    results = [Result(s.day, s.part, str(path), 'fast', parse_shared=i > 0)
+               for i, s in enumerate(solvers)]
+
+    counters.enable(count)
+    counters.collect()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        data = load_or_parse(module, path) if parse_cache else module.parse(path)
+        results[0].parse_seconds = time.perf_counter() - start
+    except Exception as e:
+        for result in results:
+            result.error = f'{type(e).__name__}: {e}'
+    else:
+        for solver, result in zip(solvers, results):
+            try:
+                start = time.perf_counter()
+                with checkpoint.scope(solver, path):
+                    result.answer = getattr(module, f'part{solver.part}')(data)
+                result.solve_seconds = time.perf_counter() - start
+            except Exception as e:
+                result.error = f'{type(e).__name__}: {e}'
+            if count:
+                result.counters = counters.collect()
+    finally:
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            for result in results:
+                result.peak_bytes = peak
+        counters.enable(False)
+        logs.flush()
+    return results
+
+
+def run_many(solvers: list[Solver], input_path: Optional[Path] = None,
+             trace_memory: bool = True, engine: str = 'reference',
+             cache=None, parse_cache: bool = False, count: bool = False) -> Iterator[Result]:
+    """
+    Run solvers in order, yielding results as they finish. On the fast
+    engine, consecutive parts of the same day share one parse. With an
+    AnswerCache, cached answers are yielded first and only the misses run.
+    """
+    for day, group in itertools.groupby(solvers, key=lambda s: s.day):
+        group = list(group)
+        if cache is not None:
+            hits = [cache.get(s, input_path, engine) for s in group]
+            yield from filter(None, hits)
+            group = [s for s, hit in zip(group, hits) if hit is None]
+        if engine == 'fast' and len(group) > 1 and fast_engine(day) is not None:
+            results = run_day(group, input_path, trace_memory, parse_cache, count)
+        else:
+            results = (run(solver, input_path, trace_memory, engine, parse_cache, count)
+                       for solver in group)
+        for solver, result in zip(group, results):
+            if cache is not None:
+                cache.put(solver, result)
+            yield result
@@ -0,0 +1,257 @@
+"""
+Warm answer daemon on localhost HTTP.
+
+    python -m aoc2024.server --port 8024 --engine fast
+
+Every solver is imported once at startup. Parsed inputs (with whatever
+the fast engines build on them, such as day 6's patrol) and answers are
+kept in memory, keyed by the input's SHA-256, so repeated queries skip
+both interpreter startup and parsing. All responses are JSON:
+
+    GET  /answer?day=6&part=2              day 6's own input.txt
+    GET  /answer?day=6&part=2&input=alice  a pushed input
+    POST /answer?day=6&part=2              input text in the body
+    PUT  /inputs/alice                     push or replace an input
+    GET  /inputs                           pushed input names and sizes
+    GET  /stats                            cache sizes and hit counts
+
+Any query also takes engine=reference|fast. Only bind to localhost: there
+is no authentication.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from .api import as_path
+from .registry import ENGINES, discover, fast_engine, file_digest, hooks
+
+PORT = 8024
+CAPACITY = 32
+
+
+class NotFound(LookupError):
+    """An unknown solver or pushed input (404), unlike lookups failing inside a solver."""
+
+
+class Daemon:
+    """Solvers, pushed inputs and LRU caches of parses and answers."""
+
+    def __init__(self, engine: str = 'fast', capacity: int = CAPACITY):
+        self.engine = engine
+        self.capacity = capacity
+        self.solvers = {(s.day, s.part): s for s in discover()}
+        self.inputs: dict[str, bytes] = {}
+        self.parsed: OrderedDict = OrderedDict()
+        self.answers: OrderedDict = OrderedDict()
+        self.stats = Counter()
+        self.pending: dict[tuple, Future] = {}
+        self.lock = threading.Lock()
+        for solver in self.solvers.values():
+            for name in ENGINES:
+                hooks(solver, name)
+
+    def push(self, name: str, data: bytes) -> None:
+        with self.lock:
+            self.inputs[name] = data
+
+    def _source(self, day: int, part: int, source) -> tuple[Any, str]:
+        """Resolve source to (path or bytes, content digest)."""
+        if source is None:
+            path = self.solvers[day, part].default_input
+            return path, file_digest(path)
+        if isinstance(source, str):
+            with self.lock:
+                data = self.inputs.get(source)
+            if data is None:
+                raise NotFound(f'no pushed input named {source!r}')
+            source = data
+        return source, hashlib.sha256(source).hexdigest()
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key, value, capacity: int) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > capacity:
+            cache.popitem(last=False)
+
+    def _once(self, kind: str, cache: OrderedDict, key, capacity: int, compute) -> tuple[Any, bool]:
+        """
+        (value, hit) for key: from cache, from a request already computing
+        it, or computed here. Only the caches are locked, so slow requests
+        never hold up others.
+        """
+        with self.lock:
+            if key in cache:
+                cache.move_to_end(key)
+                self.stats[f'{kind}_hits'] += 1
+                return cache[key], True
+            future = self.pending.get((kind, key))
+            owner = future is None
+            if owner:
+                future = self.pending[kind, key] = Future()
+                self.stats['parses' if kind == 'parse' else 'solves'] += 1
+            else:
+                self.stats[f'{kind}_hits'] += 1
+        if not owner:
+            return future.result(), True
+        try:
+            value = compute()
+        except BaseException as e:
+            with self.lock:
+                del self.pending[kind, key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            self._remember(cache, key, value, capacity)
+            del self.pending[kind, key]
+        future.set_result(value)
+        return value, False
+
+    def answer(self, day: int, part: int, source=None, engine: Optional[str] = None) -> dict:
+        """
+        Answer one part for the day's input.txt (source None), a pushed
+        input (source a name) or raw input bytes. Concurrent requests for
+        the same parse or answer share one computation.
+        """
+        if (day, part) not in self.solvers:
+            raise NotFound(f'no solver for {day}/{part}')
+        start = time.perf_counter()
+        used, parse, answer = hooks(self.solvers[day, part], engine or self.engine)
+        source, digest = self._source(day, part, source)
+        # Fast engines parse once per day; reference parses differ per part
+        parse_key = (used, day, None if used == 'fast' else part, digest)
+        answer_key = (used, day, part, digest)
+
+        def parse_source():
+            if used == 'fast':
+                return fast_engine(day).parse(source)
+            with as_path(source) as path:
+                return parse(path)
+
+        def solve():
+            data, _ = self._once('parse', self.parsed, parse_key, self.capacity, parse_source)
+            return answer(data)
+
+        result, cached = self._once('answer', self.answers, answer_key, 4 * self.capacity, solve)
+        return {'day': day, 'part': part, 'engine': used, 'input': digest,
+                'answer': result, 'cached': cached,
+                'seconds': time.perf_counter() - start}
+
+    def listing(self) -> dict[str, int]:
+        """Pushed input names and sizes."""
+        with self.lock:
+            return {name: len(data) for name, data in self.inputs.items()}
+
+    def describe(self) -> dict:
+        with self.lock:
+            return {'engine': self.engine, 'solvers': len(self.solvers),
+                    'parsed': len(self.parsed), 'answers': len(self.answers),
+                    'inputs': len(self.inputs), **self.stats}
+
+
+class Handler(BaseHTTPRequestHandler):
+    """JSON endpoints over a Daemon; see the module docstring."""
+
+    daemon: Daemon
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body, default=str).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _answer(self, query: dict, body: Optional[bytes]) -> None:
+        try:
+            day, part = int(query['day'][0]), int(query['part'][0])
+        except (KeyError, ValueError):
+            return self._reply(400, {'error': 'day and part are required integers'})
+        engine = query.get('engine', [None])[0]
+        if engine is not None and engine not in ENGINES:
+            return self._reply(400, {'error': f'unknown engine {engine!r}'})
+        source = body if body is not None else query.get('input', [None])[0]
+        try:
+            self._reply(200, self.daemon.answer(day, part, source, engine))
+        except NotFound as e:
+            self._reply(404, {'error': e.args[0]})
+        except Exception as e:
+            self._reply(500, {'error': f'{type(e).__name__}: {e}'})
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/answer':
+            self._answer(parse_qs(url.query), None)
+        elif url.path == '/inputs':
+            self._reply(200, self.daemon.listing())
+        elif url.path == '/stats':
+            self._reply(200, self.daemon.describe())
+        else:
+            self._reply(404, {'error': f'no route {url.path}'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path == '/answer':
+            self._answer(parse_qs(url.query), self._body())
+        else:
+            self._reply(404, {'error': f'no route {url.path}'})
+
+    def do_PUT(self):
+        url = urlsplit(self.path)
+        name = url.path.removeprefix('/inputs/')
+        if not url.path.startswith('/inputs/') or not name:
+            return self._reply(404, {'error': f'no route {url.path}'})
+        data = self._body()
+        self.daemon.push(name, data)
+        self._reply(200, {'input': name, 'bytes': len(data)})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def serve(daemon: Daemon, host: str = '127.0.0.1', port: int = PORT,
+          verbose: bool = False) -> ThreadingHTTPServer:
+    """Bind an HTTP server for daemon; call serve_forever() on the result."""
+    handler = type('DaemonHandler', (Handler,), {'daemon': daemon})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.server',
+                                     description='Serve answers from a warm process.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='fast',
+                        help='default engine for queries (default: fast)')
+    parser.add_argument('--capacity', type=int, default=CAPACITY,
+                        help='parsed inputs kept in memory')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log every request')
+    args = parser.parse_args(argv)
+
+    server = serve(Daemon(args.engine, args.capacity), args.host, args.port, args.verbose)
+    print(f'aoc2024.server listening on http://{args.host}:{server.server_port}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,368 @@
+"""
+Shard one large input across worker processes on any number of hosts.
+
+    python -m aoc2024.shard 7/2 -i huge.txt --local 4
+    python -m aoc2024.shard 6/2 -i huge.txt --bind 0.0.0.0:8025
+    AOC2024_SHARD_KEY=... python -m aoc2024.shard --work coordinator:8025
+
+The coordinator splits the input into shards and queues them; workers
+connect over TCP (multiprocessing.connection, authenticated with a shared
+key), take one shard at a time and send back its partial answer, which
+the coordinator merges. A worker that disconnects has its shard queued
+again, and workers may join or leave at any point. --local N starts N
+worker processes on this machine in place of nodes.
+
+Sharded parts, all on the fast engines:
+
+    2/1 2/2     reports       lines of the input are sent, answers summed
+    7/1 7/2     equations     lines of the input are sent, answers summed
+    13/1 13/2   machines      blank-line blocks are sent, answers summed
+    6/2         obstructions  each worker gets the input once and searches
+                              a range of the candidate cells; counts summed
+    14/2        time windows  each worker gets the input once, tabulates the
+                              robots' positions once and searches a range
+                              of times; the earliest hit wins, and windows
+                              after it are not handed out
+
+The coordinator runs one job at a time.
+"""
+
+import argparse
+import hashlib
+import itertools
+import os
+import queue
+import re
+import secrets
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing import AuthenticationError, Process
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+from .days import day02, day06, day07, day13, day14
+from .registry import discover, select
+
+SHARDS = 64
+KEY_VARIABLE = 'AOC2024_SHARD_KEY'
+
+# Seconds local workers get to stop before they are terminated
+GRACE = 1.0
+
+# Result of a shard that was no longer needed
+SKIPPED = object()
+
+
+class Records:
+    """Days whose answer is a sum over records: shards are runs of records."""
+
+    shared = False
+
+    def __init__(self, module, separator: bytes = b'\n'):
+        self.module = module
+        self.separator = separator
+
+    def split(self, data: bytes, pieces: int) -> list[bytes]:
+        data = data.replace(b'\r', b'')
+        records = [r for r in data.split(self.separator) if r.strip()]
+        size = max(1, -(-len(records) // pieces))
+        return [self.separator.join(records[i:i + size]) for i in range(0, len(records), size)]
+
+    def solve(self, part: int, shard: bytes, loaded=None) -> Any:
+        return getattr(self.module, f'part{part}')(self.module.parse(shard))
+
+    def merge(self, results: list) -> Any:
+        return sum(results)
+
+    def skip(self, index: int, results: dict) -> bool:
+        return False
+
+
+class Search:
+    """
+    Searches over items derived from the whole input: every worker parses
+    the input once, and shards are (start, stop) ranges of the items.
+    prepare, if given, turns the parsed input into what work searches
+    over; workers run it once per input too, not once per shard.
+    """
+
+    shared = True
+
+    def __init__(self, module, items: Callable[[Any], Sequence],
+                 work: Callable[[Any, Sequence], Any],
+                 prepare: Optional[Callable[[Any], Any]] = None):
+        self.module = module
+        self.items = items
+        self.work = work
+        self.prepare = prepare
+
+    def load(self, data: bytes) -> Any:
+        """The parsed (and prepared) input that every shard of a worker reuses."""
+        parsed = self.module.parse(data)
+        return parsed if self.prepare is None else self.prepare(parsed)
+
+    def split(self, data: bytes, pieces: int) -> list[tuple[int, int]]:
+        n = len(self.items(self.module.parse(data)))
+        size = max(1, -(-n // pieces))
+        return [(i, min(i + size, n)) for i in range(0, n, size)]
+
+    def solve(self, part: int, shard: tuple[int, int], loaded=None) -> Any:
+        start, stop = shard
+        return self.work(loaded, self.items(loaded)[start:stop])
+
+    def merge(self, results: list) -> Any:
+        return sum(results)
+
+    def skip(self, index: int, results: dict) -> bool:
+        return False
+
+
+class EarliestSearch(Search):
+    """Search for the first hit (-1 for none): shards after a hit are skipped."""
+
+    def merge(self, results):
+        return next((r for r in results if r is not SKIPPED and r >= 0), -1)
+
+    def skip(self, index, results):
+        return any(i < index and r is not SKIPPED and r >= 0 for i, r in results.items())
+
+
+def _obstructions(lab):
+    return lab.first_visits
+
+
+def _times(tables):
+    return range(10000)
+
+
+def _timetables(robots):
+    return day14.timetables(robots) if robots[0] else None
+
+
+def _earliest_run(tables, times):
+    return -1 if tables is None else day14.first_run(tables, times)[0]
+
+
+PLANS = {
+    (2, 1): Records(day02), (2, 2): Records(day02),
+    (7, 1): Records(day07), (7, 2): Records(day07),
+    (13, 1): Records(day13, b'\n\n'), (13, 2): Records(day13, b'\n\n'),
+    (6, 2): Search(day06, _obstructions, day06.count_loops),
+    (14, 2): EarliestSearch(day14, _times, _earliest_run, _timetables),
+}
+
+
+@dataclass
+class Job:
+    id: int
+    day: int
+    part: int
+    digest: str
+    data: bytes
+    plan: Any
+    results: dict = field(default_factory=dict)
+    # Set once solve returns or raises; its queued shards are then dropped
+    finished: bool = False
+
+
+class Coordinator:
+    """Queue of shards served to every worker that connects to address."""
+
+    def __init__(self, address: tuple[str, int] = ('127.0.0.1', 0), authkey: bytes = b''):
+        self.listener = Listener(address, authkey=authkey)
+        self.address = self.listener.address
+        self.tasks: queue.Queue = queue.Queue()
+        self.done: queue.Queue = queue.Queue()
+        self.workers = 0  # connected right now
+        self.jobs = itertools.count()
+        self.lock = threading.Lock()
+        self.closed = False
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        while not self.closed:
+            try:
+                conn = self.listener.accept()
+            except (OSError, AuthenticationError):
+                continue  # listener closed, or a client failed to authenticate
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn) -> None:
+        """Feed one worker until it disconnects or the coordinator closes."""
+        sent = None  # digest of the input this worker already holds
+        with self.lock:
+            self.workers += 1
+        try:
+            while True:
+                task = self.tasks.get()
+                if task is None:
+                    self.tasks.put(None)  # let the other workers see it too
+                    conn.send(('stop',))
+                    return
+                job, index, shard = task
+                if job.finished:
+                    continue
+                if job.plan.skip(index, dict(job.results)):
+                    self.done.put((job.id, index, 'result', SKIPPED))
+                    continue
+                try:
+                    if job.plan.shared and sent != job.digest:
+                        conn.send(('input', job.digest, job.data))
+                        sent = job.digest
+                    conn.send(('task', job.day, job.part, shard))
+                    kind, value = conn.recv()
+                except (EOFError, OSError):
+                    self.tasks.put(task)
+                    return
+                self.done.put((job.id, index, kind, value))
+        except (EOFError, OSError):
+            pass
+        finally:
+            with self.lock:
+                self.workers -= 1
+            conn.close()
+
+    def solve(self, day: int, part: int, source, shards: int = SHARDS) -> Any:
+        """
+        Answer for source (a path, or input text as str or bytes), merged
+        from shards answered by the connected workers.
+        """
+        try:
+            plan = PLANS[day, part]
+        except KeyError:
+            raise ValueError(f'{day}/{part} cannot be sharded') from None
+        if isinstance(source, os.PathLike):
+            data = Path(source).read_bytes()
+        else:
+            data = source.encode('us-ascii') if isinstance(source, str) else bytes(source)
+        job = Job(next(self.jobs), day, part, hashlib.sha256(data).hexdigest(), data, plan)
+        pieces = plan.split(data, shards)
+        for index, shard in enumerate(pieces):
+            self.tasks.put((job, index, shard))
+        try:
+            while len(job.results) < len(pieces):
+                job_id, index, kind, value = self.done.get()
+                if job_id != job.id:
+                    continue  # a late result of an earlier, failed job
+                if kind == 'error':
+                    raise RuntimeError(f'shard {index} of {day}/{part} failed: {value}')
+                job.results[index] = value
+        finally:
+            job.finished = True
+        return plan.merge([job.results[i] for i in range(len(pieces))])
+
+    def close(self) -> None:
+        """Tell the workers to stop and stop accepting new ones."""
+        self.closed = True
+        self.tasks.put(None)
+        self.listener.close()
+
+
+def work(address: tuple[str, int], authkey: bytes) -> int:
+    """Worker loop: answer shards from the coordinator at address until told to stop."""
+    conn = Client(address, authkey=authkey)
+    data, loaded = None, {}
+    with conn:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                return 0
+            if message[0] == 'stop':
+                return 0
+            if message[0] == 'input':
+                data, loaded = message[2], {}
+                continue
+            _, day, part, shard = message
+            plan = PLANS[day, part]
+            try:
+                if plan.shared and (day, part) not in loaded:
+                    loaded[day, part] = plan.load(data)
+                conn.send(('result', plan.solve(part, shard, loaded.get((day, part)))))
+            except Exception as e:
+                conn.send(('error', f'{type(e).__name__}: {e}'))
+
+
+def start_local(address: tuple[str, int], authkey: bytes, n: int) -> list[Process]:
+    """Start n worker processes on this machine."""
+    processes = [Process(target=work, args=(address, authkey), daemon=True) for _ in range(n)]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def parse_address(value: str) -> tuple[str, int]:
+    host, _, port = value.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.shard',
+                                     description='Split one input over worker processes.')
+    parser.add_argument('solver', nargs='?', metavar='DAY/PART',
+                        help='part to solve: ' + ' '.join(f'{d}/{p}' for d, p in sorted(PLANS)))
+    parser.add_argument('-i', '--input', type=Path, help='input file (default: the part\'s input.txt)')
+    parser.add_argument('--bind', type=parse_address, default=('127.0.0.1', 0), metavar='HOST:PORT',
+                        help='coordinator address (default: a free localhost port)')
+    parser.add_argument('--local', type=int, default=0, metavar='N',
+                        help='start N local worker processes')
+    parser.add_argument('--shards', type=int, default=SHARDS, metavar='N',
+                        help=f'shards to split the input into (default {SHARDS})')
+    parser.add_argument('--work', type=parse_address, metavar='HOST:PORT',
+                        help=f'run as a worker for the coordinator at HOST:PORT (key in ${KEY_VARIABLE})')
+    args = parser.parse_args(argv)
+
+    key = os.environ.get(KEY_VARIABLE)
+    if args.work:
+        if not key:
+            print(f'aoc2024.shard: set {KEY_VARIABLE} to the coordinator\'s key', file=sys.stderr)
+            return 2
+        try:
+            return work(args.work, key.encode())
+        except (OSError, AuthenticationError) as e:
+            print(f'aoc2024.shard: cannot join {args.work[0]}:{args.work[1]}: {e}', file=sys.stderr)
+            return 1
+    if args.solver is None:
+        parser.error('DAY/PART is required unless --work is given')
+    try:
+        if not re.fullmatch(r'\d+/\d+', args.solver):
+            raise ValueError(f'expected DAY/PART, got {args.solver!r}')
+        solver = select(discover(), [args.solver])[0]
+        if (solver.day, solver.part) not in PLANS:
+            raise ValueError(f'{solver.key} cannot be sharded')
+    except ValueError as e:
+        print(f'aoc2024.shard: {e}', file=sys.stderr)
+        return 2
+
+    authkey = key.encode() if key else secrets.token_hex(16).encode()
+    coordinator = Coordinator(args.bind, authkey)
+    host, port = coordinator.address
+    if not args.local or args.bind != ('127.0.0.1', 0):
+        print(f'aoc2024.shard: coordinator on {host}:{port}; start workers with', file=sys.stderr)
+        print(f'  {KEY_VARIABLE}={authkey.decode()} python -m aoc2024.shard --work HOST:{port}',
+              file=sys.stderr, flush=True)
+    processes = start_local(coordinator.address, authkey, args.local)
+    start = time.perf_counter()
+    try:
+        answer = coordinator.solve(solver.day, solver.part, args.input or solver.default_input,
+                                   args.shards)
+        workers = coordinator.workers
+    except (RuntimeError, KeyboardInterrupt) as e:
+        print(f'aoc2024.shard: {e or "interrupted"}', file=sys.stderr)
+        return 1
+    finally:
+        coordinator.close()
+        for process in processes:
+            process.join(GRACE)
+            if process.is_alive():
+                process.terminate()
+    print(f'{solver.key:>5}  {answer}  {time.perf_counter() - start:.2f}s, '
+          f'{args.shards} shards, {workers} workers')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+"""
+Binary sidecar files holding parsed inputs.
+
+A fast-engine day module that also defines
+
+    pack(data)     -> list of array.array holding the parsed input
+    unpack(views)  -> parsed input rebuilt from memoryviews of those arrays
+
+can have its parse skipped on later runs: the arrays are written to
+.aoc2024/parsed and reloaded by memory-mapping the file and casting
+slices of it, with no text parsing. A sidecar is named after the input's
+path and keyed by the SHA-256 of the input bytes, the day module source
+and the package modules it imports (registry.package_sources), so editing
+any of them invalidates it; only the newest sidecar per input is kept.
+
+Files use native byte order and are only meant for the machine that
+wrote them.
+
+    magic (8 bytes)  array count (u64)
+    per array:       typecode (1 byte, 7 padding)  length (u64)
+    per array:       raw items, padded to 8 bytes
+"""
+
+import hashlib
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from .registry import WORK_DIR, file_digest, package_sources
+
+SIDECAR_DIR = WORK_DIR / 'parsed'
+MAGIC = b'AOCPARSE'
+HEADER = struct.Struct('<8sQ')
+ENTRY = struct.Struct('<c7xQ')
+
+
+def _aligned(n: int) -> int:
+    return -(-n // 8) * 8
+
+
+def dump(arrays: list[array], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(arrays)))
+        for a in arrays:
+            f.write(ENTRY.pack(a.typecode.encode(), len(a)))
+        for a in arrays:
+            data = a.tobytes()
+            f.write(data + bytes(_aligned(len(data)) - len(data)))
+    tmp.replace(path)
+
+
+def load(path: Path) -> list[memoryview]:
+    """Memory-map a sidecar and return one typed memoryview per array."""
+    with open(path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, count = HEADER.unpack_from(buf)
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a parsed-input sidecar')
+    view = memoryview(buf)
+    offset = HEADER.size + count * ENTRY.size
+    views = []
+    for i in range(count):
+        code, length = ENTRY.unpack_from(buf, HEADER.size + i * ENTRY.size)
+        code = code.decode()
+        size = array(code).itemsize * length
+        if offset + size > len(buf):
+            raise ValueError(f'{path} is truncated')
+        views.append(view[offset:offset + size].cast(code))
+        offset += _aligned(size)
+    return views
+
+
+def copy(view: memoryview) -> array:
+    """An array holding a copy of view, for solvers that slice and concatenate."""
+    a = array(view.format)
+    a.frombytes(view.cast('B'))
+    return a
+
+
+def sidecar_path(module: ModuleType, path) -> Path:
+    path = Path(path)
+    name = module.__name__.rpartition('.')[2]
+    where = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:12]
+    code = package_sources(module.__file__)
+    what = hashlib.sha256(':'.join(map(file_digest, [path, *code])).encode())
+    return SIDECAR_DIR / f'{name}-{where}-{what.hexdigest()[:16]}.bin'
+
+
+def supported(module: ModuleType) -> bool:
+    """True if module defines its own pack and unpack hooks (not imported names)."""
+    return all(callable(hook) and getattr(hook, '__module__', None) == module.__name__
+               for hook in (getattr(module, 'pack', None), getattr(module, 'unpack', None)))
+
+
+def load_or_parse(module: ModuleType, path) -> Any:
+    """
+    Parsed input for module from its sidecar, parsing the text and writing
+    the sidecar on a miss. Modules without pack/unpack, or inputs whose
+    values do not fit their arrays, are parsed normally.
+    """
+    if not supported(module):
+        return module.parse(path)
+    sidecar = sidecar_path(module, path)
+    try:
+        return module.unpack(load(sidecar))
+    except (FileNotFoundError, ValueError, struct.error):
+        pass
+    data = module.parse(path)
+    try:
+        arrays = module.pack(data)
+    except OverflowError:
+        return data
+    prefix = sidecar.name.rsplit('-', 1)[0]
+    for stale in sidecar.parent.glob(f'{prefix}-*.bin'):
+        stale.unlink(missing_ok=True)
+    dump(arrays, sidecar)
+    return data
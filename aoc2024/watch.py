@@ -0,0 +1,349 @@
+"""
+Re-solve inputs as they change, updating line-oriented days incrementally.
+
+    python -m aoc2024.watch 7 13:scenario.txt --interval 0.2
+
+Each DAY[:PATH] argument watches a file (default: the day's part 1
+input.txt). Files are polled, and on every change the answers are
+printed again.
+
+Days whose answers are built up record by record keep running totals:
+the new input is split into records (lines, or blank-line separated
+machines on day 13), compared with the previous records as multisets,
+and only added or removed records are solved. When bytes are only
+appended, just the new tail is split. This covers day 1's lists, day 2's
+reports, day 5's updates (a rule change re-solves every update), day 7's
+equations, day 13's machines and day 14's robots. Day 14 part 2 searches
+all robots together, so it is re-run in full. Other days are re-solved
+in full on every change.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import Counter
+from pathlib import Path
+from typing import Any, Optional
+
+from .days import day02, day05, day07, day13, day14
+from .parsing import ints, read
+from .registry import discover, fast_engine, hooks, select
+
+
+class Tracker(ABC):
+    """Answers kept up to date from the records added and removed."""
+
+    # Records are whole lines, so appended bytes can be split on their own
+    line_records = True
+
+    def records(self, data: bytes) -> list[bytes]:
+        return [line for line in data.splitlines() if line.strip()]
+
+    @abstractmethod
+    def update(self, added: Counter, removed: Counter) -> None:
+        ...
+
+    @abstractmethod
+    def answers(self) -> dict[int, Any]:
+        ...
+
+
+class Additive(Tracker):
+    """Tracker for days whose answers are sums of one value per record."""
+
+    parts = (1, 2)
+
+    def __init__(self):
+        self.totals = dict.fromkeys(self.parts, 0)
+        self.values: dict[bytes, tuple] = {}
+        self.counts: Counter = Counter()
+
+    @abstractmethod
+    def value(self, record: bytes) -> tuple:
+        """Contribution of one record to each part."""
+
+    def update(self, added, removed):
+        for record, n in removed.items():
+            for part, v in zip(self.parts, self.values[record]):
+                self.totals[part] -= n * v
+            self.counts[record] -= n
+            if not self.counts[record]:
+                del self.counts[record], self.values[record]
+        for record, n in added.items():
+            if record not in self.values:
+                self.values[record] = self.value(record)
+            for part, v in zip(self.parts, self.values[record]):
+                self.totals[part] += n * v
+            self.counts[record] += n
+
+    def answers(self):
+        return dict(self.totals)
+
+
+class Reports(Additive):
+    """Day 2: one report per line."""
+
+    def value(self, record):
+        levels = list(ints(record, signed=True))
+        return int(day02.is_safe(levels)), int(day02.is_dampened_safe(levels))
+
+
+class Equations(Additive):
+    """Day 7: one equation per line."""
+
+    def value(self, record):
+        target, *numbers = ints(record)
+        return (target if day07.can_solve(target, numbers) else 0,
+                target if day07.can_solve(target, numbers, True) else 0)
+
+
+class Machines(Additive):
+    """Day 13: claw machines separated by blank lines."""
+
+    line_records = False
+
+    def records(self, data):
+        return [block.strip() for block in data.replace(b'\r', b'').split(b'\n\n')
+                if block.strip()]
+
+    def value(self, record):
+        machine = tuple(ints(record))
+        shifted = machine[:4] + (machine[4] + day13.PART2_OFFSET, machine[5] + day13.PART2_OFFSET)
+        return day13.cheapest(machine, 100) or 0, day13.cheapest(shifted) or 0
+
+
+class Updates(Additive):
+    """Day 5: updates checked against the rules above the blank line."""
+
+    line_records = False
+
+    def __init__(self):
+        super().__init__()
+        self.rules = frozenset()
+
+    def records(self, data):
+        # Records are prefixed with a digest of the rules, so changing the
+        # rules replaces every update and each one is checked again
+        section, _, updates = data.strip().partition(b'\n\n')
+        self.rules = day05.parse_rules(section)
+        digest = hashlib.blake2b(section, digest_size=8).digest()
+        return [digest + update for update in super().records(updates)]
+
+    def value(self, record):
+        pages = list(ints(record[8:]))
+        if day05.is_valid_order(pages, self.rules):
+            return pages[len(pages) // 2], 0
+        return 0, day05.middle_of_reordered(pages, self.rules)
+
+
+# Batches up to this size are edited in place by bisection; larger ones
+# rebuild the sorted list in one pass
+BISECT_BATCH = 16
+
+
+def _insert(values: list, new: list) -> list:
+    """Sorted values with new added."""
+    if len(new) <= BISECT_BATCH:
+        for value in new:
+            insort(values, value)
+        return values
+    # Timsort merges the two sorted runs in linear time
+    new.sort()
+    values += new
+    values.sort()
+    return values
+
+
+def _delete(values: list, gone: list) -> list:
+    """Sorted values with one occurrence of each of gone removed."""
+    if len(gone) <= BISECT_BATCH:
+        for value in gone:
+            del values[bisect_left(values, value)]
+        return values
+    left = Counter(gone)
+    kept = []
+    for value in values:
+        if left[value]:
+            left[value] -= 1
+        else:
+            kept.append(value)
+    return kept
+
+
+class Lists(Tracker):
+    """Day 1: sorted columns for the distance, column counts for similarity."""
+
+    def __init__(self):
+        self.left, self.right = [], []
+        self.left_counts, self.right_counts = Counter(), Counter()
+        self.similarity = 0
+
+    def _apply(self, pairs: Counter, sign: int) -> None:
+        values = ints(b'\n'.join(pairs.elements()))
+        lefts, rights = list(values[0::2]), list(values[1::2])
+        # Similarity is the sum of x * (count on the left) * (count on the
+        # right) over ids x, so only the ids in this batch change it
+        touched = set(lefts) | set(rights)
+        self.similarity -= self._similarity(touched)
+        if sign > 0:
+            self.left_counts.update(lefts)
+            self.right_counts.update(rights)
+        else:
+            self.left_counts.subtract(lefts)
+            self.right_counts.subtract(rights)
+        self.similarity += self._similarity(touched)
+        edit = _insert if sign > 0 else _delete
+        self.left = edit(self.left, lefts)
+        self.right = edit(self.right, rights)
+
+    def _similarity(self, ids) -> int:
+        left, right = self.left_counts, self.right_counts
+        return sum(x * left[x] * right[x] for x in ids)
+
+    def update(self, added, removed):
+        self._apply(removed, -1)
+        self._apply(added, 1)
+
+    def answers(self):
+        return {1: sum(abs(a - b) for a, b in zip(self.left, self.right)),
+                2: self.similarity}
+
+
+class Robots(Tracker):
+    """Day 14: quadrant counts for part 1; part 2 is searched again."""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.quadrants: Counter = Counter()
+
+    def update(self, added, removed):
+        for counts, sign in ((removed, -1), (added, 1)):
+            for record, n in counts.items():
+                self.counts[record] += sign * n
+                q = day14.quadrant(tuple(ints(record, signed=True)))
+                if q is not None:
+                    self.quadrants[q] += sign * n
+        self.counts = +self.counts
+        self.quadrants = +self.quadrants
+
+    def answers(self):
+        robots = [tuple(ints(record, signed=True)) for record in self.counts.elements()]
+        return {1: day14.safety_factor(self.quadrants),
+                2: day14.part2(tuple(map(list, zip(*robots))) if robots else ([],) * 4)}
+
+
+TRACKERS: dict[int, type[Tracker]] = {
+    1: Lists, 2: Reports, 5: Updates, 7: Equations, 13: Machines, 14: Robots,
+}
+
+
+class Watch:
+    """One watched input file and its tracker (or full re-solve)."""
+
+    def __init__(self, day: int, path: Path):
+        self.day, self.path = day, Path(path)
+        self.tracker = TRACKERS[day]() if day in TRACKERS else None
+        self.stamp = None
+        self.data = b''
+        self.records: Counter = Counter()
+
+    def refresh(self) -> Optional[dict]:
+        """Re-solve if the file changed since the last call; None if it did not."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        stamp = (st.st_size, st.st_mtime_ns)
+        if stamp == self.stamp:
+            return None
+        self.stamp = stamp
+        start = time.perf_counter()
+        data = read(self.path)
+        report = {'day': self.day, 'input': str(self.path)}
+        try:
+            if self.tracker is None:
+                report['answers'] = self._solve(data)
+            else:
+                report.update(self._track(data))
+        except Exception as e:
+            report['error'] = f'{type(e).__name__}: {e}'
+            # Start over on the next change rather than trust partial totals
+            self.tracker = TRACKERS[self.day]() if self.day in TRACKERS else None
+            self.data, self.records = b'', Counter()
+        report['seconds'] = time.perf_counter() - start
+        return report
+
+    def _track(self, data: bytes) -> dict:
+        tracker = self.tracker
+        if tracker.line_records and self.data.endswith(b'\n') and data.startswith(self.data):
+            added, removed = Counter(tracker.records(data[len(self.data):])), Counter()
+            self.records.update(added)
+        else:
+            records = Counter(tracker.records(data))
+            added, removed = records - self.records, self.records - records
+            self.records = records
+        self.data = data
+        change = {'added': sum(added.values()), 'removed': sum(removed.values())}
+        tracker.update(added, removed)
+        return {'answers': tracker.answers(), **change}
+
+    def _solve(self, data: bytes) -> dict:
+        module = fast_engine(self.day)
+        if module is not None:
+            parsed = module.parse(data)
+            return {1: module.part1(parsed), 2: module.part2(parsed)}
+        answers = {}
+        for solver in select(discover(), [str(self.day)]):
+            _, parse, answer = hooks(solver)
+            answers[solver.part] = answer(parse(self.path))
+        return answers
+
+
+def _target(spec: str) -> tuple[int, Path]:
+    day, _, path = spec.partition(':')
+    day = int(day)
+    return day, Path(path) if path else select(discover(), [f'{day}/1'])[0].default_input
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aoc2024.watch',
+                                     description='Re-solve inputs whenever they change.')
+    parser.add_argument('targets', nargs='+', metavar='DAY[:PATH]')
+    parser.add_argument('--interval', type=float, default=0.25, help='seconds between polls')
+    parser.add_argument('--once', action='store_true', help='solve once and exit')
+    parser.add_argument('--json', action='store_true', help='print one JSON object per change')
+    args = parser.parse_args(argv)
+
+    try:
+        watches = [Watch(*_target(spec)) for spec in args.targets]
+    except ValueError as e:
+        print(f'aoc2024.watch: {e}', file=sys.stderr)
+        return 2
+    try:
+        while True:
+            for watch in watches:
+                report = watch.refresh()
+                if report is None:
+                    continue
+                if args.json:
+                    print(json.dumps(report, default=str), flush=True)
+                    continue
+                answers = report.get('error') or '  '.join(
+                    f'{p}: {a}' for p, a in report['answers'].items())
+                change = f' +{report["added"]} -{report["removed"]}' if 'added' in report else ''
+                print(f'{time.strftime("%H:%M:%S")}  day {report["day"]}{change} '
+                      f'({report["seconds"] * 1000:.1f}ms)  {answers}', flush=True)
+            if args.once:
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -41,6 +41,10 @@ Your actual left and right lists contain many location IDs. What is the total di
 your lists?
 """
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 # Read columns from text file
 def read_two_columns(filename):
     column1 = []
@@ -60,14 +64,27 @@ def sort_list(values):
     """
     return sorted(values)
 
-# Solve the puzzle
-col1, col2 = read_two_columns('input.txt')
-col1_sorted = sort_list(col1)
-col2_sorted = sort_list(col2)
+# Total distance
+def total_distance(col1, col2):
+    """
+    Pair up the sorted columns and add up the distances
+    """
+    col1_sorted = sort_list(col1)
+    col2_sorted = sort_list(col2)
+
+    distance = 0
 
-distance = 0
+    for num in range(len(col1_sorted)):
+        distance += abs(col1_sorted[num] - col2_sorted[num])
+    return distance
 
-for num in range(len(col1_sorted)):
-    distance += abs(col1_sorted[num] - col2_sorted[num])
+# Runner hooks
+def parse(path):
+    return read_two_columns(path)
 
-print(distance) # should print 1830467
+def answer(columns):
+    return total_distance(*columns)
+
+# Solve the puzzle
+if __name__ == '__main__':
+    print(answer(parse(INPUT))) # should print 1830467
@@ -49,6 +49,9 @@ Once again consider your left and right lists. What is their similarity score?
 """
 
 from collections import Counter
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
 
 # Read columns from text file
 def read_two_columns(filename):
@@ -70,13 +73,25 @@ def count_matches(match1, match2):
     match2_counter = Counter(match2)
     return [match2_counter[num] for num in match1]
 
-# Solve the puzzle
-col1, col2 = read_two_columns('input.txt')
+# Similarity score
+def similarity_score(col1, col2):
+    """
+    Add up each left number multiplied by its count in the right list
+    """
+    similarity = 0
+
+    for i in range(len(col1)):
+        matches = count_matches(col1, col2)
+        similarity += abs((col1[i]) * (matches[i]))
+    return similarity
 
-similarity = 0
+# Runner hooks
+def parse(path):
+    return read_two_columns(path)
 
-for i in range(len(col1)):
-    matches = count_matches(col1, col2)
-    similarity += abs((col1[i]) * (matches[i]))
+def answer(columns):
+    return similarity_score(*columns)
 
-print(similarity) # Should print 26674158
\ No newline at end of file
+# Solve the puzzle
+if __name__ == '__main__':
+    print(answer(parse(INPUT))) # Should print 26674158
\ No newline at end of file
@@ -91,7 +91,11 @@ The reindeer gleefully carries over a protractor and adds it to the pile. What i
 of the scores of all trailheads on your topographic map?
 """
 
-def read_input(filename='input.txt'):
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+def read_input(filename=INPUT):
     '''Read and parse input file into a 2D grid'''
     with open(filename) as f:
         return [[int(c) for c in line.strip()] for line in f]
@@ -148,6 +152,13 @@ def solve(grid):
     trailheads = find_trailheads(grid)
     return sum(count_reachable_peaks(grid, pos) for pos in trailheads)
 
+# Runner hooks
+def parse(path):
+    return read_input(path)
+
+def answer(grid):
+    return solve(grid)
+
 def main():
     '''Main solution entry point'''
     grid = read_input()
@@ -70,7 +70,11 @@ toothpicks and bits of paper and is using them to mark trailheads on your topogr
 map. What is the sum of the ratings of all trailheads?
 """
 
-def read_input(filename='input.txt'):
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+def read_input(filename=INPUT):
     '''Read and parse input file into a 2D grid'''
     with open(filename) as f:
         return [[int(c) for c in line.strip()] for line in f]
@@ -128,6 +132,13 @@ def solve(grid):
     trailheads = find_trailheads(grid)
     return sum(count_distinct_trails(grid, pos) for pos in trailheads)
 
+# Runner hooks
+def parse(path):
+    return read_input(path)
+
+def answer(grid):
+    return solve(grid)
+
 def main():
     '''Main solution entry point'''
     grid = read_input()
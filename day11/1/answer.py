@@ -71,7 +71,11 @@ In this example, after blinking six times, you would have `22` stones. After bli
 Consider the arrangement of stones in front of you. _How many stones will you have
 after blinking 25 times?_"""
 
-def read_input(filename='input.txt'):
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+def read_input(filename=INPUT):
     '''Read space-separated numbers from input file'''
     with open(filename) as f:
         return [int(x) for x in f.read().strip().split()]
@@ -112,5 +116,12 @@ def solve():
     initial_stones = read_input()
     return count_stones_after_blinks(initial_stones, 25)
 
+# Runner hooks
+def parse(path):
+    return read_input(path)
+
+def answer(stones):
+    return count_stones_after_blinks(stones, 25)
+
 if __name__ == '__main__':
     print(solve()) # should be 203228
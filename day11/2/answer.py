@@ -7,6 +7,9 @@ _How many stones will you have after blinking 75 times?_
 """
 
 from collections import Counter
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
 
 def transform_counts(counts: Counter) -> Counter:
     '''Transform stone counts according to rules'''
@@ -24,14 +27,27 @@ def transform_counts(counts: Counter) -> Counter:
             new_counts[num * 2024] += count
     return new_counts
 
-def solve(input_file: str = 'input.txt') -> int:
+def read_input(input_file: str) -> list[int]:
+    '''Read space-separated numbers from input file'''
     with open(input_file) as f:
-        stones = [int(x) for x in f.read().strip().split()]
-    
+        return [int(x) for x in f.read().strip().split()]
+
+def count_stones(stones: list[int], num_blinks: int) -> int:
+    '''Count stones after num_blinks transformations'''
     counts = Counter(stones)
-    for _ in range(75):
+    for _ in range(num_blinks):
         counts = transform_counts(counts)
     return sum(counts.values())
 
+def solve(input_file: str = INPUT) -> int:
+    return count_stones(read_input(input_file), 75)
+
+# Runner hooks
+def parse(path: str) -> list[int]:
+    return read_input(path)
+
+def answer(stones: list[int]) -> int:
+    return count_stones(stones, 75)
+
 if __name__ == '__main__':
     print(solve()) # should be 240884656550923
\ No newline at end of file
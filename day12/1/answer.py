@@ -116,6 +116,9 @@ So, it has a total price of 1930.
 What is the total price of fencing all regions on your map?
 """
 from collections import defaultdict
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
 
 def read_input(filename):
     """Read and return the garden plot map from the input file"""
@@ -188,12 +191,15 @@ def calculate_total_price(stats):
     """Calculate the total price based on area and perimeter of all regions"""
     return sum(area * perimeter for area, perimeter in stats.values())
 
-def solve_puzzle(filename='input.txt'):
+def solve_puzzle(filename=INPUT):
     """Main function to solve the garden fence puzzle"""
     # Read and parse input
     input_text = read_input(filename)
     garden_map = parse_map(input_text)
-    
+    return price_garden(garden_map)
+
+def price_garden(garden_map):
+    """Price the fencing for an already parsed garden map"""
     # Find regions using flood fill
     regions = find_regions(garden_map)
     
@@ -203,6 +209,13 @@ def solve_puzzle(filename='input.txt'):
     # Calculate and return total price
     return calculate_total_price(stats)
 
+# Runner hooks
+def parse(path):
+    return parse_map(read_input(path))
+
+def answer(garden_map):
+    return price_garden(garden_map)
+
 if __name__ == '__main__':
     result = solve_puzzle()
     print(f'The total price of fencing all regions is: {result}') # should print 1461806
@@ -73,8 +73,14 @@ Adding these together produces its new total price of 1206.
 What is the new total price of fencing all regions on your map?
 """
 
+import logging
 from collections import deque
 from typing import List, Set, Tuple
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+log = logging.getLogger('aoc2024.day12.part2')
 
 def read_input(filename: str) -> List[str]:
     """Read and return the garden map from the input file"""
@@ -165,13 +171,15 @@ def calculate_total_price(grid: List[str]) -> int:
     """Calculate the total price of all regions in the garden"""
     total_price = 0
     regions = find_all_regions(grid)
+    debug = log.isEnabledFor(logging.DEBUG)
 
     for region in regions:
         area = len(region)
         sides = count_region_sides(region)
         price = area * sides
-        plant_type = grid[next(iter(region))[0]][next(iter(region))[1]]
-        print(f'Region {plant_type}: Area={area}, Sides={sides}, Price={price}')
+        if debug:
+            plant_type = grid[next(iter(region))[0]][next(iter(region))[1]]
+            log.debug('Region %s: Area=%d, Sides=%d, Price=%d', plant_type, area, sides, price)
         total_price += price
 
     return total_price
@@ -181,6 +189,13 @@ def solve(filename: str) -> int:
     grid = read_input(filename)
     return calculate_total_price(grid)
 
+# Runner hooks
+def parse(path: str) -> List[str]:
+    return read_input(path)
+
+def answer(grid: List[str]) -> int:
+    return calculate_total_price(grid)
+
 if __name__ == '__main__':
-    result = solve('input.txt')
+    result = solve(INPUT)
     print(f'Total price: {result}') # should be 887932
@@ -78,6 +78,9 @@ import re
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from itertools import product
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
 
 @dataclass
 class ClawMachine:
@@ -140,7 +143,10 @@ def solve_puzzle(filename: str) -> int:
     """
     Solve the claw machine puzzle and return minimum total tokens needed.
     """
-    machines = parse_input(filename)
+    return total_tokens_needed(parse_input(filename))
+
+def total_tokens_needed(machines: list[ClawMachine]) -> int:
+    """Sum the cheapest winning token cost over all machines."""
     total_tokens = 0
 
     for i, machine in enumerate(machines):
@@ -152,6 +158,13 @@ def solve_puzzle(filename: str) -> int:
 
     return total_tokens
 
+# Runner hooks
+def parse(path: str) -> list[ClawMachine]:
+    return parse_input(path)
+
+def answer(machines: list[ClawMachine]) -> int:
+    return total_tokens_needed(machines)
+
 if __name__ == '__main__':
-    result = solve_puzzle('input.txt')
+    result = solve_puzzle(INPUT)
     print(f'Minimum tokens needed: {result}') # should be 37680
@@ -152,6 +152,9 @@ and 103 tiles tall. What will the safety factor be after exactly 100 seconds hav
 import re
 from collections import defaultdict
 from typing import List, Tuple, Dict
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
 
 class Robot:
     """Represents a robot with position and velocity."""
@@ -218,7 +221,15 @@ def calculate_safety_factor(
     height: int = 103
 ) -> int:
     """Calculate the safety factor after given time."""
-    robots = parse_input(input_txt)
+    return safety_factor(parse_input(input_txt), time, width, height)
+
+def safety_factor(
+    robots: List[Robot],
+    time: int = 100,
+    width: int = 101,
+    height: int = 103
+) -> int:
+    """Calculate the safety factor for already parsed robots."""
     positions = [get_position(robot, time, width, height) for robot in robots]
     quadrant_counts = count_robots_by_quadrant(positions, width, height)
 
@@ -229,6 +240,14 @@ def calculate_safety_factor(
 
     return count_result
 
+# Runner hooks
+def parse(path: str) -> List[Robot]:
+    with open(path, 'r', encoding='us-ascii') as f:
+        return parse_input(f.read())
+
+def answer(robots: List[Robot]) -> int:
+    return safety_factor(robots)
+
 def run_tests():
     """Run tests using the example from the puzzle."""
     example_input = '''p=0,4 v=3,-3
@@ -256,7 +275,7 @@ if __name__ == '__main__':
 
     # Process actual input file
     try:
-        with open('input.txt', 'r', encoding='us-ascii') as f:
+        with open(INPUT, 'r', encoding='us-ascii') as f:
             input_text = f.read()
         result = calculate_safety_factor(input_text)
         print(f'Safety factor for actual input: {result}') # should be 209409792
@@ -7,10 +7,16 @@ tree_.
 _What is the fewest number of seconds that must elapse for the robots
 to display the Easter egg?_
 """
+import logging
 import re
 from typing import List
 from dataclasses import dataclass
 from collections import defaultdict, namedtuple
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+log = logging.getLogger('aoc2024.day14.part2')
 
 @dataclass(frozen=True)
 class Point:
@@ -59,7 +65,7 @@ def has_consecutive_robots(points: List[Point], required_length: int = 10) -> bo
                 current = 1
 
             if longest >= required_length:
-                print(f'Found {longest} consecutive robots in row {y}')
+                log.debug('Found %d consecutive robots in row %d', longest, y)
                 return True
 
     return False
@@ -71,11 +77,18 @@ def find_pattern(
     height: int = 103
 ) -> int:
     """Find the earliest time when 10 robots form a consecutive line."""
-    bots = parse_input(robot_pattern)
+    return search_pattern(parse_input(robot_pattern), max_time, width, height)
 
+def search_pattern(
+    bots: List[Robot],
+    max_time: int = 10000,
+    width: int = 101,
+    height: int = 103
+) -> int:
+    """Find the earliest pattern time for already parsed robots."""
     for t in range(max_time):
         if t % 1000 == 0:
-            print(f'Checking time {t}...')
+            log.info('Checking time %d...', t)
 
         bot_positions = [get_position(robot, t, width, height) for robot in bots]
         if has_consecutive_robots(bot_positions):
@@ -91,6 +104,14 @@ def visualize_positions(positions_vis: List[Point], width: int, height: int) ->
             grid[p.y][p.x] = '*'
     return '\n'.join(''.join(row) for row in grid)
 
+# Runner hooks
+def parse(path: str) -> List[Robot]:
+    with open(path, 'r', encoding='us-ascii') as f:
+        return parse_input(f.read())
+
+def answer(bots: List[Robot]) -> int:
+    return search_pattern(bots)
+
 def run_test():
     """Run test with example input."""
     example_data = '''p=0,4 v=3,-3
@@ -109,7 +130,7 @@ if __name__ == '__main__':
 
     # Process actual input file
     try:
-        with open('input.txt', 'r', encoding='us-ascii') as f:
+        with open(INPUT, 'r', encoding='us-ascii') as f:
             robot_data = f.read()
         result = find_pattern(robot_data)
         if result >= 0:
@@ -35,6 +35,10 @@ So, in this example, 2 reports are safe.
 Analyze the unusual data from the engineers. How many reports are safe?
 """
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 def is_valid_row(row):
     """
     Check if a row of numbers is valid based on both conditions:
@@ -62,19 +66,38 @@ def is_valid_row(row):
             return False
     return True
 
+def read_rows(filename):
+    """
+    Read the file into lists of integers, one per line
+    """
+    with open(filename, 'r') as file:
+        return [list(map(int, line.split())) for line in file]
+
+def count_safe(rows):
+    """
+    Count the rows that pass is_valid_row
+    """
+    safe = 0
+    for row in rows:
+        result = is_valid_row(row)
+        if result == True:
+            safe += 1
+    return safe
+
 def process_input_file(filename):
     """
     Process the file and increment safe counter if True
     """
-    safe = 0
-    with open(filename, 'r') as file:
-        for line_number, line in enumerate(file, 1):
-            # Convert lines to lists of integers
-            row = list(map(int, line.split()))
-            result = is_valid_row(row)
-            if result == True:
-                safe += 1
+    safe = count_safe(read_rows(filename))
     print(f'Total Safe: {safe}')
 
+# Runner hooks
+def parse(path):
+    return read_rows(path)
+
+def answer(rows):
+    return count_safe(rows)
+
 # solve the puzzle
-process_input_file('input.txt') # Should print 213
+if __name__ == '__main__':
+    process_input_file(INPUT) # Should print 213
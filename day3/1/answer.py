@@ -27,7 +27,13 @@ Scan the corrupted memory for uncorrupted mul instructions.
 What do you get if you add up all of the results of the multiplications?
 """
 
+import logging
 import re
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+log = logging.getLogger('aoc2024.day3.part1')
 
 def parse_and_calculate_mul(filename):
     """
@@ -36,6 +42,30 @@ def parse_and_calculate_mul(filename):
     Args:
         filename (str): Path to the input text file
     
+    Returns:
+        int: Sum of all valid multiplication results
+    """
+    total = 0
+
+    try:
+        with open(filename, 'r') as file:
+            content = file.read()
+            total = calculate_mul(content)
+
+    except FileNotFoundError:
+        print(f'Error: File {filename} not found.')
+    except Exception as e:
+        print(f'An error occurred: {e}')
+
+    return total
+
+def calculate_mul(content):
+    """
+    Sum every valid mul(X,Y) expression found in content.
+
+    Args:
+        content (str): Corrupted memory text
+
     Returns:
         int: Sum of all valid multiplication results
     """
@@ -54,29 +84,29 @@ def parse_and_calculate_mul(filename):
 
     total = 0
 
-    try:
-        with open(filename, 'r') as file:
-            content = file.read()
+    # Find all valid mul() expressions
+    matches = re.findall(pattern, content)
 
-            # Find all valid mul() expressions
-            matches = re.findall(pattern, content)
+    # Calculate and sum the multiplications
+    debug = log.isEnabledFor(logging.DEBUG)
+    for x, y in matches:
+        result = int(x) * int(y)
+        total += result
+        if debug:
+            log.debug('Found: mul(%s,%s) = %s, total %s', x, y, result, total)
 
-            # Calculate and sum the multiplications
-            for x, y in matches:
-                result = int(x) * int(y)
-                total += result
-                print(f'Found: mul({x},{y}) = {result}')
-                print(f'Total: {total}')
+    return total
 
-    except FileNotFoundError:
-        print(f'Error: File {filename} not found.')
-    except Exception as e:
-        print(f'An error occurred: {e}')
+# Runner hooks
+def parse(path):
+    with open(path, 'r') as file:
+        return file.read()
 
-    return total
+def answer(content):
+    return calculate_mul(content)
 
 def main():
-    result = parse_and_calculate_mul('input.txt')
+    result = parse_and_calculate_mul(INPUT)
     print(f'\nTotal sum of multiplications: {result}') # should be 173419328
 
 if __name__ == '__main__':
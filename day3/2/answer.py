@@ -25,7 +25,13 @@ Handle the new instructions; what do you get if you add up all of the
 results of just the enabled multiplications?
 """
 
+import logging
 import re
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+log = logging.getLogger('aoc2024.day3.part2')
 
 def parse_and_calculate_mul(filename):
     """
@@ -37,28 +43,12 @@ def parse_and_calculate_mul(filename):
     Returns:
         int: Sum of all valid multiplication results
     """
-    pattern_mul = r'mul\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)'
-    pattern_do = r'do\(\)'
-    pattern_dont = r'don\'t\(\)'
-
     total = 0
-    mul_enabled = True
 
     try:
         with open(filename, 'r', encoding='us-ascii') as file:
             content = file.read()
-
-            # Process instructions in order
-            for match in re.finditer(f"{pattern_mul}|{pattern_do}|{pattern_dont}", content):
-                if match.group().startswith('do()'):
-                    mul_enabled = True
-                elif match.group().startswith('don\'t()'):
-                    mul_enabled = False
-                elif match.group().startswith('mul(') and mul_enabled:
-                    x, y = match.groups()
-                    result = int(x) * int(y)
-                    total += result
-                    print(f"Found: mul({x},{y}) = {result}")
+            total = calculate_mul(content)
 
     except FileNotFoundError:
         print(f'Error: File {filename} not found.')
@@ -67,8 +57,49 @@ def parse_and_calculate_mul(filename):
 
     return total
 
+def calculate_mul(content):
+    """
+    Sum the mul(X,Y) expressions in content that are enabled by do()/don't().
+
+    Args:
+        content (str): Corrupted memory text
+
+    Returns:
+        int: Sum of all enabled multiplication results
+    """
+    pattern_mul = r'mul\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)'
+    pattern_do = r'do\(\)'
+    pattern_dont = r'don\'t\(\)'
+
+    total = 0
+    mul_enabled = True
+
+    # Process instructions in order
+    debug = log.isEnabledFor(logging.DEBUG)
+    for match in re.finditer(f"{pattern_mul}|{pattern_do}|{pattern_dont}", content):
+        if match.group().startswith('do()'):
+            mul_enabled = True
+        elif match.group().startswith('don\'t()'):
+            mul_enabled = False
+        elif match.group().startswith('mul(') and mul_enabled:
+            x, y = match.groups()
+            result = int(x) * int(y)
+            total += result
+            if debug:
+                log.debug('Found: mul(%s,%s) = %s', x, y, result)
+
+    return total
+
+# Runner hooks
+def parse(path):
+    with open(path, 'r', encoding='us-ascii') as file:
+        return file.read()
+
+def answer(content):
+    return calculate_mul(content)
+
 def main():
-    result = parse_and_calculate_mul('input.txt')
+    result = parse_and_calculate_mul(INPUT)
     print(f'\nTotal sum of multiplications: {result}') # result should be 90669332
 
 if __name__ == '__main__':
@@ -8,30 +8,36 @@ or even overlapping other words. It's a little unusual, though, as you don't mer
 to find one instance of XMAS - you need to find all of them.
 """
 
+import logging
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+log = logging.getLogger('aoc2024.day4.part1')
+
 # Based off of https://www.geeksforgeeks.org/search-a-word-in-a-2d-grid-of-characters/
 # with modifications for counting and reading from file
 
-COUNT = []
-
 def read_grid(filename):
-    """open file and print info to validate"""
+    """open file and log info to validate"""
     with open(filename, 'r', encoding='us-ascii') as file:
         grid = [list(line.strip()) for line in file]
-    print(f'Number of rows: {len(grid)}')
-    print(f'Number of columns: {len(grid[0])}')
+    log.info('Number of rows: %d', len(grid))
+    log.info('Number of columns: %d', len(grid[0]))
     return grid
 
 def search_2d(grid, row, col, word):
-    """search the grid"""
+    """count matches of word starting at (row, col)"""
     m = len(grid)
     n = len(grid[0])
 
-    # return false if the given coordinate
+    # return 0 if the given coordinate
     # does not match with first index char.
     if grid[row][col] != word[0]:
-        return False
+        return 0
 
     len_word = len(word)
+    found = 0
 
     # x and y are used to set the direction in which
     # word needs to be searched.
@@ -65,17 +71,26 @@ def search_2d(grid, row, col, word):
         # If all character matched, then value of must
         # be equal to length of word
         if k == len_word:
-            COUNT.append((row, col))
+            found += 1
 
-def main():
-    grid = read_grid('input.txt')
-    word = 'XMAS'
+    return found
+
+def count_word(grid, word):
+    """search every cell and return the number of matches"""
     m = len(grid)
     n = len(grid[0])
-    for i in range(m):
-        for j in range(n):
-            search_2d(grid, i, j, word)
-    print('Total Occurrences: ', len(COUNT)) # answer should be 2397
+    return sum(search_2d(grid, i, j, word) for i in range(m) for j in range(n))
+
+# runner hooks
+def parse(path):
+    return read_grid(path)
+
+def answer(grid):
+    return count_word(grid, 'XMAS')
+
+def main():
+    grid = read_grid(INPUT)
+    print('Total Occurrences: ', count_word(grid, 'XMAS')) # answer should be 2397
 
 if __name__ == '__main__':
     main()
@@ -13,12 +13,19 @@ Irrelevant characters have again been replaced with . in the above diagram. With
 each MAS can be written forwards or backwards.
 """
 
+import logging
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+log = logging.getLogger('aoc2024.day4.part2')
+
 def read_grid(filename):
-    """open file and print info to validate"""
+    """open file and log info to validate"""
     with open(filename, 'r', encoding='us-ascii') as file:
         grid = [list(line.strip()) for line in file]
-    print(f'Number of rows: {len(grid)}')
-    print(f'Number of columns: {len(grid[0])}')
+    log.info('Number of rows: %d', len(grid))
+    log.info('Number of columns: %d', len(grid[0]))
     return grid
 
 def search_2d(grid):
@@ -30,8 +37,8 @@ def search_2d(grid):
 
     # find all coords that contain letter "A"
     # stay 1 character away from the boundary
-    for i in range(m - 1):
-        for j in range(n - 1):
+    for i in range(1, m - 1):
+        for j in range(1, n - 1):
             if grid[i][j] == 'A':
                 candidates.append((i, j))
 
@@ -43,8 +50,15 @@ def search_2d(grid):
                 count += 1
     return count
 
+# runner hooks
+def parse(path):
+    return read_grid(path)
+
+def answer(grid):
+    return search_2d(grid)
+
 def main():
-    grid = read_grid('input.txt')
+    grid = read_grid(INPUT)
     count = search_2d(grid)
     print('Total Occurrences:', count)
 
@@ -97,6 +97,13 @@ Determine which updates are already in the correct order. What do you get if you
 page number from those correctly-ordered updates?
 """
 
+import logging
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
+log = logging.getLogger('aoc2024.day5.part1')
+
 def parse_input(text):
     """seperate rules and updates section of input file"""
     rules_section, updates_section = text.strip().split('\n\n')
@@ -116,18 +123,32 @@ def get_middle_page(pages):
     """get the middle page"""
     return pages[len(pages) // 2]
 
+def sum_valid_middles(rules, updates):
+    """keep the correctly ordered updates and sum their middle pages"""
+    valid_updates = [update for update in updates if is_valid_order(update, rules)]
+    return sum(get_middle_page(update) for update in valid_updates), valid_updates
+
 def solve_puzzle(input_text):
     "solve puzzel and return middle-page sum"
     rules, updates = parse_input(input_text)
-    valid_updates = [update for update in updates if is_valid_order(update, rules)]
-    return sum(get_middle_page(update) for update in valid_updates), valid_updates
+    return sum_valid_middles(rules, updates)
+
+# runner hooks
+def parse(path):
+    with open(path, 'r', encoding='us-ascii') as f:
+        return parse_input(f.read())
+
+def answer(data):
+    result, _ = sum_valid_middles(*data)
+    return result
 
 def main(filename):
     """get file and display results"""
     with open(filename, 'r', encoding='us-ascii') as f:
         result, valid_updates = solve_puzzle(f.read())
     print(f'Sum of middle pages: {result}') # should return 6260
-    print('Valid updates:', *valid_updates, sep='\n')
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug('Valid updates:\n%s', '\n'.join(map(str, valid_updates)))
 
 if __name__ == '__main__':
-    main('input.txt')
+    main(INPUT)
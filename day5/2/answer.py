@@ -20,6 +20,9 @@ the middle page numbers after correctly ordering just those updates?
 """
 
 from collections import defaultdict, deque
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
 
 def parse_input(text):
     """parse the two sections of the input file into rules and updates"""
@@ -67,10 +70,8 @@ def get_middle_page(pages):
     """get the middle page"""
     return pages[len(pages) // 2]
 
-def solve_part2(input_text):
-    """solve the puzzle"""
-    rules, updates = parse_input(input_text)
-
+def sum_reordered_middles(rules, updates):
+    """reorder the invalid updates and sum their middle pages"""
     middle_sum = 0
     for update in updates:
         if not is_valid_order(update, rules):
@@ -79,6 +80,19 @@ def solve_part2(input_text):
 
     return middle_sum
 
+def solve_part2(input_text):
+    """solve the puzzle"""
+    rules, updates = parse_input(input_text)
+    return sum_reordered_middles(rules, updates)
+
+# runner hooks
+def parse(path):
+    with open(path) as f:
+        return parse_input(f.read())
+
+def answer(data):
+    return sum_reordered_middles(*data)
+
 def main(filename):
     with open(filename) as f:
         result = solve_part2(f.read())
@@ -86,4 +100,4 @@ def main(filename):
 
 if __name__ == '__main__':
     import sys
-    main('input.txt')
+    main(INPUT)
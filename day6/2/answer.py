@@ -109,6 +109,10 @@ You need to get the guard stuck in a loop by adding a single new obstruction. Ho
 many different positions could you choose for this obstruction?
 """
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 def read_map(filename):
     with open(filename) as f:
         return [list(line.strip()) for line in f]
@@ -163,7 +167,9 @@ def simulate_path(grid, obstruction_pos=None):
         path.append(state)
 
 def find_loop_positions(filename):
-    grid = read_map(filename)
+    return count_loop_positions(read_map(filename))
+
+def count_loop_positions(grid):
     height, width = len(grid), len(grid[0])
     guard_pos = find_guard(grid)
     valid_positions = set()
@@ -181,6 +187,13 @@ def find_loop_positions(filename):
     
     return len(valid_positions)
 
+# Runner hooks
+def parse(path):
+    return read_map(path)
+
+def answer(grid):
+    return count_loop_positions(grid)
+
 if __name__ == "__main__":
-    result = find_loop_positions("input.txt")
+    result = find_loop_positions(INPUT)
     print(f"There are {result} possible positions for the obstruction.")
\ No newline at end of file
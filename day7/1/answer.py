@@ -42,6 +42,10 @@ the test values for the three equations listed above is 3749.
 Determine which equations could possibly be true. What is their total calibration result?
 """
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 def evaluate_expression(nums, operators):
     result = nums[0]
     for i, op in enumerate(operators):
@@ -74,8 +78,8 @@ def can_solve_equation(test_value, numbers):
 
     return False
 
-def solve_puzzle(input_text):
-    total = 0
+def parse_equations(input_text):
+    equations = []
 
     for line in input_text.strip().split('\n'):
         if not line:
@@ -84,11 +88,30 @@ def solve_puzzle(input_text):
         test_value, nums = line.split(': ')
         test_value = int(test_value)
         numbers = [int(x) for x in nums.split()]
+        equations.append((test_value, numbers))
+
+    return equations
 
+def total_calibration(equations):
+    total = 0
+
+    for test_value, numbers in equations:
         if can_solve_equation(test_value, numbers):
             total += test_value
 
     return total
 
-with open('input.txt') as f:
-    print(f'Solution: {solve_puzzle(f.read())}') # should be 1611660863222
+def solve_puzzle(input_text):
+    return total_calibration(parse_equations(input_text))
+
+# Runner hooks
+def parse(path):
+    with open(path) as f:
+        return parse_equations(f.read())
+
+def answer(equations):
+    return total_calibration(equations)
+
+if __name__ == '__main__':
+    with open(INPUT) as f:
+        print(f'Solution: {solve_puzzle(f.read())}') # should be 1611660863222
@@ -24,6 +24,10 @@ Using your new knowledge of elephant hiding spots, determine which equations
 could possibly be true. What is their total calibration result?
 """
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 def evaluate_expression(nums, operators):
     result = nums[0]
     for i, op in enumerate(operators):
@@ -59,19 +63,27 @@ def can_solve_equation(test_value, numbers):
             continue            
     return False
 
-def solve_puzzle(input_text):
-    total = 0
+def parse_equations(input_text):
+    equations = []
     for line in input_text.strip().split('\n'):
         if not line:
             continue
         test_value, nums = line.split(': ')
         test_value = int(test_value)
         numbers = [int(x) for x in nums.split()]
+        equations.append((test_value, numbers))
+    return equations
 
+def total_calibration(equations):
+    total = 0
+    for test_value, numbers in equations:
         if can_solve_equation(test_value, numbers):
             total += test_value
     return total
 
+def solve_puzzle(input_text):
+    return total_calibration(parse_equations(input_text))
+
 # Verify example
 example = """
 190: 10 19
@@ -85,7 +97,16 @@ example = """
 292: 11 6 16 20
 """
 
-print(f"Example solution: {solve_puzzle(example)}")  # Should print 11387
+# Runner hooks
+def parse(path):
+    with open(path) as f:
+        return parse_equations(f.read())
+
+def answer(equations):
+    return total_calibration(equations)
+
+if __name__ == '__main__':
+    print(f"Example solution: {solve_puzzle(example)}")  # Should print 11387
 
-with open('input.txt') as f:
-    print(f"Solution: {solve_puzzle(f.read())}") # Should be 945341732469724
+    with open(INPUT) as f:
+        print(f"Solution: {solve_puzzle(f.read())}") # Should be 945341732469724
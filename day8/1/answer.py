@@ -90,6 +90,10 @@ Calculate the impact of the signal. How many unique locations within the bounds
 contain an antinode?
 """
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 def read_map(filename):
     with open(filename) as f:
         return [list(line.strip()) for line in f.readlines()]
@@ -135,11 +139,21 @@ def find_antinodes(grid, antennas):
                                 antinodes.add(point)
     return antinodes
 
-def solve(filename):
-    grid = read_map(filename)
+def count_antinodes(grid):
     antennas = find_antennas(grid)
     antinodes = find_antinodes(grid, antennas)
     return len(antinodes)
 
+def solve(filename):
+    return count_antinodes(read_map(filename))
+
+# Runner hooks
+def parse(path):
+    return read_map(path)
+
+def answer(grid):
+    return count_antinodes(grid)
+
 # Run solution
-print(solve('input.txt')) # should be 364
\ No newline at end of file
+if __name__ == '__main__':
+    print(solve(INPUT)) # should be 364
\ No newline at end of file
@@ -44,6 +44,10 @@ Calculate the impact of the signal using this updated model. How many unique loc
 within the bounds of the map contain an antinode?
 """
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 def read_map(filename):
     with open(filename) as f:
         return [list(line.strip()) for line in f.readlines()]
@@ -86,10 +90,20 @@ def find_antinodes(grid, antennas):
 
     return antinodes
 
-def solve(filename):
-    grid = read_map(filename)
+def count_antinodes(grid):
     antennas = find_antennas(grid)
     antinodes = find_antinodes(grid, antennas)
     return len(antinodes)
 
-print(solve('input.txt')) # should be 1231
\ No newline at end of file
+def solve(filename):
+    return count_antinodes(read_map(filename))
+
+# Runner hooks
+def parse(path):
+    return read_map(path)
+
+def answer(grid):
+    return count_antinodes(grid)
+
+if __name__ == '__main__':
+    print(solve(INPUT)) # should be 1231
\ No newline at end of file
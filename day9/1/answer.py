@@ -77,6 +77,10 @@ resulting filesystem checksum?_ The input is a file named input.txt that contain
 a single, very long line of text.
 '''
 
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
+
 def solve_disk_defrag(disk_map, debug=False):
     '''Solve disk defragmentation puzzle moving one block at a time'''
     # Create initial layout
@@ -125,7 +129,16 @@ def test_example():
     assert result == 1928, f'Expected 1928, got {result}'
     print('Test passed!')
 
-test_example()
+# Runner hooks
+def parse(path):
+    with open(path, encoding='us-ascii') as f:
+        return f.read().strip()
+
+def answer(disk_map):
+    return solve_disk_defrag(disk_map)
+
+if __name__ == '__main__':
+    test_example()
 
-with open('input.txt', encoding='us-ascii') as f:
-    print(f'Final checksum: {solve_disk_defrag(f.read().strip())}') # should be 6200294120911
+    with open(INPUT, encoding='us-ascii') as f:
+        print(f'Final checksum: {solve_disk_defrag(f.read().strip())}') # should be 6200294120911
@@ -34,6 +34,9 @@ What is the resulting filesystem checksum?
 
 from dataclasses import dataclass
 from collections import defaultdict
+from pathlib import Path
+
+INPUT = Path(__file__).with_name('input.txt')
 
 @dataclass
 class Segment:
@@ -104,8 +107,17 @@ def test():
     assert result == 2858, f'Expected 2858, got {result}'
     print('Test passed!')
 
-test()
+# Runner hooks
+def parse(path):
+    with open(path) as f:
+        return f.read().strip()
+
+def answer(text):
+    return solve_part2(text)
+
+if __name__ == '__main__':
+    test()
 
-with open('input.txt') as f:
-    text = f.read().strip()
-    print(f'Solution: {solve_part2(text)}') # should be 6227018762750
\ No newline at end of file
+    with open(INPUT) as f:
+        text = f.read().strip()
+        print(f'Solution: {solve_part2(text)}') # should be 6227018762750
\ No newline at end of file